@@ -0,0 +1,327 @@
+"""Module containing stores for the state param of the OAuth redirect flows"""
+import asyncio
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import logging
+import secrets
+import threading
+import time
+from abc import abstractmethod
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Callable, Optional, Sequence, Type, TypeVar
+
+from fastapi import Depends
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app import settings
+from app.database import statements
+from app.database.database import get_async_db_service
+from app.database.service import AsyncDatabaseService
+from app.id_base_model.schemas import StrIDBaseModel
+from app.persistable.models import Persistable
+from app.utils import generate_auth_state
+
+P = TypeVar("P", bound=Persistable)
+
+
+class AuthStateStore:
+    """
+    Holds state params between /login and /authorization
+    A state can only be consumed once
+    """
+
+    def generate_state(self, model_type: Type[P], **claims: Any) -> str:
+        """
+        Returns a new state for the flow of model_type
+        claims are the state param's other fields, stores that keep state
+        server side ignore them here and receive them in put
+        """
+        return generate_auth_state()
+
+    @abstractmethod
+    async def put(self, state_param: StrIDBaseModel, model_type: Type[P]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def pop(self, state: str, model_type: Type[P]) -> Optional[P]:
+        """
+        Removes and returns the state param, None if unknown or expired
+        """
+        raise NotImplementedError
+
+
+class ExpiringDict:
+    """
+    Bounded dict whose entries expire after ttl
+    Every entry has the same ttl so insertion order is expiry order and
+    expired entries are dropped from the front on each add
+    """
+
+    def __init__(
+        self, ttl: float, max_size: int, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        self.clock = clock
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, key: Any, value: Any) -> bool:
+        """
+        Adds an entry unless an unexpired one exists, returns whether it was added
+        Once full the oldest entries are evicted
+        """
+        now = self.clock()
+        with self._lock:
+            while self._entries:
+                expires_at, _ = next(iter(self._entries.values()))
+                if expires_at > now:
+                    break
+                self._entries.popitem(last=False)
+            if key in self._entries:
+                return False
+            self._entries[key] = (now + self.ttl, value)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return True
+
+    def pop(self, key: Any) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        if entry is None or entry[0] <= self.clock():
+            return None
+        return entry[1]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class InMemoryAuthStateStore(AuthStateStore):
+    """
+    Process local store for single node deployments, states expire after ttl
+    """
+
+    def __init__(
+        self,
+        ttl: float = 600,
+        max_size: int = 10000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._states = ExpiringDict(ttl=ttl, max_size=max_size, clock=clock)
+
+    async def put(self, state_param: StrIDBaseModel, model_type: Type[P]) -> None:
+        self._states.add((model_type, state_param.id), jsonable_encoder(state_param))
+
+    async def pop(self, state: str, model_type: Type[P]) -> Optional[P]:
+        fields = self._states.pop((model_type, state))
+        if fields is None:
+            return None
+        return model_type(**fields)
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+
+class DatabaseAuthStateStore(AuthStateStore):
+    """
+    Store backed by the auth state tables, works across nodes
+    Rows older than ttl are rejected here and deleted by AuthStateSweeper
+    """
+
+    def __init__(self, db_service: AsyncDatabaseService, ttl: float = 600) -> None:
+        self.db_service = db_service
+        self.ttl = ttl
+
+    async def put(self, state_param: StrIDBaseModel, model_type: Type[P]) -> None:
+        await self.db_service.create(state_param, model_type)
+
+    async def pop(self, state: str, model_type: Type[P]) -> Optional[P]:
+        state_param = await self.db_service.get(id=state, model_type=model_type)
+        if state_param is None:
+            return None
+        await self.db_service.delete_instance(model=state_param)
+        expires_at = state_param.created_at + timedelta(seconds=self.ttl)  # type: ignore
+        if expires_at <= datetime.now(timezone.utc):
+            return None
+        return state_param
+
+
+class AuthStateSweeper:
+    """
+    Periodically deletes state params of logins that were never completed
+    Rows are deleted in batches of batch_size, each in its own short transaction,
+    and rows locked by an in flight /authorization are skipped
+    """
+
+    def __init__(
+        self,
+        model_types: Sequence[Type[Persistable]],
+        session_factory: Callable[[], Session],
+        ttl: timedelta = timedelta(minutes=10),
+        interval: timedelta = timedelta(minutes=5),
+        batch_size: int = 1000,
+    ) -> None:
+        self.model_types = model_types
+        self.session_factory = session_factory
+        self.ttl = ttl
+        self.interval = interval
+        self.batch_size = batch_size
+
+    async def run_forever(self) -> None:
+        while True:
+            try:
+                await run_in_threadpool(self.run_once)
+            except Exception:
+                logging.exception("Sweeping expired auth state failed")
+            await asyncio.sleep(self.interval.total_seconds())
+
+    def run_once(self) -> dict[str, int]:
+        """
+        Deletes every expired state param, returns rows reclaimed per table
+        """
+        cutoff = datetime.now(timezone.utc) - self.ttl
+        reclaimed = {}
+        session = self.session_factory()
+        try:
+            for model_type in self.model_types:
+                reclaimed[model_type.__tablename__] = self._sweep(
+                    session, model_type, cutoff
+                )
+        finally:
+            session.close()
+        logging.info(f"Reclaimed expired auth state rows: {reclaimed}")
+        return reclaimed
+
+    def _sweep(
+        self, session: Session, model_type: Type[Persistable], cutoff: datetime
+    ) -> int:
+        primary_key = statements.get_primary_key(model_type)
+        expired = (
+            select(primary_key)
+            .where(model_type.created_at < cutoff)  # type: ignore
+            .limit(self.batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        statement = delete(model_type).where(primary_key.in_(expired))
+        total = 0
+        while True:
+            result = session.execute(
+                statement, execution_options={"synchronize_session": False}
+            )
+            session.commit()
+            total += result.rowcount
+            if result.rowcount < self.batch_size:
+                return total
+
+
+class SignedAuthStateStore(AuthStateStore):
+    """
+    Stateless store, the state is an HMAC signed and time stamped token that
+    carries the state param's fields, so nothing is written on /login and
+    /authorization only verifies the signature
+
+    Replay protection comes from a bounded cache of consumed nonces kept for
+    the token's lifetime. The cache is per process, so with several nodes a
+    token could be replayed once per node within the ttl
+    """
+
+    def __init__(
+        self,
+        secret: str,
+        ttl: float = 600,
+        max_nonces: int = 10000,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if not secret:
+            raise ValueError("Signed auth state requires AUTH_STATE_SECRET")
+        self.secret = secret.encode()
+        self.ttl = ttl
+        self.clock = clock
+        self._used_nonces = ExpiringDict(ttl=ttl, max_size=max_nonces, clock=clock)
+
+    def generate_state(self, model_type: Type[P], **claims: Any) -> str:
+        payload = {
+            **claims,
+            "scope": model_type.__tablename__,
+            "nonce": secrets.token_urlsafe(12),
+            "issued_at": int(self.clock()),
+        }
+        body = _b64encode(json.dumps(payload, separators=(",", ":")).encode())
+        return f"{body}.{self._sign(body)}"
+
+    async def put(self, state_param: StrIDBaseModel, model_type: Type[P]) -> None:
+        return None
+
+    async def pop(self, state: str, model_type: Type[P]) -> Optional[P]:
+        payload = self._verify(state)
+        if payload is None or payload.pop("scope", None) != model_type.__tablename__:
+            return None
+        issued_at = payload.pop("issued_at", None)
+        if not isinstance(issued_at, int) or issued_at + self.ttl <= self.clock():
+            return None
+        nonce = payload.pop("nonce", None)
+        # a nonce that was already consumed means the state is being replayed
+        if not isinstance(nonce, str) or not self._used_nonces.add(nonce, None):
+            return None
+        return model_type(id=state, **payload)
+
+    def _sign(self, body: str) -> str:
+        digest = hmac.new(self.secret, body.encode(), hashlib.sha256).digest()
+        return _b64encode(digest)
+
+    def _verify(self, state: str) -> Optional[dict]:
+        body, _, signature = state.partition(".")
+        if not hmac.compare_digest(signature, self._sign(body)):
+            return None
+        try:
+            payload = json.loads(_b64decode(body))
+        except (binascii.Error, ValueError):
+            return None
+        return payload if isinstance(payload, dict) else None
+
+
+def _b64encode(value: bytes) -> str:
+    return base64.urlsafe_b64encode(value).decode().rstrip("=")
+
+
+def _b64decode(value: str) -> bytes:
+    return base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+
+
+@lru_cache
+def get_in_memory_auth_state_store() -> InMemoryAuthStateStore:
+    return InMemoryAuthStateStore(ttl=settings.ENV_VARS.AUTH_STATE_TTL_SECONDS)
+
+
+@lru_cache
+def get_signed_auth_state_store() -> SignedAuthStateStore:
+    return SignedAuthStateStore(
+        secret=settings.ENV_VARS.AUTH_STATE_SECRET,
+        ttl=settings.ENV_VARS.AUTH_STATE_TTL_SECONDS,
+    )
+
+
+def get_auth_state_store(
+    db_service: AsyncDatabaseService = Depends(get_async_db_service),
+) -> AuthStateStore:
+    """
+    Returns the auth state store configured in settings
+    """
+    backend = settings.ENV_VARS.AUTH_STATE_STORE
+    if backend == "memory":
+        return get_in_memory_auth_state_store()
+    if backend == "signed":
+        return get_signed_auth_state_store()
+    if backend == "database":
+        return DatabaseAuthStateStore(
+            db_service, ttl=settings.ENV_VARS.AUTH_STATE_TTL_SECONDS
+        )
+    raise ValueError(f"Unknown auth state store: {backend}")
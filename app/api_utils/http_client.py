@@ -0,0 +1,211 @@
+"""Module containing the shared, connection pooled HTTP client for 3rd party APIs"""
+import asyncio
+from functools import lru_cache
+from typing import Any, AsyncContextManager, Optional
+from weakref import WeakKeyDictionary
+
+import httpx
+import requests
+from requests import Response
+from requests.adapters import HTTPAdapter
+
+from app import settings
+from app.api_utils.schemas import HTTPPoolStats
+
+
+class HTTPClient:
+    """
+    Keep-alive HTTP client holding one connection pool per host
+    Connections are reused across requests instead of paying for a new TCP+TLS
+    handshake on every call
+    """
+
+    session: requests.Session
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        connect_timeout: float = 3.05,
+        read_timeout: float = 10.0,
+    ) -> None:
+        self.timeout = (connect_timeout, read_timeout)
+        self.adapter = HTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize
+        )
+        self.session = requests.Session()
+        self.session.mount("https://", self.adapter)
+        self.session.mount("http://", self.adapter)
+
+    def request(self, method: str, url: str, **kwargs: Any) -> Response:
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session.request(method, url, **kwargs)
+
+    def stats(self) -> list[HTTPPoolStats]:
+        """
+        Returns request and connection counters for each host pool
+        """
+        pools = self.adapter.poolmanager.pools
+        return [
+            HTTPPoolStats(
+                host=pools[key].host,
+                port=pools[key].port,
+                requests=pools[key].num_requests,
+                connections=pools[key].num_connections,
+            )
+            for key in pools.keys()
+        ]
+
+    def close(self) -> None:
+        self.session.close()
+
+
+@lru_cache
+def get_http_client() -> HTTPClient:
+    """
+    Returns the process wide sync HTTP client configured in settings
+    Only the Auth0 JWKS fetches use it, they run in threads outside the event loop
+    and only ever talk to the configured Auth0 domain
+    """
+    return HTTPClient(
+        pool_connections=1,
+        pool_maxsize=settings.ENV_VARS.JWKS_HTTP_POOL_MAXSIZE,
+        connect_timeout=settings.ENV_VARS.HTTP_CONNECT_TIMEOUT,
+        read_timeout=settings.ENV_VARS.HTTP_READ_TIMEOUT,
+    )
+
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+class _CountingTransport(httpx.AsyncBaseTransport):
+    """
+    Wraps a transport counting requests and new connections for each host
+    New connections are seen through the trace extension of httpcore
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        self.transport = transport
+        # (host, port): [requests, connections]
+        self.counters: dict[tuple[str, Optional[int]], list[int]] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        port = request.url.port or DEFAULT_PORTS.get(request.url.scheme)
+        counters = self.counters.setdefault((request.url.host, port), [0, 0])
+        counters[0] += 1
+        trace = request.extensions.get("trace")
+
+        async def count_connections(event_name: str, info: dict) -> None:
+            if event_name.endswith("connect_tcp.complete"):
+                counters[1] += 1
+            if trace is not None:
+                await trace(event_name, info)
+
+        request.extensions["trace"] = count_connections
+        return await self.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class AsyncHTTPClient:
+    """
+    asyncio counterpart of HTTPClient backed by a pooled httpx.AsyncClient
+    An httpx.AsyncClient is bound to the event loop it is first used on
+    """
+
+    client: httpx.AsyncClient
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        connect_timeout: float = 3.05,
+        read_timeout: float = 10.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        if transport is None:
+            transport = httpx.AsyncHTTPTransport(
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                )
+            )
+        self.transport = _CountingTransport(transport)
+        self.client = httpx.AsyncClient(
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+            transport=self.transport,
+        )
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.client.request(method, url, **kwargs)
+
+    def stream(
+        self, method: str, url: str, **kwargs: Any
+    ) -> AsyncContextManager[httpx.Response]:
+        """
+        Sends a request whose response body is read incrementally
+        """
+        return self.client.stream(method, url, **kwargs)
+
+    def stats(self) -> list[HTTPPoolStats]:
+        """
+        Returns request and connection counters for each host
+        """
+        return [
+            HTTPPoolStats(
+                client="httpx",
+                host=host,
+                port=port,
+                requests=requests,
+                connections=connections,
+            )
+            for (host, port), (requests, connections) in list(
+                self.transport.counters.items()
+            )
+        ]
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+
+_ASYNC_HTTP_CLIENTS: "WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncHTTPClient]" = (
+    WeakKeyDictionary()
+)
+
+
+def get_async_http_client() -> AsyncHTTPClient:
+    """
+    Returns the async HTTP client for the running event loop configured in settings
+    """
+    loop = asyncio.get_running_loop()
+    client = _ASYNC_HTTP_CLIENTS.get(loop)
+    if client is None:
+        client = AsyncHTTPClient(
+            max_connections=settings.ENV_VARS.HTTP_ASYNC_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.ENV_VARS.HTTP_ASYNC_MAX_KEEPALIVE_CONNECTIONS,
+            connect_timeout=settings.ENV_VARS.HTTP_CONNECT_TIMEOUT,
+            read_timeout=settings.ENV_VARS.HTTP_READ_TIMEOUT,
+        )
+        _ASYNC_HTTP_CLIENTS[loop] = client
+    return client
+
+
+def get_async_http_client_stats() -> list[HTTPPoolStats]:
+    """
+    Returns the counters of the async HTTP clients of every event loop
+    """
+    return [
+        stats
+        for client in list(_ASYNC_HTTP_CLIENTS.values())
+        for stats in client.stats()
+    ]
+
+
+async def close_async_http_client() -> None:
+    """
+    Closes the async HTTP client for the running event loop if one was created
+    """
+    client = _ASYNC_HTTP_CLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
@@ -45,3 +45,17 @@ class APITokenRequest(CustomBaseModel):
             return RequestGrantType.REFRESH_TOKEN
         if values.get("code"):
             return RequestGrantType.AUTHORIZATION_CODE
+
+
+class HTTPPoolStats(CustomBaseModel):
+    # requests for the sync HTTPClient, httpx for the AsyncHTTPClient
+    client: str = "requests"
+    host: str
+    port: Optional[int]
+    requests: int
+    connections: int
+    reused: int = 0
+
+    @validator("reused", always=True)
+    def validate_reused(cls, v, values):
+        return values.get("requests", 0) - values.get("connections", 0)
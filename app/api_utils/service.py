@@ -1,38 +1,52 @@
 import logging
 from abc import abstractmethod
-from typing import Optional, Type, TypeVar
+from datetime import timedelta
+from typing import AsyncGenerator, Optional, Type, TypeVar
 
+import httpx
 from fastapi import HTTPException
-from requests import Response
 
+from app.api_utils.auth_state import AuthStateStore
+from app.api_utils.http_client import get_async_http_client
 from app.api_utils.schemas import APIUserInfo
+from app.api_utils.token_manager import TokenManager
 from app.database.service import DatabaseService
 from app.persistable.models import Persistable
 
 P = TypeVar("P", bound=Persistable)
 
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class AsyncAPIService:
+    """
+    Base of the 3rd party API clients, requests go through the shared httpx client
+    Refreshed tokens are persisted with a sync Session on the threadpool
+    """
 
-class APIService:
     user_info: APIUserInfo
     db_service: DatabaseService
+    token_manager: TokenManager
 
     def __init__(self, user_info: APIUserInfo, db_service: DatabaseService) -> None:
         self.user_info = user_info
         self.db_service = db_service
 
     @abstractmethod
-    def check_auth(self):
+    async def check_auth(self, expiry_margin: Optional[timedelta] = None):
         raise NotImplementedError
 
     @staticmethod
-    def _execute(
-        func,
+    async def _execute(
+        method: str,
         url: str,
         params: Optional[dict] = None,
         data: Optional[dict] = None,
         headers: Optional[dict] = None,
-    ) -> Response:
-        response: Response = func(url, headers=headers, params=params, data=data)
+    ) -> httpx.Response:
+        response = await get_async_http_client().request(
+            method, url, headers=headers, params=params, data=data
+        )
         logging.debug(
             f"Request: {url}\n  Params: {params}\n  Data: {data}\n  Headers: {headers}\nResponse: {response}"
         )
@@ -40,28 +54,49 @@ class APIService:
         return response
 
     @staticmethod
-    def authorize_redirect_state(
-        state: str, model_type: Type[P], db_service: DatabaseService
+    async def authorize_redirect_state(
+        state: str, model_type: Type[P], store: AuthStateStore
     ) -> P:
-        auth_state_param = db_service.get(id=state, model_type=model_type)
+        auth_state_param = await store.pop(state, model_type)
         if auth_state_param is None:
             raise HTTPException(status_code=403, detail="Access Denied")
-        db_service.delete_instance(model=auth_state_param)
         return auth_state_param
 
-    def _execute_with_auth(
+    async def _execute_with_auth(
         self,
-        func,
+        method: str,
         url: str,
         params: Optional[dict] = None,
         data: Optional[dict] = None,
         headers: Optional[dict] = None,
-    ) -> Response:
-        self.check_auth()
+    ) -> httpx.Response:
+        await self.check_auth()
         if headers and not headers.get("Authorization"):
             headers["Authorization"] = f"Bearer {self.user_info.access_token}"
         else:
             headers = {"Authorization": f"Bearer {self.user_info.access_token}"}
-        return self._execute(
-            func=func, url=url, params=params, data=data, headers=headers
+        return await self._execute(
+            method=method, url=url, params=params, data=data, headers=headers
         )
+
+    async def _stream_with_auth(
+        self,
+        method: str,
+        url: str,
+        params: Optional[dict] = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> AsyncGenerator[bytes, None]:
+        """
+        Yields the response body in chunks instead of loading it into memory
+        """
+        await self.check_auth()
+        headers = {"Authorization": f"Bearer {self.user_info.access_token}"}
+        async with get_async_http_client().stream(
+            method, url, headers=headers, params=params
+        ) as response:
+            logging.debug(
+                f"Streaming request: {url}\n  Params: {params}\nResponse: {response}"
+            )
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes(chunk_size=chunk_size):
+                yield chunk
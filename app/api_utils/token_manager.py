@@ -0,0 +1,205 @@
+"""Module responsible for keeping 3rd party OAuth tokens fresh"""
+import asyncio
+import logging
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Generic,
+    Optional,
+    Protocol,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.persistable.models import Persistable
+
+T = TypeVar("T")
+
+
+class UserInfo(Protocol):
+    """
+    APIUserInfo schema that also carries the id of its row
+    """
+
+    access_token: str
+    refresh_token: str
+    expires_at: datetime
+
+    @property
+    def id(self) -> Union[int, str]:
+        ...
+
+    def dict(self, *, include: Any = None) -> dict:
+        ...
+
+    @classmethod
+    def from_orm(cls: Type[T], obj: Any) -> T:
+        ...
+
+
+S = TypeVar("S", bound=UserInfo)
+
+
+class TokenManager(Generic[S]):
+    """
+    Caches valid tokens in memory and refreshes expired ones exactly once
+
+    Concurrent coroutines for the same user share a single refresh (single-flight)
+    Across workers the user info row is locked with SELECT ... FOR UPDATE and the
+    write is a compare-and-swap on the old access token, so a worker that lost
+    the race picks up the token written by the winner instead of refreshing again
+    """
+
+    TOKEN_COLUMNS = ("access_token", "refresh_token", "expires_at")
+
+    def __init__(
+        self,
+        model_type: Type[Persistable],
+        schema_type: Type[S],
+        expiry_margin: timedelta = timedelta(seconds=60),
+        maxsize: int = 1024,
+    ) -> None:
+        self.model_type = model_type
+        self.schema_type = schema_type
+        self.expiry_margin = expiry_margin
+        self.maxsize = maxsize
+        self.refresh_count = 0
+        # least recently used user first
+        self._cache: OrderedDict = OrderedDict()
+        # refresh tasks are removed from here once they finish
+        self._in_flight: dict = {}
+
+    def is_valid(self, user_info: S, expiry_margin: Optional[timedelta] = None) -> bool:
+        expires_at = user_info.expires_at
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        if expiry_margin is None:
+            expiry_margin = self.expiry_margin
+        return expires_at > datetime.now(timezone.utc) + expiry_margin
+
+    def get_cached(
+        self, user_info: S, expiry_margin: Optional[timedelta] = None
+    ) -> Optional[S]:
+        """
+        Returns a valid token for the user from memory if there is one
+        """
+        if self.is_valid(user_info, expiry_margin):
+            self._store(user_info)
+            return user_info
+        cached = self._cache.get(user_info.id)
+        if cached is not None and self.is_valid(cached, expiry_margin):
+            self._cache.move_to_end(user_info.id)
+            return cached
+        return None
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def _store(self, user_info: S) -> None:
+        self._cache[user_info.id] = user_info
+        self._cache.move_to_end(user_info.id)
+        while len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+
+    async def aensure_valid(
+        self,
+        user_info: S,
+        refresh: Callable[[S], Awaitable[S]],
+        bind: Union[Engine, Connection],
+        expiry_margin: Optional[timedelta] = None,
+    ) -> S:
+        """
+        Returns a valid token for the user, refreshing and persisting it if needed
+        expiry_margin refreshes tokens that are still valid but expire soon
+        Coroutines waiting on the same user in an event loop share one refresh task
+        """
+        cached = self.get_cached(user_info, expiry_margin)
+        if cached is not None:
+            return cached
+
+        loop = asyncio.get_running_loop()
+        key = (id(loop), user_info.id)
+        task = self._in_flight.get(key)
+        if task is None:
+            task = loop.create_task(
+                self._arefresh(user_info, refresh, bind, expiry_margin)
+            )
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _arefresh(
+        self,
+        user_info: S,
+        refresh: Callable[[S], Awaitable[S]],
+        bind: Union[Engine, Connection],
+        expiry_margin: Optional[timedelta],
+    ) -> S:
+        session = Session(bind=bind)
+        try:
+            current = await run_in_threadpool(self._lock_row, session, user_info)
+            if not self.is_valid(current, expiry_margin):
+                self.refresh_count += 1
+                new_user_info = await refresh(current)
+                current = await run_in_threadpool(
+                    self._write_row, session, current, new_user_info
+                )
+            await run_in_threadpool(session.commit)
+        except BaseException:
+            await run_in_threadpool(session.rollback)
+            raise
+        finally:
+            await run_in_threadpool(session.close)
+        self._store(current)
+        return current
+
+    def _lock_row(self, session: Session, user_info: S) -> S:
+        """
+        Locks the user info row and returns what is currently persisted
+        Another worker may already have refreshed the token
+        """
+        row = (
+            session.query(self.model_type)
+            .filter(self.model_type.id == user_info.id)  # type: ignore
+            .with_for_update()
+            .one_or_none()
+        )
+        if row is None:
+            return user_info
+        return self.schema_type.from_orm(row)
+
+    def _write_row(self, session: Session, current: S, new_user_info: S) -> S:
+        changed = {
+            key
+            for key in self.TOKEN_COLUMNS
+            if getattr(new_user_info, key) != getattr(current, key)
+        }
+        if not changed:
+            return new_user_info
+        # the refresh token is often handed back unchanged and isn't rewritten
+        values = jsonable_encoder(new_user_info.dict(include=changed))
+        updated = (
+            session.query(self.model_type)
+            .filter(
+                self.model_type.id == current.id,  # type: ignore
+                self.model_type.access_token == current.access_token,  # type: ignore
+            )
+            .update(values, synchronize_session=False)
+        )
+        if updated == 0:
+            row = session.get(self.model_type, current.id)
+            if row is not None:
+                logging.info(
+                    f"Token for {self.model_type.__name__} {current.id} was refreshed concurrently"
+                )
+                return self.schema_type.from_orm(row)
+        return new_user_info
@@ -0,0 +1,121 @@
+"""Module responsible for refreshing 3rd party OAuth tokens ahead of their expiry"""
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Sequence, Type
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.api_utils.service import AsyncAPIService
+from app.api_utils.token_manager import TokenManager
+from app.database.service import DatabaseService
+
+
+class TokenRefresher:
+    """
+    Periodically refreshes tokens expiring within a horizon so that the webhook
+    path almost never has to refresh a token itself
+    Refreshes go through each service's TokenManager so they stay single-flight
+    Tokens expired for longer than max_expired are left alone, their refresh
+    tokens were most likely revoked and retrying every interval would never end
+    Requests for those users still refresh on demand
+    """
+
+    def __init__(
+        self,
+        service_types: Sequence[Type[AsyncAPIService]],
+        session_factory: Callable[[], Session],
+        horizon: timedelta = timedelta(minutes=10),
+        interval: timedelta = timedelta(minutes=2),
+        batch_size: int = 100,
+        concurrency: int = 5,
+        max_expired: timedelta = timedelta(days=1),
+    ) -> None:
+        self.service_types = service_types
+        self.session_factory = session_factory
+        self.horizon = horizon
+        self.interval = interval
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.max_expired = max_expired
+
+    async def run_forever(self) -> None:
+        while True:
+            try:
+                refreshed = await self.run_once()
+                logging.info(f"Proactively refreshed {refreshed} tokens")
+            except Exception:
+                logging.exception("Proactive token refresh failed")
+            await asyncio.sleep(self.interval.total_seconds())
+
+    async def run_once(self) -> int:
+        """
+        Refreshes every token expiring within the horizon, returns how many were refreshed
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        session = self.session_factory()
+        db_service = DatabaseService(session)
+        refreshed = 0
+        try:
+            for service_type in self.service_types:
+                token_manager = service_type.token_manager
+                ids = await run_in_threadpool(
+                    self._get_expiring_ids, session, token_manager
+                )
+                for start in range(0, len(ids), self.batch_size):
+                    end = start + self.batch_size
+                    user_infos = await run_in_threadpool(
+                        self._get_user_infos, session, token_manager, ids[start:end]
+                    )
+                    results = await asyncio.gather(
+                        *[
+                            self._refresh(
+                                semaphore, service_type(user_info, db_service)
+                            )
+                            for user_info in user_infos
+                        ],
+                        return_exceptions=True,
+                    )
+                    for user_info, result in zip(user_infos, results):
+                        if isinstance(result, BaseException):
+                            logging.error(
+                                f"Failed to refresh token for {token_manager.model_type.__name__} {user_info.id}: {result}"
+                            )
+                        else:
+                            refreshed += 1
+        finally:
+            await run_in_threadpool(session.close)
+        return refreshed
+
+    async def _refresh(
+        self, semaphore: asyncio.Semaphore, service: AsyncAPIService
+    ) -> None:
+        async with semaphore:
+            await service.check_auth(expiry_margin=self.horizon)
+
+    def _get_expiring_ids(self, session: Session, token_manager: TokenManager) -> list:
+        """
+        Returns ids of user infos whose token expires within the horizon and
+        didn't expire more than max_expired ago
+        """
+        model_type = token_manager.model_type
+        now = datetime.now(timezone.utc)
+        ids = session.scalars(
+            select(model_type.id).where(
+                model_type.expires_at <= now + self.horizon,
+                model_type.expires_at > now - self.max_expired,
+            )
+        ).all()
+        session.rollback()
+        return list(ids)
+
+    def _get_user_infos(
+        self, session: Session, token_manager: TokenManager, ids: list
+    ) -> list:
+        model_type = token_manager.model_type
+        rows = session.query(model_type).filter(model_type.id.in_(ids)).all()  # type: ignore
+        user_infos = [token_manager.schema_type.from_orm(row) for row in rows]
+        session.rollback()
+        return user_infos
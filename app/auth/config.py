@@ -0,0 +1,143 @@
+"""Auth0 configuration loaded once and shared by every request"""
+import asyncio
+import logging
+import os
+import threading
+from configparser import ConfigParser
+from functools import lru_cache
+from typing import Optional
+
+from pydantic import validator
+from starlette.concurrency import run_in_threadpool
+
+from app.auth.token_cache import get_verified_token_cache
+from app.id_base_model.schemas import CustomBaseModel
+
+CONFIG_PATH = ".config"
+
+
+def parse_algorithms(value: str) -> list[str]:
+    """
+    Splits a comma separated list of algorithms such as "RS256, ES256"
+    """
+    return [algorithm.strip() for algorithm in value.split(",") if algorithm.strip()]
+
+
+class Auth0Config(CustomBaseModel):
+    DOMAIN: str
+    API_AUDIENCE: str
+    ISSUER: str
+    ALGORITHMS: list[str] = ["RS256"]
+
+    class Config:
+        frozen = True
+
+    @validator("ALGORITHMS", pre=True)
+    def validate_algorithms(cls, v):
+        if isinstance(v, str):
+            return parse_algorithms(v)
+        return v
+
+    @property
+    def jwks_url(self) -> str:
+        return f"https://{self.DOMAIN}/.well-known/jwks.json"
+
+
+def load_config(path: str = CONFIG_PATH) -> Auth0Config:
+    """
+    Reads the Auth0 config from the [AUTH0] section of the config file,
+    or from environment variables when ENV is set to anything else
+    """
+    if os.getenv("ENV", CONFIG_PATH) == CONFIG_PATH:
+        parser = ConfigParser()
+        parser.read(path)
+        if not parser.has_section("AUTH0"):
+            raise ValueError(f"{path} has no [AUTH0] section")
+        # ConfigParser lower cases option names
+        return Auth0Config.parse_obj(
+            {key.upper(): value for key, value in parser["AUTH0"].items()}
+        )
+    return Auth0Config(
+        DOMAIN=os.getenv("DOMAIN", "your.domain.com"),
+        API_AUDIENCE=os.getenv("API_AUDIENCE", "your.audience.com"),
+        ISSUER=os.getenv("ISSUER", "https://your.domain.com/"),
+        ALGORITHMS=parse_algorithms(os.getenv("ALGORITHMS", "RS256")),
+    )
+
+
+class ConfigStore:
+    """
+    Holds the current Auth0Config, requests only ever read the loaded object
+
+    reload() swaps in a freshly validated config and keeps the old one if the
+    new file is invalid, watch() reloads when the file's mtime changes
+    Tokens verified against the previous config are dropped on reload
+    """
+
+    def __init__(self, path: str = CONFIG_PATH) -> None:
+        self.path = path
+        self._config: Optional[Auth0Config] = None
+        self._mtime: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> Auth0Config:
+        config = self._config
+        if config is None:
+            with self._lock:
+                if self._config is None:
+                    self._load()
+                config = self._config
+        return config  # type: ignore
+
+    def reload(self) -> Auth0Config:
+        with self._lock:
+            self._load()
+        get_verified_token_cache().clear()
+        return self._config  # type: ignore
+
+    def reload_if_changed(self) -> bool:
+        """
+        Reloads the config if the file changed since it was last read
+        """
+        mtime = self._get_mtime()
+        if mtime is None or mtime == self._mtime:
+            return False
+        try:
+            self.reload()
+        except Exception:
+            logging.exception(f"Keeping previous Auth0 config, {self.path} is invalid")
+            self._mtime = mtime
+            return False
+        logging.info(f"Reloaded Auth0 config from {self.path}")
+        return True
+
+    async def watch(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            await run_in_threadpool(self.reload_if_changed)
+
+    def _load(self) -> None:
+        mtime = self._get_mtime()
+        self._config = load_config(self.path)
+        self._mtime = mtime
+
+    def _get_mtime(self) -> Optional[float]:
+        try:
+            return os.stat(self.path).st_mtime
+        except OSError:
+            return None
+
+
+@lru_cache
+def get_config_store() -> ConfigStore:
+    """
+    Returns the process wide Auth0 config store
+    """
+    return ConfigStore()
+
+
+def reload_config() -> Auth0Config:
+    """
+    Hook for re-reading the Auth0 config without restarting the process
+    """
+    return get_config_store().reload()
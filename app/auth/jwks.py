@@ -0,0 +1,110 @@
+"""Process wide cache of the Auth0 JSON Web Key Set"""
+import logging
+import threading
+import time
+from functools import lru_cache
+from typing import Callable, Optional
+
+import jwt
+import requests
+
+from app.api_utils.http_client import get_http_client
+
+
+def fetch_jwks(url: str) -> dict:
+    response = get_http_client().request("GET", url)
+    response.raise_for_status()
+    return response.json()
+
+
+class JWKSCache:
+    """
+    Caches signing keys so token verification does not hit the network
+
+    - keys older than ttl are still served while a background thread refetches them
+    - an unknown kid (key rotation) triggers a refetch, at most once per
+      min_refetch_interval so garbage tokens can't hammer the JWKS endpoint
+    """
+
+    def __init__(
+        self,
+        jwks_url: str,
+        ttl: float = 3600,
+        min_refetch_interval: float = 30,
+        fetch: Callable[[str], dict] = fetch_jwks,
+    ) -> None:
+        self.jwks_url = jwks_url
+        self.ttl = ttl
+        self.min_refetch_interval = min_refetch_interval
+        self.fetch = fetch
+        self._keys: dict[str, jwt.PyJWK] = {}
+        self._fetched_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._refreshing = False
+
+    def refresh(self) -> None:
+        """
+        Fetches the key set, blocking the caller
+        Failures are raised as PyJWKClientError like PyJWKClient does
+        """
+        try:
+            jwk_set = jwt.PyJWKSet.from_dict(self.fetch(self.jwks_url))
+        except (requests.RequestException, ValueError, jwt.PyJWKSetError) as error:
+            raise jwt.exceptions.PyJWKClientError(
+                f'Fetch from "{self.jwks_url}" failed: {error}'
+            ) from error
+        keys = {key.key_id: key for key in jwk_set.keys if key.key_id is not None}
+        with self._lock:
+            self._keys = keys
+            self._fetched_at = time.monotonic()
+
+    def refresh_in_background(self) -> None:
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(
+            target=self._background_refresh, name="jwks-refresh", daemon=True
+        ).start()
+
+    def _background_refresh(self) -> None:
+        try:
+            self.refresh()
+        except Exception:
+            logging.exception(f"Failed to refresh JWKS from {self.jwks_url}")
+        finally:
+            self._refreshing = False
+
+    def get_signing_key(self, kid: Optional[str]) -> jwt.PyJWK:
+        if self._fetched_at is None:
+            self.refresh()
+        elif time.monotonic() - self._fetched_at > self.ttl:
+            self.refresh_in_background()
+
+        key = self._keys.get(kid) if kid else None
+        if key is None and self._can_refetch():
+            self.refresh()
+            key = self._keys.get(kid) if kid else None
+        if key is None:
+            raise jwt.exceptions.PyJWKClientError(
+                f'Unable to find a signing key that matches: "{kid}"'
+            )
+        return key
+
+    def get_signing_key_from_jwt(self, token: str) -> jwt.PyJWK:
+        header = jwt.get_unverified_header(token)
+        return self.get_signing_key(header.get("kid"))
+
+    def _can_refetch(self) -> bool:
+        return (
+            self._fetched_at is None
+            or time.monotonic() - self._fetched_at >= self.min_refetch_interval
+        )
+
+
+@lru_cache
+def get_jwks_cache(jwks_url: str) -> JWKSCache:
+    """
+    Returns the process wide cache for a JWKS url
+    """
+    return JWKSCache(jwks_url)
@@ -0,0 +1,16 @@
+from pydantic import validator
+
+from app.id_base_model.schemas import CustomBaseModel
+
+
+class TokenCacheStats(CustomBaseModel):
+    size: int
+    maxsize: int
+    hits: int
+    misses: int
+    hit_ratio: float = 0.0
+
+    @validator("hit_ratio", always=True)
+    def validate_hit_ratio(cls, v, values):
+        lookups = values.get("hits", 0) + values.get("misses", 0)
+        return values.get("hits", 0) / lookups if lookups else 0.0
@@ -0,0 +1,82 @@
+"""Process wide cache of verified Auth0 access tokens"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, Optional
+
+from app import settings
+from app.auth.schemas import TokenCacheStats
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU of decoded token payloads keyed by a hash of the token
+    Entries live until the token's exp so repeated requests with the same
+    bearer token skip the RS256 signature check
+    """
+
+    def __init__(
+        self, maxsize: int = 1024, clock: Callable[[], float] = time.time
+    ) -> None:
+        self.maxsize = maxsize
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str) -> Optional[dict]:
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > self.clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, token: str, payload: dict) -> None:
+        """
+        Stores a verified payload, tokens without an exp are never cached
+        """
+        expires_at = payload.get("exp")
+        if not isinstance(expires_at, (int, float)) or expires_at <= self.clock():
+            return
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (expires_at, payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> TokenCacheStats:
+        with self._lock:
+            return TokenCacheStats(
+                size=len(self._entries),
+                maxsize=self.maxsize,
+                hits=self.hits,
+                misses=self.misses,
+            )
+
+
+@lru_cache
+def get_verified_token_cache() -> VerifiedTokenCache:
+    """
+    Returns the process wide verified token cache configured in settings
+    """
+    return VerifiedTokenCache(maxsize=settings.ENV_VARS.AUTH_TOKEN_CACHE_SIZE)
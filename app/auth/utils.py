@@ -1,39 +1,36 @@
 """Auth0 token verification utils.py"""
 
-import os
-from configparser import ConfigParser
-
 import jwt
 from fastapi import Depends, HTTPException
 from fastapi.security import HTTPBearer
 
-token_auth_scheme = HTTPBearer()
+from app.auth.config import Auth0Config, get_config_store
+from app.auth.jwks import get_jwks_cache
+from app.auth.token_cache import get_verified_token_cache
 
+token_auth_scheme = HTTPBearer()
 
-def get_config():
-    """Sets up configuration for the app"""
 
-    env = os.getenv("ENV", ".config")
+def get_config() -> Auth0Config:
+    """Returns the Auth0 configuration loaded for the app"""
+    return get_config_store().get()
 
-    if env == ".config":
-        config = ConfigParser()
-        config.read(".config")
-        config = config["AUTH0"]
-    else:
-        config = {
-            "DOMAIN": os.getenv("DOMAIN", "your.domain.com"),
-            "API_AUDIENCE": os.getenv("API_AUDIENCE", "your.audience.com"),
-            "ISSUER": os.getenv("ISSUER", "https://your.domain.com/"),
-            "ALGORITHMS": os.getenv("ALGORITHMS", ["RS256"]),
-        }
-    return config
 
+def verify_token(
+    token=Depends(token_auth_scheme), config: Auth0Config = Depends(get_config)
+) -> dict:
+    # HTTPBearer hands over the credentials object rather than the raw token
+    token = getattr(token, "credentials", token)
+    token_cache = get_verified_token_cache()
+    cached_payload = token_cache.get(token)
+    if cached_payload is not None:
+        return cached_payload
 
-def verify_token(token=Depends(token_auth_scheme), config=Depends(get_config)) -> dict:
     # This gets the 'kid' from the passed token
-    jwks_url = f'https://{config["DOMAIN"]}/.well-known/jwks.json'
     try:
-        signing_key = jwt.PyJWKClient(jwks_url).get_signing_key_from_jwt(token).key
+        signing_key = (
+            get_jwks_cache(config.jwks_url).get_signing_key_from_jwt(token).key
+        )
     except jwt.exceptions.PyJWKClientError as error:
         return {"status": "error", "msg": error.__str__()}
     except jwt.exceptions.DecodeError as error:
@@ -43,18 +40,19 @@ def verify_token(token=Depends(token_auth_scheme), config=Depends(get_config)) -
         payload = jwt.decode(
             token,
             signing_key,
-            algorithms=[config["ALGORITHMS"]],
-            audience=config["API_AUDIENCE"],
-            issuer=config["ISSUER"],
+            algorithms=config.ALGORITHMS,
+            audience=config.API_AUDIENCE,
+            issuer=config.ISSUER,
         )
     except Exception as e:
         return {"status": "error", "message": str(e)}
 
+    token_cache.put(token, payload)
     return payload
 
 
 def get_current_user_id(
-    token=Depends(token_auth_scheme), config=Depends(get_config)
+    token=Depends(token_auth_scheme), config: Auth0Config = Depends(get_config)
 ) -> int:
     response = verify_token(token=token, config=config)
     if response.get("status"):
@@ -1,18 +1,81 @@
 """Module containing all database setup"""
+from typing import Any
+
 from fastapi import Depends
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.database import base  # noqa
-from app.database.service import DatabaseService
-from app.persistable.models import Base
-from app.settings import ENV_VARS
+from app.database.migrations import migrate
+from app.database.pool import InstrumentedAsyncAdaptedQueuePool, InstrumentedQueuePool
+from app.database.service import AsyncDatabaseService, DatabaseService
+from app.settings import ENV_VARS, EnvironmentVariables
 
 SQLALCHEMY_DATABASE_URL = f"postgresql://{ENV_VARS.DB_USER}:{ENV_VARS.DB_PASSWORD}@{ENV_VARS.DB_HOST}:{ENV_VARS.DB_PORT}/{ENV_VARS.DB_NAME}"
+ASYNC_SQLALCHEMY_DATABASE_URL = f"postgresql+asyncpg://{ENV_VARS.DB_USER}:{ENV_VARS.DB_PASSWORD}@{ENV_VARS.DB_HOST}:{ENV_VARS.DB_PORT}/{ENV_VARS.DB_NAME}"
+
+
+def get_pool_size(env_vars: EnvironmentVariables) -> tuple[int, int]:
+    """
+    Returns pool_size and max_overflow for this process
+    In per_worker mode the DB_MAX_CONNECTIONS budget is split across workers,
+    keeping at most DB_POOL_SIZE persistent connections and the rest as overflow
+    """
+    if env_vars.DB_POOL_SIZING == "fixed":
+        return env_vars.DB_POOL_SIZE, env_vars.DB_MAX_OVERFLOW
+    if env_vars.DB_POOL_SIZING == "per_worker":
+        budget = max(env_vars.DB_MAX_CONNECTIONS // max(env_vars.DB_WORKERS, 1), 1)
+        pool_size = min(env_vars.DB_POOL_SIZE, budget)
+        return pool_size, budget - pool_size
+    raise ValueError(f"Unknown DB pool sizing: {env_vars.DB_POOL_SIZING}")
+
+
+def get_engine_pool_size(
+    env_vars: EnvironmentVariables, is_async: bool = False
+) -> tuple[int, int]:
+    """
+    Returns pool_size and max_overflow of the sync or the async engine
+    The process's connections are split between both engines, DB_ASYNC_POOL_SHARE
+    of them go to the async engine
+    """
+    pool_size, max_overflow = get_pool_size(env_vars)
+    total = pool_size + max_overflow
+    async_budget = max(round(total * env_vars.DB_ASYNC_POOL_SHARE), 1)
+    budget = async_budget if is_async else max(total - async_budget, 1)
+    engine_pool_size = max(pool_size * budget // total, 1)
+    return engine_pool_size, budget - engine_pool_size
+
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL, echo=True)
+def get_engine_options(
+    env_vars: EnvironmentVariables, is_async: bool = False
+) -> dict[str, Any]:
+    pool_size, max_overflow = get_engine_pool_size(env_vars, is_async)
+    return {
+        "echo": env_vars.DB_ECHO,
+        "poolclass": (
+            InstrumentedAsyncAdaptedQueuePool if is_async else InstrumentedQueuePool
+        ),
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": env_vars.DB_POOL_TIMEOUT_SECONDS,
+        "pool_pre_ping": env_vars.DB_POOL_PRE_PING,
+        "pool_recycle": env_vars.DB_POOL_RECYCLE_SECONDS,
+    }
+
+
+engine = create_engine(SQLALCHEMY_DATABASE_URL, **get_engine_options(ENV_VARS))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-Base.metadata.create_all(engine)
+migrate(engine)
+
+# connections are only opened once an async route uses the engine
+async_engine = create_async_engine(
+    ASYNC_SQLALCHEMY_DATABASE_URL, **get_engine_options(ENV_VARS, is_async=True)
+)
+# objects are read after commit, expiring them would need a lazy load
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False
+)
 
 
 def get_session():
@@ -28,3 +91,15 @@ def get_session():
 
 def get_db_service(session: Session = Depends(get_session)):
     return DatabaseService(session)
+
+
+async def get_async_session():
+    """
+    Helper function responsible for creating an async db session
+    """
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
+def get_async_db_service(session: AsyncSession = Depends(get_async_session)):
+    return AsyncDatabaseService(session)
@@ -0,0 +1,157 @@
+"""Module bringing an existing database up to date with the models"""
+import logging
+from contextlib import contextmanager
+from typing import Iterator
+
+from pydantic.datetime_parse import parse_datetime
+from sqlalchemy import DateTime, String, create_engine, inspect, select, text, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import NullPool
+from sqlalchemy.schema import CreateColumn
+
+from app.persistable.models import Base
+
+# pg_advisory_lock key shared by every process migrating the same database
+MIGRATION_LOCK_KEY = 7_263_115_001
+
+
+def migrate(engine: Engine) -> None:
+    """
+    Creates missing tables and applies the changes made to models of tables
+    which already exist
+    Workers starting together take turns, each one inspects the schema once it
+    holds the lock so changes made by the previous one are skipped
+    """
+    with migration_lock(engine):
+        Base.metadata.create_all(engine)
+        add_missing_columns(engine)
+        convert_string_datetime_columns(engine)
+        add_missing_indexes(engine)
+
+
+@contextmanager
+def migration_lock(engine: Engine) -> Iterator[None]:
+    """
+    Holds a Postgres advisory lock, other databases aren't shared by workers
+    The lock lives on its own connection so migrating doesn't need a second one
+    from a pool that may only have one
+    """
+    if engine.dialect.name != "postgresql":
+        yield
+        return
+    lock_engine = create_engine(engine.url, poolclass=NullPool)
+    try:
+        with lock_engine.connect() as connection:
+            connection.execute(
+                text("SELECT pg_advisory_lock(:key)"), {"key": MIGRATION_LOCK_KEY}
+            )
+            try:
+                yield
+            finally:
+                connection.execute(
+                    text("SELECT pg_advisory_unlock(:key)"),
+                    {"key": MIGRATION_LOCK_KEY},
+                )
+    finally:
+        lock_engine.dispose()
+
+
+def add_missing_columns(engine: Engine) -> list[str]:
+    """
+    Adds columns that were added to models, returns the columns added
+    """
+    inspector = inspect(engine)
+    added = []
+    with engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+                column_ddl = CreateColumn(column).compile(dialect=engine.dialect)
+                connection.execute(
+                    text(f"ALTER TABLE {table.name} ADD COLUMN {column_ddl}")
+                )
+                added.append(f"{table.name}.{column.name}")
+    if added:
+        logging.warning(f"Added columns to existing tables: {added}")
+    return added
+
+
+def add_missing_indexes(engine: Engine) -> list[str]:
+    """
+    Creates indexes declared on models that don't exist yet, returns their names
+    """
+    inspector = inspect(engine)
+    added = []
+    with engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {index["name"] for index in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name in existing:
+                    continue
+                index.create(connection)
+                added.append(index.name)
+    if added:
+        logging.warning(f"Added indexes to existing tables: {added}")
+    return added
+
+
+def convert_string_datetime_columns(engine: Engine) -> list[str]:
+    """
+    Converts columns stored as ISO strings that are now DateTime on the model
+    Postgres changes the column type in place, naive values are read as UTC
+    SQLite can't alter column types, its values are rewritten in the format the
+    DateTime type reads instead
+    Returns the columns converted
+    """
+    inspector = inspect(engine)
+    converted = []
+    with engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {
+                column["name"]: column["type"]
+                for column in inspector.get_columns(table.name)
+            }
+            for column in table.columns:
+                if not isinstance(getattr(column.type, "impl", column.type), DateTime):
+                    continue
+                if not isinstance(existing.get(column.name), String):
+                    continue
+                if engine.dialect.name == "postgresql":
+                    connection.execute(
+                        text(
+                            f"ALTER TABLE {table.name} ALTER COLUMN {column.name} "
+                            "TYPE TIMESTAMP WITH TIME ZONE USING CASE "
+                            f"WHEN {column.name} ~ '(Z|[+-][0-9]{{2}}:?[0-9]{{2}})$' "
+                            f"THEN {column.name}::timestamptz "
+                            f"ELSE {column.name}::timestamp AT TIME ZONE 'UTC' END"
+                        )
+                    )
+                elif not _rewrite_iso_values(connection, table, column):
+                    continue
+                converted.append(f"{table.name}.{column.name}")
+    if converted:
+        logging.warning(f"Converted string columns to datetimes: {converted}")
+    return converted
+
+
+def _rewrite_iso_values(connection, table, column) -> int:
+    primary_key = list(table.primary_key.columns)[0]
+    raw_column = column.cast(String)
+    rows = connection.execute(
+        select(primary_key, raw_column).where(raw_column.like("%T%"))
+    ).all()
+    for id, value in rows:
+        connection.execute(
+            update(table)
+            .where(primary_key == id)
+            .values({column.name: parse_datetime(value)})
+        )
+    return len(rows)
@@ -0,0 +1,41 @@
+"""Module containing opaque cursors for keyset pagination"""
+import base64
+import binascii
+import json
+from typing import Sequence, Type
+
+from app.database import statements
+from app.database.schemas import Page
+from app.database.service import ID, P
+
+
+def encode_cursor(after: ID) -> str:
+    payload = json.dumps({"after": after}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> ID:
+    """
+    Returns the primary key a cursor points after, raises ValueError if malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        after = json.loads(base64.urlsafe_b64decode(padded.encode()))["after"]
+    except (binascii.Error, ValueError, TypeError, KeyError) as error:
+        raise ValueError(f"Invalid cursor: {cursor}") from error
+    if not isinstance(after, (int, str)) or isinstance(after, bool):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return after
+
+
+def build_page(rows: Sequence[P], limit: int, model_type: Type[P]) -> Page:
+    """
+    Builds a page from up to limit + 1 rows, the extra row only signals that
+    another page exists
+    """
+    items = list(rows[:limit])
+    next_cursor = None
+    if len(rows) > limit and items:
+        primary_key = statements.get_primary_key(model_type)
+        next_cursor = encode_cursor(getattr(items[-1], primary_key.key))
+    return Page(items=items, next_cursor=next_cursor)
@@ -0,0 +1,66 @@
+"""Module containing the instrumented SQLAlchemy connection pool"""
+import threading
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.database.schemas import DBPoolStats
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    QueuePool that records how long callers wait to check out a connection
+    Time spent here is either an idle connection being handed over, a new
+    connection being opened or a caller blocked because the pool is exhausted
+    """
+
+    engine_type = "sync"
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self._stats_lock = threading.Lock()
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            with self._stats_lock:
+                self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - start
+            with self._stats_lock:
+                self.checkouts += 1
+                self.total_wait_seconds += waited
+                self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+    def stats(self) -> DBPoolStats:
+        with self._stats_lock:
+            return DBPoolStats(
+                engine=self.engine_type,
+                size=self.size(),
+                max_overflow=self._max_overflow,
+                checked_out=self.checkedout(),
+                overflow=max(self.overflow(), 0),
+                checkouts=self.checkouts,
+                timeouts=self.timeouts,
+                total_wait_seconds=self.total_wait_seconds,
+                max_wait_seconds=self.max_wait_seconds,
+                mean_wait_seconds=(
+                    self.total_wait_seconds / self.checkouts if self.checkouts else 0.0
+                ),
+            )
+
+
+class InstrumentedAsyncAdaptedQueuePool(InstrumentedQueuePool, AsyncAdaptedQueuePool):
+    """
+    InstrumentedQueuePool for engines created with create_async_engine
+    """
+
+    engine_type = "async"
@@ -0,0 +1,31 @@
+from typing import Generic, Optional, TypeVar
+
+from pydantic.generics import GenericModel
+
+from app.id_base_model.schemas import CustomBaseModel
+
+T = TypeVar("T")
+
+
+class DBPoolStats(CustomBaseModel):
+    # sync for engine, async for async_engine
+    engine: str = "sync"
+    size: int
+    max_overflow: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    timeouts: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+    mean_wait_seconds: float = 0.0
+
+
+class Page(GenericModel, Generic[T]):
+    """
+    One page of a keyset paginated listing
+    next_cursor is opaque and None on the last page
+    """
+
+    items: list[T]
+    next_cursor: Optional[str] = None
@@ -1,11 +1,26 @@
 """Module responsible for interacting with db via sqlalchemy"""
 import logging
-from typing import Optional, Type, TypeVar, Union
+from contextlib import asynccontextmanager, contextmanager
+from typing import (
+    Any,
+    AsyncIterator,
+    Iterator,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.interfaces import ORMOption
+from sqlalchemy.sql import ColumnElement
 
+from app.database import statements
 from app.persistable.models import Persistable
 
 # User id is defined as a string and all other ids are autoincrementing
@@ -13,6 +28,13 @@ ID = Union[str, int]
 P = TypeVar("P", bound=Persistable)
 
 
+def _log_commits_saved(writes: int) -> None:
+    if writes > 1:
+        logging.info(
+            f"DB Service committed {writes} writes in one transaction, saving {writes - 1} commits"
+        )
+
+
 class DatabaseService:
     """
     Service that interacts with the db
@@ -22,20 +44,85 @@ class DatabaseService:
 
     def __init__(self, session: Session):
         self.session = session
+        self._in_transaction = False
+        self._pending_writes = 0
+
+    @contextmanager
+    def transaction(self) -> Iterator["DatabaseService"]:
+        """
+        Groups writes into a single commit, writes made inside only flush
+        Nested calls join the outer transaction, any exception rolls back all writes
+        """
+        if self._in_transaction:
+            yield self
+            return
+        self._in_transaction = True
+        self._pending_writes = 0
+        try:
+            yield self
+            self.session.commit()
+        except BaseException:
+            self.session.rollback()
+            raise
+        finally:
+            self._in_transaction = False
+        _log_commits_saved(self._pending_writes)
 
-    def get(self, id: ID, model_type: Type[P]) -> Optional[P]:
+    def _commit(self) -> None:
+        if self._in_transaction:
+            self._pending_writes += 1
+            self.session.flush()
+        else:
+            self.session.commit()
+
+    def get(
+        self,
+        id: ID,
+        model_type: Type[P],
+        options: Sequence[ORMOption] = (),
+    ) -> Optional[P]:
         """
         Gets object from db for a given model and id
+        options are loader options (e.g. joinedload) applied when the row is loaded
         """
         logging.debug(f"DB Service getting type: {model_type} for id: {id}")
-        return self.session.query(model_type).get(id)
+        return self.session.get(model_type, id, options=options)
 
-    def all(self, model_type: Type[P], skip: int = 0, limit: int = 100) -> list[P]:
+    def query(
+        self,
+        model_type: Type[P],
+        *criteria: ColumnElement[bool],
+        options: Sequence[ORMOption] = (),
+        order_by: Sequence[ColumnElement] = (),
+        limit: Optional[int] = None,
+    ) -> list[P]:
+        """
+        Gets objects from db matching all criteria, with optional loader options
+        """
+        logging.debug(f"DB Service querying: {model_type} where {criteria}")
+        statement = select(model_type).where(*criteria).options(*options)
+        statement = statement.order_by(*order_by).limit(limit)
+        return list(self.session.scalars(statement).unique().all())
+
+    def all(
+        self,
+        model_type: Type[P],
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[ID] = None,
+        options: Sequence[ORMOption] = (),
+    ) -> list[P]:
         """
         Gets all objects from db for a given model and optional limiting
+        Objects are ordered by primary key, passing after (the last primary key
+        of the previous page) pages by keyset which unlike skip stays fast at any depth
         """
         logging.debug(f"DB Service getting all: {model_type}")
-        return self.session.query(model_type).offset(skip).limit(limit).all()
+        primary_key = statements.get_primary_key(model_type)
+        query = self.session.query(model_type).options(*options).order_by(primary_key)
+        if after is not None:
+            query = query.filter(primary_key > after)
+        return query.offset(skip).limit(limit).all()
 
     def create(self, input_schema: BaseModel, model_type: Type[P]):
         """
@@ -45,7 +132,7 @@ class DatabaseService:
 
         logging.debug(f"DB Service creating: {model_object}")
         self.session.add(model_object)
-        self.session.commit()
+        self._commit()
 
         return model_object
 
@@ -66,29 +153,62 @@ class DatabaseService:
         """
         logging.debug(f"DB Service deleting instance: {model}")
         self.session.delete(model)
-        self.session.commit()
+        self._commit()
 
         return model
 
     def update(
-        self, id: ID, input_schema: BaseModel, model_type: Type[P]
+        self,
+        id: ID,
+        input_schema: BaseModel,
+        model_type: Type[P],
+        select_first: bool = True,
     ) -> Optional[P]:
         """
         Gets object from db, merges input_schema with db object, update db object
+        Only columns that changed are written and nothing is committed if none did
+        select_first=False skips the SELECT and issues a single UPDATE ... WHERE id
         """
+        if not select_first:
+            return self._update_by_id(id, input_schema, model_type)
+
         model_object = self.get(id=id, model_type=model_type)
         if model_object is None:
             return None
 
-        updated_model_object = self._update_model_object_from_input(
-            input=input_schema, model_object=model_object
-        )
+        changes = self._get_changes(input=input_schema, model_object=model_object)
+        if not changes:
+            logging.debug(f"DB Service skipping unchanged update: {model_object}")
+            return model_object
+
+        logging.debug(f"DB Service updating {list(changes)}: {model_object}")
+        for key, val in changes.items():
+            setattr(model_object, key, val)
+        self._commit()
 
-        logging.debug(f"DB Service updating: {model_object}")
-        self.session.add(updated_model_object)
-        self.session.commit()
+        return model_object
+
+    def _update_by_id(
+        self, id: ID, input_schema: BaseModel, model_type: Type[P]
+    ) -> Optional[P]:
+        values = self._get_update_values(input_schema, model_type)
+        if not values:
+            return self.get(id=id, model_type=model_type)
+        logging.debug(f"DB Service updating {model_type} {id}: {list(values)}")
+        statement = statements.build_update(model_type, id, values)
+        if self.session.get_bind().dialect.update_returning:
+            model_object = self.session.scalars(
+                statement.returning(model_type),
+                execution_options={"populate_existing": True},
+            ).one_or_none()
+        else:
+            result = self.session.execute(statement)
+            model_object = None
+            if result.rowcount:
+                model_object = self.session.get(model_type, id, populate_existing=True)
+        self._commit()
 
-        return updated_model_object
+        return model_object
 
     def merge(self, input_schema: BaseModel, model_type: Type[P]) -> P:
         """
@@ -98,20 +218,344 @@ class DatabaseService:
 
         logging.debug(f"DB Service merging: {model_object}")
         self.session.merge(model_object)
-        self.session.commit()
+        self._commit()
+
+        return model_object
+
+    def upsert(self, input_schema: BaseModel, model_type: Type[P]) -> P:
+        """
+        Updates object if exists in db, otherwise creates db object
+        Unlike merge this is a single INSERT ... ON CONFLICT ... RETURNING on
+        Postgres and SQLite instead of a SELECT followed by a write
+        """
+        row = jsonable_encoder(input_schema)
+        dialect_name = self.session.get_bind().dialect.name
+        if not statements.supports_upsert(dialect_name):
+            model_object = self.session.merge(model_type(**row))
+        else:
+            logging.debug(f"DB Service upserting: {model_type} {row}")
+            statement = statements.build_upsert(model_type, row, dialect_name)
+            model_object = self.session.scalars(
+                statement.values(row).returning(model_type),
+                execution_options={"populate_existing": True},
+            ).one()
+        self._commit()
 
         return model_object
 
+    def bulk_create(
+        self,
+        input_schemas: Sequence[BaseModel],
+        model_type: Type[P],
+        batch_size: int = 1000,
+    ) -> int:
+        """
+        Inserts many objects with one executemany per batch, returns rows inserted
+        Objects are not loaded into the session
+        """
+        rows = [jsonable_encoder(input_schema) for input_schema in input_schemas]
+        if not rows:
+            return 0
+        logging.debug(f"DB Service bulk creating {len(rows)}: {model_type}")
+        for batch in statements.chunk(rows, batch_size):
+            self.session.execute(insert(model_type), batch)
+        self._commit()
+        return len(rows)
+
+    def bulk_upsert(
+        self,
+        input_schemas: Sequence[BaseModel],
+        model_type: Type[P],
+        batch_size: int = 1000,
+    ) -> int:
+        """
+        Inserts or updates many objects by primary key, returns rows written
+        Uses INSERT ... ON CONFLICT DO UPDATE on Postgres and SQLite, other
+        dialects fall back to merging one object at a time
+        """
+        rows = [jsonable_encoder(input_schema) for input_schema in input_schemas]
+        if not rows:
+            return 0
+        dialect_name = self.session.get_bind().dialect.name
+        logging.debug(f"DB Service bulk upserting {len(rows)}: {model_type}")
+        if statements.supports_upsert(dialect_name):
+            statement = statements.build_upsert(model_type, rows[0], dialect_name)
+            for batch in statements.chunk(rows, batch_size):
+                self.session.execute(statement, batch)
+        else:
+            for row in rows:
+                self.session.merge(model_type(**row))
+        self._commit()
+        return len(rows)
+
+    def bulk_delete(
+        self, ids: Sequence[ID], model_type: Type[P], batch_size: int = 1000
+    ) -> int:
+        """
+        Deletes many objects by id, returns rows deleted
+        """
+        if not ids:
+            return 0
+        logging.debug(f"DB Service bulk deleting {len(ids)}: {model_type}")
+        deleted = 0
+        for batch in statements.chunk(ids, batch_size):
+            result = self.session.execute(
+                statements.build_delete(model_type, batch),
+                execution_options={"synchronize_session": False},
+            )
+            deleted += result.rowcount
+        self._commit()
+        return deleted
+
     @classmethod
     def _update_model_object_from_input(cls, input: BaseModel, model_object: P) -> P:
         """
-        Converts input and model_object to dicts and updates model_object
+        Sets the input values that differ from model_object on it
+        """
+        for key, val in cls._get_changes(input, model_object).items():
+            setattr(model_object, key, val)
+
+        return model_object
+
+    @staticmethod
+    def _get_update_values(input: BaseModel, model_type: Type[P]) -> dict[str, Any]:
+        """
+        Non None input values for the mapped columns of model_type
+        """
+        column_keys = model_type.column_keys()
+        return {
+            key: val
+            for key, val in input.dict(exclude_none=True).items()
+            if key in column_keys
+        }
+
+    @classmethod
+    def _get_changes(cls, input: BaseModel, model_object: P) -> dict[str, Any]:
+        """
+        Input values that differ from what model_object currently holds
+        """
+        values = cls._get_update_values(input, type(model_object))
+        return {
+            key: val for key, val in values.items() if getattr(model_object, key) != val
+        }
+
+
+class AsyncDatabaseService:
+    """
+    asyncio variant of DatabaseService backed by an AsyncSession
+
+    Relationships are not lazy loaded under asyncio, anything needed after a
+    call has to be loaded eagerly
+    """
+
+    session: AsyncSession
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self._in_transaction = False
+        self._pending_writes = 0
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator["AsyncDatabaseService"]:
+        """
+        Groups writes into a single commit, writes made inside only flush
+        Nested calls join the outer transaction, any exception rolls back all writes
         """
-        update_dict = input.dict(exclude_none=True)
-        model_object_dict = jsonable_encoder(model_object)
+        if self._in_transaction:
+            yield self
+            return
+        self._in_transaction = True
+        self._pending_writes = 0
+        try:
+            yield self
+            await self.session.commit()
+        except BaseException:
+            await self.session.rollback()
+            raise
+        finally:
+            self._in_transaction = False
+        _log_commits_saved(self._pending_writes)
 
-        for key, val in update_dict.items():
-            if key in model_object_dict:
-                setattr(model_object, key, val)
+    async def _commit(self) -> None:
+        if self._in_transaction:
+            self._pending_writes += 1
+            await self.session.flush()
+        else:
+            await self.session.commit()
+
+    async def get(
+        self,
+        id: ID,
+        model_type: Type[P],
+        options: Sequence[ORMOption] = (),
+    ) -> Optional[P]:
+        """
+        Gets object from db for a given model and id
+        options are loader options (e.g. selectinload) applied when the row is loaded
+        """
+        logging.debug(f"DB Service getting type: {model_type} for id: {id}")
+        return await self.session.get(model_type, id, options=options)
+
+    async def query(
+        self,
+        model_type: Type[P],
+        *criteria: ColumnElement[bool],
+        options: Sequence[ORMOption] = (),
+        order_by: Sequence[ColumnElement] = (),
+        limit: Optional[int] = None,
+    ) -> list[P]:
+        """
+        Gets objects from db matching all criteria, with optional loader options
+        """
+        logging.debug(f"DB Service querying: {model_type} where {criteria}")
+        statement = select(model_type).where(*criteria).options(*options)
+        statement = statement.order_by(*order_by).limit(limit)
+        result = await self.session.scalars(statement)
+        return list(result.unique().all())
+
+    async def all(
+        self,
+        model_type: Type[P],
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[ID] = None,
+        options: Sequence[ORMOption] = (),
+    ) -> list[P]:
+        """
+        Gets all objects from db for a given model and optional limiting
+        Objects are ordered by primary key, passing after (the last primary key
+        of the previous page) pages by keyset which unlike skip stays fast at any depth
+        """
+        logging.debug(f"DB Service getting all: {model_type}")
+        primary_key = statements.get_primary_key(model_type)
+        statement = select(model_type).options(*options).order_by(primary_key)
+        if after is not None:
+            statement = statement.where(primary_key > after)
+        result = await self.session.execute(statement.offset(skip).limit(limit))
+        return list(result.scalars().all())
+
+    async def create(self, input_schema: BaseModel, model_type: Type[P]):
+        """
+        Creates object in db for a given pydantic input schema and model
+        """
+        model_object = model_type(**jsonable_encoder(input_schema))
+
+        logging.debug(f"DB Service creating: {model_object}")
+        self.session.add(model_object)
+        await self._commit()
+
+        return model_object
+
+    async def delete(self, id: ID, model_type: Type[P]) -> Optional[P]:
+        """
+        Deletes object from db for a given model and id
+        """
+        model_object = await self.get(id=id, model_type=model_type)
+        if model_object is None:
+            return None
+
+        logging.debug(f"DB Service deleting: {model_object}")
+        return await self.delete_instance(model=model_object)
+
+    async def delete_instance(self, model: P) -> P:
+        """
+        Deletes object from db
+        """
+        logging.debug(f"DB Service deleting instance: {model}")
+        await self.session.delete(model)
+        await self._commit()
+
+        return model
+
+    async def update(
+        self,
+        id: ID,
+        input_schema: BaseModel,
+        model_type: Type[P],
+        select_first: bool = True,
+    ) -> Optional[P]:
+        """
+        Gets object from db, merges input_schema with db object, update db object
+        Only columns that changed are written and nothing is committed if none did
+        select_first=False skips the SELECT and issues a single UPDATE ... WHERE id
+        """
+        if not select_first:
+            return await self._update_by_id(id, input_schema, model_type)
+
+        model_object = await self.get(id=id, model_type=model_type)
+        if model_object is None:
+            return None
+
+        changes = DatabaseService._get_changes(
+            input=input_schema, model_object=model_object
+        )
+        if not changes:
+            logging.debug(f"DB Service skipping unchanged update: {model_object}")
+            return model_object
+
+        logging.debug(f"DB Service updating {list(changes)}: {model_object}")
+        for key, val in changes.items():
+            setattr(model_object, key, val)
+        await self._commit()
+
+        return model_object
+
+    async def _update_by_id(
+        self, id: ID, input_schema: BaseModel, model_type: Type[P]
+    ) -> Optional[P]:
+        values = DatabaseService._get_update_values(input_schema, model_type)
+        if not values:
+            return await self.get(id=id, model_type=model_type)
+        logging.debug(f"DB Service updating {model_type} {id}: {list(values)}")
+        statement = statements.build_update(model_type, id, values)
+        if self.session.get_bind().dialect.update_returning:
+            model_object = (
+                await self.session.scalars(
+                    statement.returning(model_type),
+                    execution_options={"populate_existing": True},
+                )
+            ).one_or_none()
+        else:
+            result = await self.session.execute(statement)
+            model_object = None
+            if result.rowcount:
+                model_object = await self.session.get(
+                    model_type, id, populate_existing=True
+                )
+        await self._commit()
+
+        return model_object
+
+    async def merge(self, input_schema: BaseModel, model_type: Type[P]) -> P:
+        """
+        Updates object if exists in db, otherwise creates db object
+        """
+        model_object = model_type(**jsonable_encoder(input_schema))
+
+        logging.debug(f"DB Service merging: {model_object}")
+        await self.session.merge(model_object)
+        await self._commit()
+
+        return model_object
+
+    async def upsert(self, input_schema: BaseModel, model_type: Type[P]) -> P:
+        """
+        Updates object if exists in db, otherwise creates db object
+        Unlike merge this is a single INSERT ... ON CONFLICT ... RETURNING on
+        Postgres and SQLite instead of a SELECT followed by a write
+        """
+        row = jsonable_encoder(input_schema)
+        dialect_name = self.session.get_bind().dialect.name
+        if not statements.supports_upsert(dialect_name):
+            model_object = await self.session.merge(model_type(**row))
+        else:
+            logging.debug(f"DB Service upserting: {model_type} {row}")
+            statement = statements.build_upsert(model_type, row, dialect_name)
+            result = await self.session.scalars(
+                statement.values(row).returning(model_type),
+                execution_options={"populate_existing": True},
+            )
+            model_object = result.one()
+        await self._commit()
 
         return model_object
@@ -0,0 +1,61 @@
+"""Module building multi-row statements shared by the sync and async db services"""
+from typing import Any, Callable, Collection, Iterator, Sequence, Type, Union
+
+from sqlalchemy import Column, delete, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.sql.dml import Delete, Insert, Update
+
+from app.persistable.models import Persistable
+
+UPSERT_DIALECTS: dict[str, Callable[..., Union[postgresql.Insert, sqlite.Insert]]] = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def chunk(items: Sequence[Any], size: int) -> Iterator[Sequence[Any]]:
+    for start in range(0, len(items), size):
+        end = start + size
+        yield items[start:end]
+
+
+def supports_upsert(dialect_name: str) -> bool:
+    return dialect_name in UPSERT_DIALECTS
+
+
+def build_upsert(
+    model_type: Type[Persistable], columns: Collection[str], dialect_name: str
+) -> Insert:
+    """
+    Builds INSERT ... ON CONFLICT (primary key) DO UPDATE of the given columns
+    Rows are passed as parameters when executing, a list of rows is sent with
+    executemany which SQLAlchemy batches into multi-row VALUES
+    Columns not given are left untouched on conflict
+    """
+    statement: Union[postgresql.Insert, sqlite.Insert] = UPSERT_DIALECTS[dialect_name](
+        model_type
+    )
+    table = model_type.__table__  # type: ignore
+    primary_key = [column.name for column in table.primary_key.columns]
+    updates = {
+        column.name: statement.excluded[column.name]
+        for column in table.columns
+        if column.name not in primary_key and column.name in columns
+    }
+    if not updates:
+        # DO NOTHING would make RETURNING skip rows that already exist
+        updates = {name: statement.excluded[name] for name in primary_key}
+    return statement.on_conflict_do_update(index_elements=primary_key, set_=updates)
+
+
+def get_primary_key(model_type: Type[Persistable]) -> Column:
+    (primary_key,) = model_type.__table__.primary_key.columns  # type: ignore
+    return primary_key
+
+
+def build_delete(model_type: Type[Persistable], ids: Sequence[Any]) -> Delete:
+    return delete(model_type).where(get_primary_key(model_type).in_(ids))
+
+
+def build_update(model_type: Type[Persistable], id: Any, values: dict) -> Update:
+    return update(model_type).where(get_primary_key(model_type) == id).values(values)
@@ -1,7 +1,12 @@
 """Routing handler for /health"""
 from fastapi import APIRouter, Depends
 
-from app.database.database import get_db_service
+from app.api_utils.http_client import get_async_http_client_stats
+from app.api_utils.schemas import HTTPPoolStats
+from app.auth.schemas import TokenCacheStats
+from app.auth.token_cache import get_verified_token_cache
+from app.database.database import async_engine, engine, get_db_service
+from app.database.schemas import DBPoolStats
 from app.database.service import DatabaseService
 
 ROUTER = APIRouter()
@@ -13,3 +18,27 @@ def health(db_service: DatabaseService = Depends(get_db_service)):
     Endpoint for checking health of the application
     """
     return {"status": "healthy"}
+
+
+@ROUTER.get("/http", response_model=list[HTTPPoolStats])
+def http_pools():
+    """
+    Endpoint exposing connection reuse of the Strava and Spotify HTTP clients
+    """
+    return get_async_http_client_stats()
+
+
+@ROUTER.get("/auth", response_model=TokenCacheStats)
+def auth_token_cache():
+    """
+    Endpoint exposing hit/miss counters of the verified token cache
+    """
+    return get_verified_token_cache().stats()
+
+
+@ROUTER.get("/db", response_model=list[DBPoolStats])
+def db_pool():
+    """
+    Endpoint exposing checkout and wait counters of the database connection pools
+    """
+    return [engine.pool.stats(), async_engine.pool.stats()]  # type: ignore
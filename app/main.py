@@ -1,17 +1,92 @@
 """Routing for /"""
+import asyncio
 import logging
+from contextlib import asynccontextmanager
+from datetime import timedelta
 
 from fastapi import FastAPI
 
+from app.api_utils.auth_state import AuthStateSweeper
+from app.api_utils.http_client import close_async_http_client
+from app.api_utils.token_refresher import TokenRefresher
+from app.auth.config import get_config_store
+from app.database.database import SessionLocal
 from app.health import ROUTER as HEALTH_ROUTER
 from app.settings import ENV_VARS
+from app.spotify.client import AsyncSpotifyAPIService
+from app.spotify.models import SpotifyAuthStateParam
 from app.spotify.router import ROUTER as SPOTIFY_ROUTER
+from app.strava.client import AsyncStravaAPIService
+from app.strava.models import StravaAuthStateParam
+from app.strava.queue import WebhookWorkerPool, get_webhook_queue
 from app.strava.router import ROUTER as STRAVA_ROUTER
 from app.user.router import ROUTER as USERS_ROUTER
 
 logging.basicConfig(level=ENV_VARS.LOG_LEVEL)
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Starts background webhook workers when webhooks are handled via the queue,
+    the proactive token refresher and the expired auth state sweeper
+    Closes pooled HTTP connections on shutdown
+    The Auth0 config is loaded up front and watched for changes
+    """
+    config_store = get_config_store()
+    try:
+        config_store.get()
+    except Exception:
+        logging.exception("Failed to load Auth0 config, authenticated routes will fail")
+    config_watcher_task = None
+    if ENV_VARS.AUTH_CONFIG_WATCH_INTERVAL_SECONDS > 0:
+        config_watcher_task = asyncio.create_task(
+            config_store.watch(ENV_VARS.AUTH_CONFIG_WATCH_INTERVAL_SECONDS)
+        )
+    worker_pool = None
+    if ENV_VARS.STRAVA_WEBHOOK_MODE == "queue":
+        worker_pool = WebhookWorkerPool(
+            get_webhook_queue(),
+            workers=ENV_VARS.STRAVA_WEBHOOK_WORKERS,
+            max_attempts=ENV_VARS.STRAVA_WEBHOOK_MAX_ATTEMPTS,
+            retry_backoff=ENV_VARS.STRAVA_WEBHOOK_RETRY_BACKOFF_SECONDS,
+        )
+        worker_pool.start()
+    auth_state_sweeper_task = None
+    if ENV_VARS.AUTH_STATE_SWEEP_INTERVAL_SECONDS > 0:
+        auth_state_sweeper = AuthStateSweeper(
+            [StravaAuthStateParam, SpotifyAuthStateParam],
+            session_factory=SessionLocal,
+            ttl=timedelta(seconds=ENV_VARS.AUTH_STATE_TTL_SECONDS),
+            interval=timedelta(seconds=ENV_VARS.AUTH_STATE_SWEEP_INTERVAL_SECONDS),
+            batch_size=ENV_VARS.AUTH_STATE_SWEEP_BATCH_SIZE,
+        )
+        auth_state_sweeper_task = asyncio.create_task(auth_state_sweeper.run_forever())
+    token_refresher_task = None
+    if ENV_VARS.TOKEN_REFRESH_ENABLED:
+        token_refresher = TokenRefresher(
+            [AsyncStravaAPIService, AsyncSpotifyAPIService],
+            session_factory=SessionLocal,
+            horizon=timedelta(seconds=ENV_VARS.TOKEN_REFRESH_HORIZON_SECONDS),
+            interval=timedelta(seconds=ENV_VARS.TOKEN_REFRESH_INTERVAL_SECONDS),
+            batch_size=ENV_VARS.TOKEN_REFRESH_BATCH_SIZE,
+            concurrency=ENV_VARS.TOKEN_REFRESH_CONCURRENCY,
+            max_expired=timedelta(seconds=ENV_VARS.TOKEN_REFRESH_MAX_EXPIRED_SECONDS),
+        )
+        token_refresher_task = asyncio.create_task(token_refresher.run_forever())
+    yield
+    if config_watcher_task is not None:
+        config_watcher_task.cancel()
+    if auth_state_sweeper_task is not None:
+        auth_state_sweeper_task.cancel()
+    if token_refresher_task is not None:
+        token_refresher_task.cancel()
+    if worker_pool is not None:
+        worker_pool.stop(timeout=5)
+    await close_async_http_client()
+
+
+app = FastAPI(lifespan=lifespan)
 
 app.include_router(SPOTIFY_ROUTER, prefix="/spotify", tags=["spotify"])
 app.include_router(STRAVA_ROUTER, prefix="/strava", tags=["strava"])
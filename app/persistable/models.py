@@ -1,22 +1,76 @@
-from copy import deepcopy
+from typing import Any
 
 from sqlalchemy.ext.declarative import declarative_base
 
 Base = declarative_base()
 
+_NOT_LOADED = object()
+_COLUMN_KEYS: dict[type, tuple[str, ...]] = {}
+_PRIMARY_KEYS: dict[type, tuple[str, ...]] = {}
+
 
 class Persistable(Base):
     __abstract__ = True
 
-    def __eq__(self, other):
-        classes_match = isinstance(other, self.__class__)
-        self_dict, other_dict = deepcopy(self.__dict__), deepcopy(other.__dict__)
-        # ignore SQLAlchemy internal stuff
-        self_dict.pop("_sa_instance_state", None)
-        other_dict.pop("_sa_instance_state", None)
-        attrs_match = self_dict == other_dict
+    def diff(self, other: "Persistable") -> dict[str, tuple[Any, Any]]:
+        """
+        Returns {column: (self value, other value)} for mapped columns that differ
+        Only loaded values are read, so comparing never triggers a query
+        Columns that aren't loaded are reported as None
+        """
+        changed = {}
+        for key in self.column_keys():
+            value = self.__dict__.get(key, _NOT_LOADED)
+            other_value = other.__dict__.get(key, _NOT_LOADED)
+            if value != other_value:
+                changed[key] = (
+                    None if value is _NOT_LOADED else value,
+                    None if other_value is _NOT_LOADED else other_value,
+                )
+        return changed
+
+    @classmethod
+    def column_keys(cls) -> tuple[str, ...]:
+        """
+        Attribute names of the mapped columns, skipping SqlAlchemy internal state
+        """
+        keys = _COLUMN_KEYS.get(cls)
+        if keys is None:
+            mapper = cls.__mapper__  # type: ignore
+            keys = tuple(attr.key for attr in mapper.column_attrs)
+            _COLUMN_KEYS[cls] = keys
+        return keys
 
-        return classes_match and attrs_match
+    @classmethod
+    def _primary_keys(cls) -> tuple[str, ...]:
+        keys = _PRIMARY_KEYS.get(cls)
+        if keys is None:
+            mapper = cls.__mapper__  # type: ignore
+            keys = tuple(
+                mapper.get_property_by_column(column).key
+                for column in mapper.primary_key
+            )
+            _PRIMARY_KEYS[cls] = keys
+        return keys
+
+    def __eq__(self, other):
+        if not isinstance(other, self.__class__):
+            return False
+        for key in self.column_keys():
+            if self.__dict__.get(key, _NOT_LOADED) != other.__dict__.get(
+                key, _NOT_LOADED
+            ):
+                return False
+        return True
 
     def __ne__(self, other):
         return not self.__eq__(other)
+
+    def __hash__(self):
+        # equal objects always share a primary key
+        return hash(
+            (
+                self.__class__,
+                tuple(self.__dict__.get(key) for key in self._primary_keys()),
+            )
+        )
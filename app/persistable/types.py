@@ -0,0 +1,36 @@
+"""Column types shared by the SqlAlchemy models"""
+from datetime import datetime, timezone
+from typing import Optional, Union
+
+from pydantic.datetime_parse import parse_datetime
+from sqlalchemy import DateTime
+from sqlalchemy.types import TypeDecorator
+
+
+class UTCDateTime(TypeDecorator):
+    """
+    Timezone aware datetime column, values are stored and returned in UTC
+    ISO strings (what jsonable_encoder produces) are accepted on write and
+    naive values are assumed to be UTC, SQLite drops the offset on storage
+    """
+
+    impl = DateTime(timezone=True)
+    cache_ok = True
+
+    def process_bind_param(
+        self, value: Optional[Union[datetime, str]], dialect
+    ) -> Optional[datetime]:
+        if value is None:
+            return None
+        return self.to_utc(parse_datetime(value))
+
+    def process_result_value(self, value: Optional[datetime], dialect):
+        if value is None:
+            return None
+        return self.to_utc(value)
+
+    @staticmethod
+    def to_utc(value: datetime) -> datetime:
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc)
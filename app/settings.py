@@ -23,8 +23,79 @@ class EnvironmentVariables(BaseSettings):
     DB_USER: str = "postgres"
     DB_PASSWORD: str = "postgres"
 
+    # SQLAlchemy engine and connection pool
+    DB_ECHO: bool = False  # log every statement, for local debugging only
+    DB_POOL_PRE_PING: bool = True  # test connections on checkout to drop dead ones
+    DB_POOL_RECYCLE_SECONDS: int = 1800  # reopen connections older than this
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0  # how long a checkout waits on a full pool
+    # "fixed" gives every process DB_POOL_SIZE + DB_MAX_OVERFLOW connections
+    # "per_worker" splits DB_MAX_CONNECTIONS evenly across DB_WORKERS processes
+    # (e.g. uvicorn --workers) so all workers together stay under the server limit
+    DB_POOL_SIZING: str = "fixed"
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_MAX_CONNECTIONS: int = 90  # leave headroom below postgres max_connections
+    DB_WORKERS: int = 1
+    # share of each process's connections given to the async engine, the sync
+    # engine gets the rest so both together stay within the sizes above
+    # kept small because the async engine only serves the OAuth login and
+    # authorization routes, while the webhook path, TokenManager's row lock held
+    # during a refresh, the TokenRefresher (TOKEN_REFRESH_CONCURRENCY at a time),
+    # the auth state sweeper and /users all check out sync connections
+    DB_ASYNC_POOL_SHARE: float = 0.2
+
     LOG_LEVEL: str = "WARNING"
 
+    # Decoded Auth0 access tokens kept in memory until they expire
+    AUTH_TOKEN_CACHE_SIZE: int = 1024
+    AUTH_CONFIG_WATCH_INTERVAL_SECONDS: int = (
+        30  # 0 disables reloading .config on change
+    )
+
+    # Where OAuth state params live between /login and /authorization
+    # "database" works across nodes, "memory" avoids the writes on single node deployments
+    # "signed" keeps nothing server side, the state is a token signed with AUTH_STATE_SECRET
+    AUTH_STATE_STORE: str = "database"
+    AUTH_STATE_TTL_SECONDS: int = 600
+    AUTH_STATE_SECRET: str = ""
+    AUTH_STATE_SWEEP_INTERVAL_SECONDS: int = 300  # 0 disables deleting expired rows
+    AUTH_STATE_SWEEP_BATCH_SIZE: int = 1000
+
+    # Shared httpx client used for Strava and Spotify
+    HTTP_CONNECT_TIMEOUT: float = 3.05
+    HTTP_READ_TIMEOUT: float = 10.0
+    HTTP_ASYNC_MAX_CONNECTIONS: int = 200  # outbound calls in flight per event loop
+    HTTP_ASYNC_MAX_KEEPALIVE_CONNECTIONS: int = 100  # idle connections kept per loop
+    # requests client used for Auth0 JWKS fetches, which run outside the event loop
+    JWKS_HTTP_POOL_MAXSIZE: int = 4  # connections kept alive to the Auth0 domain
+
+    # Background refresh of Strava and Spotify tokens that expire within the horizon
+    TOKEN_REFRESH_ENABLED: bool = True
+    TOKEN_REFRESH_HORIZON_SECONDS: int = 600
+    TOKEN_REFRESH_INTERVAL_SECONDS: int = 120
+    TOKEN_REFRESH_BATCH_SIZE: int = 100
+    TOKEN_REFRESH_CONCURRENCY: int = 5
+    # tokens expired longer than this are only refreshed on demand
+    TOKEN_REFRESH_MAX_EXPIRED_SECONDS: int = 86400
+
+    # "inline" handles webhook events within the request, "queue" acknowledges
+    # immediately and hands the event off to background workers
+    STRAVA_WEBHOOK_MODE: str = "inline"
+    STRAVA_WEBHOOK_QUEUE_BACKEND: str = "memory"  # "memory" or "sqlite"
+    STRAVA_WEBHOOK_QUEUE_PATH: str = "strava_webhook_queue.db"
+    STRAVA_WEBHOOK_WORKERS: int = 4
+    STRAVA_WEBHOOK_MAX_ATTEMPTS: int = 3
+    # failed events wait this long before their first retry, doubling each attempt
+    STRAVA_WEBHOOK_RETRY_BACKOFF_SECONDS: float = 5.0
+    # claimed events not acked within this are handed to another worker
+    STRAVA_WEBHOOK_VISIBILITY_TIMEOUT_SECONDS: int = 300
+    # "streaming" finds the max heart rate while the activity streams download
+    # instead of loading them into memory first ("buffered")
+    STRAVA_STREAM_MODE: str = "buffered"
+    # buffered streams pick the track at the highest average heart rate over this
+    # many seconds, 0 picks the single highest sample like streaming mode does
+    STRAVA_PEAK_WINDOW_SECONDS: int = 0
+
     class Config:
         case_sensitive = True
 
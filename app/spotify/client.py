@@ -1,49 +1,54 @@
 import base64
 import logging
 from datetime import datetime, timedelta, timezone
-
-import requests
-from requests import Response
+from typing import Optional
 
 from app import settings
 from app.api_utils.schemas import RequestGrantType
-from app.api_utils.service import APIService
+from app.api_utils.service import AsyncAPIService
+from app.api_utils.token_manager import TokenManager
 from app.database.service import DatabaseService
 from app.spotify import models, schemas
 
 SPOTIFY_TOKEN_URL = "https://accounts.spotify.com/api/token"
 SPOTIFY_BASE_URL = "https://api.spotify.com/v1"
 
+TOKEN_MANAGER: TokenManager[schemas.SpotifyUserInfo] = TokenManager(
+    model_type=models.SpotifyUserInfo, schema_type=schemas.SpotifyUserInfo
+)
+
 
-class SpotifyAPIService(APIService):
+class AsyncSpotifyAPIService(AsyncAPIService):
     user_info: schemas.SpotifyUserInfo
+    token_manager = TOKEN_MANAGER
 
     def __init__(
         self, user_info: schemas.SpotifyUserInfo, db_service: DatabaseService
     ) -> None:
         super().__init__(user_info=user_info, db_service=db_service)
 
-    def check_auth(self):
-        if self.user_info.expires_at > datetime.now(timezone.utc):
-            return
-        new_auth = self.refresh_token()
-        new_user_info_data = self.user_info.dict() | new_auth.dict()
-        self.user_info = schemas.SpotifyUserInfo(**new_user_info_data)
-
-        # TODO: do we need to make sure that in memory and db are in sync?
-        self.db_service.update(
-            id=self.user_info.id,
-            input_schema=self.user_info,
-            model_type=models.SpotifyUserInfo,
+    async def check_auth(self, expiry_margin: Optional[timedelta] = None):
+        self.user_info = await TOKEN_MANAGER.aensure_valid(
+            self.user_info,
+            refresh=self._refresh_user_info,
+            bind=self.db_service.session.get_bind(),
+            expiry_margin=expiry_margin,
         )
 
-    def refresh_token(self) -> schemas.SpotifyAuth:
+    async def _refresh_user_info(
+        self, user_info: schemas.SpotifyUserInfo
+    ) -> schemas.SpotifyUserInfo:
+        self.user_info = user_info
+        new_auth = await self.refresh_token()
+        return schemas.SpotifyUserInfo(**user_info.dict() | new_auth.dict())
+
+    async def refresh_token(self) -> schemas.SpotifyAuth:
         logging.info(f"Refreshing Spotify token for user: {self.user_info.id}")
         request_body = schemas.SpotifyRefreshTokenRequest(
             refresh_token=self.user_info.refresh_token
         )
-        response = self._execute(
-            requests.post,
+        response = await self._execute(
+            "POST",
             SPOTIFY_TOKEN_URL,
             data=request_body.dict(exclude_none=True),
             headers={"Content-Type": "application/x-www-form-urlencoded"},
@@ -63,40 +68,38 @@ class SpotifyAPIService(APIService):
         return base64.b64encode(token.encode("ascii")).decode("ascii")
 
     @classmethod
-    def exchange_code(cls, code: str) -> schemas.SpotifyTokenResponse:
+    async def exchange_code(cls, code: str) -> schemas.SpotifyTokenResponse:
         request_body = schemas.SpotifyTokenRequest(
             grant_type=RequestGrantType.AUTHORIZATION_CODE,
             redirect_uri=f"{settings.ENV_VARS.HOST}/spotify/authorization",
             code=code,
         )
-        response = cls._execute(
-            requests.post,
+        response = await cls._execute(
+            "POST",
             SPOTIFY_TOKEN_URL,
             data=request_body.dict(),
             headers={"Authorization": f"Basic {cls.get_encoded_token()}"},
         )
-        # TODO: expires_at should be a function. maybe this is a property of some kind on SpotifyTokenResponse?
         expires_at = datetime.now(timezone.utc) + timedelta(
             seconds=response.json().get("expires_in")
         )
         return schemas.SpotifyTokenResponse(**response.json(), expires_at=expires_at)
 
-    # if we use this function somewhere else it will need to be refactored to have refresh token logic
     @classmethod
-    def get_user(cls, access_token: str) -> schemas.SpotifyUserResponse:
-        response = cls._execute(
-            requests.get,
+    async def get_user(cls, access_token: str) -> schemas.SpotifyUserResponse:
+        response = await cls._execute(
+            "GET",
             f"{SPOTIFY_BASE_URL}/me",
             headers={"Authorization": f"Bearer {access_token}"},
         )
         return schemas.SpotifyUserResponse(**response.json())
 
-    def get_recenty_played(
+    async def get_recenty_played(
         self, after: datetime, limit: int = 50
     ) -> schemas.SpotifyRecentlyPlayedResponse:
         after_milliseconds = int(after.timestamp() * 1000)
-        response: Response = self._execute_with_auth(
-            requests.get,
+        response = await self._execute_with_auth(
+            "GET",
             f"{SPOTIFY_BASE_URL}/me/player/recently-played",
             params=schemas.SpotifyRecentlyPlayedRequest(
                 after=after_milliseconds, limit=limit
@@ -2,27 +2,27 @@
 from fastapi import APIRouter, Depends
 from fastapi.responses import RedirectResponse
 
-from app.database.database import get_db_service
-from app.database.service import DatabaseService
+from app.api_utils.auth_state import AuthStateStore, get_auth_state_store
+from app.database.database import get_async_db_service
+from app.database.service import AsyncDatabaseService
 from app.settings import ENV_VARS
 from app.spotify import models, schemas
-from app.spotify.client import SpotifyAPIService
-from app.utils import generate_auth_state
+from app.spotify.client import AsyncSpotifyAPIService
 
 ROUTER = APIRouter()
 
 
 @ROUTER.get("/login")
-def login(
+async def login(
     user_id: int,
-    db_service: DatabaseService = Depends(get_db_service),
+    store: AuthStateStore = Depends(get_auth_state_store),
 ):
     """
     TODO: replace user id with some oauth token
     Endpoint for logging in a user
     """
-    state = generate_auth_state()
-    db_service.create(
+    state = store.generate_state(models.SpotifyAuthStateParam, user_id=user_id)
+    await store.put(
         schemas.SpotifyAuthStateParam(id=state, user_id=user_id),
         models.SpotifyAuthStateParam,
     )
@@ -32,10 +32,11 @@ def login(
 
 
 @ROUTER.get("/authorization", status_code=200)
-def authorization(
+async def authorization(
     code: str,
     state: str,
-    db_service: DatabaseService = Depends(get_db_service),
+    db_service: AsyncDatabaseService = Depends(get_async_db_service),
+    store: AuthStateStore = Depends(get_auth_state_store),
 ):
     """
     Redirect handler for when a Spotify user grants access to the application
@@ -43,18 +44,20 @@ def authorization(
         - swapping token for bearer and refresh
         - persisting relevant user information to the db
     """
-    auth_state_param = SpotifyAPIService.authorize_redirect_state(
-        state=state, model_type=models.SpotifyAuthStateParam, db_service=db_service
+    auth_state_param = await AsyncSpotifyAPIService.authorize_redirect_state(
+        state=state, model_type=models.SpotifyAuthStateParam, store=store
     )
 
-    token_response = SpotifyAPIService.exchange_code(code)
-    user_response = SpotifyAPIService.get_user(token_response.access_token)
+    token_response = await AsyncSpotifyAPIService.exchange_code(code)
+    user_response = await AsyncSpotifyAPIService.get_user(token_response.access_token)
 
     spotify_user_info = schemas.SpotifyUserInfo(
         user_id=auth_state_param.user_id,
         **token_response.dict(),
         **user_response.dict(),
     )
-    db_service.merge(input_schema=spotify_user_info, model_type=models.SpotifyUserInfo)
+    await db_service.upsert(
+        input_schema=spotify_user_info, model_type=models.SpotifyUserInfo
+    )
 
     return RedirectResponse(url=f"{ENV_VARS.FE_HOST}/spotify/{spotify_user_info.id}")
@@ -2,19 +2,19 @@ from datetime import datetime, timedelta
 from typing import Optional
 
 from app.spotify import schemas
-from app.spotify.client import SpotifyAPIService
+from app.spotify.client import AsyncSpotifyAPIService
 
 
-class SpotifyService:
-    api: SpotifyAPIService
+class AsyncSpotifyService:
+    api: AsyncSpotifyAPIService
 
-    def __init__(self, api: SpotifyAPIService) -> None:
+    def __init__(self, api: AsyncSpotifyAPIService) -> None:
         self.api = api
 
-    def get_track_for_datetime(
+    async def get_track_for_datetime(
         self, max_hr_date_time: datetime
     ) -> Optional[schemas.SpotifyTrack]:
-        user_history = self.api.get_recenty_played(
+        user_history = await self.api.get_recenty_played(
             after=max_hr_date_time - timedelta(minutes=30)  # type: ignore
         )
         return user_history.get_spotify_track_for_datetime(
@@ -1,80 +1,121 @@
 import logging
-from datetime import datetime, timezone
-from typing import List
+from datetime import timedelta
+from typing import List, Optional
 
-import requests
-from requests import Response
-
-from app.api_utils.service import APIService
+from app.api_utils.service import AsyncAPIService
+from app.api_utils.token_manager import TokenManager
 from app.database.service import DatabaseService
 from app.strava import models, schemas
+from app.strava.stream_parser import (
+    MaxHeartrateTracker,
+    StravaStreamParser,
+    StreamOrderError,
+)
 
 TOKEN_URL = "https://www.strava.com/oauth/token"
 API_PREFIX = "https://www.strava.com/api/v3"
+# streaming needs the heartrate stream before the time stream, the order requested
+STREAM_KEYS = [schemas.StravaStreamKeys.HEARTRATE, schemas.StravaStreamKeys.TIME]
+STREAM_PARAMS = {
+    "keys": ",".join(key.value for key in STREAM_KEYS),
+    "key_by_type": "true",
+}
+
+TOKEN_MANAGER: TokenManager[schemas.StravaUserInfo] = TokenManager(
+    model_type=models.StravaUserInfo, schema_type=schemas.StravaUserInfo
+)
 
 
-class StravaAPIService(APIService):
+class AsyncStravaAPIService(AsyncAPIService):
     user_info: schemas.StravaUserInfo
+    token_manager = TOKEN_MANAGER
 
     def __init__(
         self, user_info: schemas.StravaUserInfo, db_service: DatabaseService
     ) -> None:
         super().__init__(user_info=user_info, db_service=db_service)
 
-    def check_auth(self):
-        if self.user_info.expires_at > datetime.now(timezone.utc):
-            return
-
-        new_auth = self.refresh_token()
-        new_user_info_data = self.user_info.dict() | new_auth.dict()
-        self.user_info = schemas.StravaUserInfo(**new_user_info_data)
-
-        # TODO: do we need to make sure that in memory and db are in sync?
-        self.db_service.update(
-            id=self.user_info.id,
-            input_schema=self.user_info,
-            model_type=models.StravaUserInfo,
+    async def check_auth(self, expiry_margin: Optional[timedelta] = None):
+        self.user_info = await TOKEN_MANAGER.aensure_valid(
+            self.user_info,
+            refresh=self._refresh_user_info,
+            bind=self.db_service.session.get_bind(),
+            expiry_margin=expiry_margin,
         )
 
+    async def _refresh_user_info(
+        self, user_info: schemas.StravaUserInfo
+    ) -> schemas.StravaUserInfo:
+        self.user_info = user_info
+        new_auth = await self.refresh_token()
+        return schemas.StravaUserInfo(**user_info.dict() | new_auth.dict())
+
     @classmethod
-    def exchange_code(cls, code: str) -> schemas.StravaTokenResponse:
+    async def exchange_code(cls, code: str) -> schemas.StravaTokenResponse:
         params = schemas.StravaTokenRequest(code=code)
-        response: Response = cls._execute(
-            requests.post,
-            TOKEN_URL,
-            params=params.dict(),
-        )
+        response = await cls._execute("POST", TOKEN_URL, params=params.dict())
         return schemas.StravaTokenResponse(**response.json())
 
-    def refresh_token(self) -> schemas.StravaAuth:
+    async def refresh_token(self) -> schemas.StravaAuth:
         logging.info(f"Refreshing Strava token for user: {self.user_info.id}")
         params = schemas.StravaTokenRequest(refresh_token=self.user_info.refresh_token)
-        response = self._execute(requests.post, TOKEN_URL, params=params.dict())
+        response = await self._execute("POST", TOKEN_URL, params=params.dict())
         return schemas.StravaAuth(**response.json())
 
-    def get_activity(self, id: int) -> schemas.StravaActivity:
-        response = self._execute_with_auth(
-            requests.get, f"{API_PREFIX}/activities/{id}"
-        )
+    async def get_activity(self, id: int) -> schemas.StravaActivity:
+        response = await self._execute_with_auth("GET", f"{API_PREFIX}/activities/{id}")
         return schemas.StravaActivity(**response.json())
 
-    def get_stream_for_activity(
+    async def get_stream_for_activity(
         self,
         id: int,
         stream_keys: List[schemas.StravaStreamKeys],
         key_by_type: bool = True,
     ) -> schemas.StravaActivityStream:
         stream_keys_str = ",".join([key.value for key in stream_keys])
-        response = self._execute_with_auth(
-            requests.get,
+        response = await self._execute_with_auth(
+            "GET",
             f"{API_PREFIX}/activities/{id}/streams",
             params={"keys": stream_keys_str, "key_by_type": str(key_by_type).lower()},
         )
         return schemas.StravaActivityStream(**response.json())
 
-    def update_activity(self, id: int, data: dict):
-        self._execute_with_auth(
-            requests.put,
+    async def get_max_heartrate_time_mark_for_activity(
+        self, id: int
+    ) -> Optional[timedelta]:
+        """
+        Streaming variant of get_stream_for_activity(...).get_max_heartrate_time_mark()
+        The max heart rate is tracked while the response downloads
+        Streams sent time first are downloaded again and buffered
+        """
+        parser = StravaStreamParser(STREAM_KEYS)
+        tracker = MaxHeartrateTracker()
+        chunks = self._stream_with_auth(
+            "GET",
+            f"{API_PREFIX}/activities/{id}/streams",
+            params=STREAM_PARAMS,
+        )
+        try:
+            async for chunk in chunks:
+                for key, values in parser.feed(chunk):
+                    tracker.add(key, values)
+            for key, values in parser.close():
+                tracker.add(key, values)
+        except StreamOrderError:
+            logging.info(f"Buffering out of order streams for activity: {id}")
+        else:
+            return tracker.get_max_heartrate_time_mark()
+        finally:
+            # an abandoned async generator keeps the response open until gc
+            await chunks.aclose()
+        activity_stream = await self.get_stream_for_activity(
+            id=id, stream_keys=STREAM_KEYS
+        )
+        return activity_stream.get_max_heartrate_time_mark()
+
+    async def update_activity(self, id: int, data: dict):
+        await self._execute_with_auth(
+            "PUT",
             f"{API_PREFIX}/activities/{id}",
             data=data,
         )
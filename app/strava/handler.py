@@ -1,63 +1,136 @@
+import asyncio
 import logging
-from typing import Optional
+import time
+from datetime import timedelta
+from typing import Awaitable, Optional, TypeVar
 
 from fastapi import HTTPException
+from starlette.concurrency import run_in_threadpool
 
 from app.database.service import DatabaseService
+from app.spotify.client import AsyncSpotifyAPIService
 from app.spotify.schemas import SpotifyTrack, SpotifyUserInfo
-from app.spotify.service import SpotifyAPIService, SpotifyService
+from app.spotify.service import AsyncSpotifyService
 from app.strava import schemas
-from app.strava.client import StravaAPIService
-from app.strava.service import StravaService
-from app.user.models import User
+from app.strava.client import AsyncStravaAPIService
+from app.strava.service import AsyncStravaService
+from app.user.service import UserService
+
+T = TypeVar("T")
 
 
 class StravaWebhookHandler:
+    """
+    Handles Strava webhook events
+
+    Activity creation is run as a small dependency graph:
+        user -> strava auth -> activity + stream -> max hr -> recently played -> update
+                spotify auth ----------------------------------^
+    Independent calls are issued concurrently and every stage is timed
+    """
+
     event: schemas.StravaWebhookInput
     db_service: DatabaseService
+    timings: dict[str, float]
 
     def __init__(
         self, event: schemas.StravaWebhookInput, db_service: DatabaseService
     ) -> None:
         self.event = event
         self.db_service = db_service
+        self.timings = {}
 
-    def handle(self) -> Optional[SpotifyTrack]:
-        if self.event.object_type != schemas.StravaObjectType.ACTIVITY:
-            return None
-        if self.event.aspect_type == schemas.StravaAspectType.CREATE:
-            return self._handle_activity_create()
-        return None
+    async def handle(self) -> schemas.StravaWebhookResult:
+        start = time.perf_counter()
+        track = None
+        if (
+            self.event.object_type == schemas.StravaObjectType.ACTIVITY
+            and self.event.aspect_type == schemas.StravaAspectType.CREATE
+        ):
+            track = await self._handle_activity_create()
+        self.timings["total"] = time.perf_counter() - start
+        return schemas.StravaWebhookResult(track=track, timings=self.timings)
 
-    def _handle_activity_create(self) -> Optional[SpotifyTrack]:
-        # get user
-        user = self.db_service.get(id=self.event.owner_id, model_type=User)
+    async def _timed(self, stage: str, awaitable: Awaitable[T]) -> T:
+        start = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            self.timings[stage] = time.perf_counter() - start
+
+    def _get_user_infos(self) -> tuple[schemas.StravaUserInfo, SpotifyUserInfo]:
+        user = UserService(self.db_service).get_with_credentials(self.event.owner_id)
         if user is None:
             raise HTTPException(status_code=404, detail="User not found")
+        return (
+            schemas.StravaUserInfo.from_orm(user.strava_user_info),
+            SpotifyUserInfo.from_orm(user.spotify_user_info),
+        )
+
+    async def _handle_activity_create(self) -> Optional[SpotifyTrack]:
+        # get user
+        strava_user_info, spotify_user_info = await self._timed(
+            "user", run_in_threadpool(self._get_user_infos)
+        )
 
         # setup services
-        strava_api_service = StravaAPIService(
-            schemas.StravaUserInfo.from_orm(user.strava_user_info),
-            db_service=self.db_service,
+        strava_service = AsyncStravaService(
+            api=AsyncStravaAPIService(strava_user_info, db_service=self.db_service)
+        )
+        spotify_service = AsyncSpotifyService(
+            api=AsyncSpotifyAPIService(
+                user_info=spotify_user_info, db_service=self.db_service
+            )
+        )
+
+        # refresh tokens up front so concurrent calls below don't each refresh
+        strava_auth = asyncio.ensure_future(
+            self._timed("strava_auth", strava_service.api.check_auth())
         )
-        strava_service = StravaService(api=strava_api_service)
-        spotify_api_service = SpotifyAPIService(
-            user_info=SpotifyUserInfo.from_orm(user.spotify_user_info),
-            db_service=self.db_service,
+        spotify_auth = asyncio.ensure_future(
+            self._timed("spotify_auth", spotify_service.api.check_auth())
         )
-        spotify_service = SpotifyService(api=spotify_api_service)
 
-        # get activity and max hr
-        activity = strava_service.api.get_activity(self.event.object_id)
-        max_hr_date_time = strava_service.get_max_hr_date_time_for_activity(activity)
+        async def get_activity() -> schemas.StravaActivity:
+            await strava_auth
+            return await self._timed(
+                "activity", strava_service.api.get_activity(self.event.object_id)
+            )
+
+        async def get_max_hr_time_mark() -> Optional[timedelta]:
+            await strava_auth
+            return await self._timed(
+                "stream", strava_service.get_max_hr_time_mark(self.event.object_id)
+            )
+
+        # get activity and max hr, a failure cancels whatever is still running
+        activity_task = asyncio.ensure_future(get_activity())
+        stream_task = asyncio.ensure_future(get_max_hr_time_mark())
+        try:
+            activity, max_hr_time_mark = await asyncio.gather(
+                activity_task, stream_task
+            )
+        except BaseException:
+            for task in (activity_task, stream_task, spotify_auth):
+                task.cancel()
+            raise
+        max_hr_date_time = (
+            activity.start_date + max_hr_time_mark
+            if max_hr_time_mark is not None
+            else None
+        )
         if max_hr_date_time is None:
             logging.info(
                 f"Could not find a max heart rate for the following activity: {activity.json()}"
             )
 
         # get track if hr data exists
+        await spotify_auth
         track = (
-            spotify_service.get_track_for_datetime(max_hr_date_time)
+            await self._timed(
+                "recently_played",
+                spotify_service.get_track_for_datetime(max_hr_date_time),
+            )
             if max_hr_date_time
             else None
         )
@@ -67,6 +140,9 @@ class StravaWebhookHandler:
             )
 
         # update activity
-        strava_service.update_activity_with_track(activity, track)
+        await self._timed(
+            "update_activity",
+            strava_service.update_activity_with_track(activity, track),
+        )
 
         return track
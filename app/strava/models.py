@@ -1,6 +1,7 @@
-from sqlalchemy import Column, ForeignKey, Integer, String
+from sqlalchemy import Column, ForeignKey, Integer, String, func
 
 from app.persistable.models import Persistable
+from app.persistable.types import UTCDateTime
 
 
 class StravaUserInfo(Persistable):
@@ -15,7 +16,7 @@ class StravaUserInfo(Persistable):
     user_id = Column(Integer, ForeignKey("users.id"))
     access_token = Column(String)
     refresh_token = Column(String)
-    expires_at = Column(String)
+    expires_at = Column(UTCDateTime, index=True)
 
 
 class StravaAuthStateParam(Persistable):
@@ -27,3 +28,6 @@ class StravaAuthStateParam(Persistable):
 
     # attributes
     id = Column(String, primary_key=True, index=True)
+    created_at = Column(
+        UTCDateTime, server_default=func.now(), nullable=False, index=True
+    )
@@ -0,0 +1,368 @@
+"""Module containing the queue used to defer processing of Strava webhook events"""
+import asyncio
+import heapq
+import itertools
+import logging
+import sqlite3
+import threading
+import time
+from abc import abstractmethod
+from functools import lru_cache
+from typing import Callable, Optional
+
+from sqlalchemy.orm import Session
+
+from app import settings
+from app.api_utils.http_client import close_async_http_client
+from app.database.database import SessionLocal
+from app.database.service import DatabaseService
+from app.strava import schemas
+from app.strava.handler import StravaWebhookHandler
+
+
+class WebhookQueue:
+    """
+    Queue of Strava webhook events waiting to be handled
+    """
+
+    @abstractmethod
+    def put(self, event: schemas.StravaWebhookInput) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get(self, timeout: float = 0.0) -> Optional[schemas.StravaQueuedWebhookEvent]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def ack(self, job: schemas.StravaQueuedWebhookEvent) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def retry(self, job: schemas.StravaQueuedWebhookEvent, delay: float = 0.0) -> None:
+        """
+        Hands the event out again once delay seconds have passed
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def fail(self, job: schemas.StravaQueuedWebhookEvent) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+
+class InMemoryWebhookQueue(WebhookQueue):
+    """
+    Process local queue, events are lost if the process exits
+    Events are kept in a heap ordered by when they are next due
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time) -> None:
+        self.clock = clock
+        # (available_at, id, job)
+        self._jobs: list = []
+        self._condition = threading.Condition()
+        self._ids = itertools.count(1)
+
+    def put(self, event: schemas.StravaWebhookInput) -> int:
+        job = schemas.StravaQueuedWebhookEvent(id=next(self._ids), event=event)
+        self._push(job, self.clock())
+        return job.id
+
+    def get(self, timeout: float = 0.0) -> Optional[schemas.StravaQueuedWebhookEvent]:
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while True:
+                now = self.clock()
+                if self._jobs and self._jobs[0][0] <= now:
+                    return heapq.heappop(self._jobs)[2]
+                wait = deadline - time.monotonic()
+                if wait <= 0:
+                    return None
+                if self._jobs:
+                    wait = min(wait, self._jobs[0][0] - now)
+                self._condition.wait(wait)
+
+    def ack(self, job: schemas.StravaQueuedWebhookEvent) -> None:
+        return None
+
+    def retry(self, job: schemas.StravaQueuedWebhookEvent, delay: float = 0.0) -> None:
+        self._push(
+            job.copy(update={"attempts": job.attempts + 1}), self.clock() + delay
+        )
+
+    def fail(self, job: schemas.StravaQueuedWebhookEvent) -> None:
+        logging.error(f"Dropping Strava webhook event after failures: {job.json()}")
+
+    def __len__(self) -> int:
+        with self._condition:
+            return len(self._jobs)
+
+    def _push(self, job: schemas.StravaQueuedWebhookEvent, available_at: float) -> None:
+        with self._condition:
+            heapq.heappush(self._jobs, (available_at, job.id, job))
+            self._condition.notify()
+
+
+class SQLiteWebhookQueue(WebhookQueue):
+    """
+    Queue persisted to a local SQLite file so events survive restarts
+    Rows are claimed by flipping their status to processing and deleted on ack
+    A claim is a lease, events claimed by a worker that died before acking are
+    handed out again once visibility_timeout has passed, so processes sharing
+    the file never take over events that are still being handled
+    Retried events wait in pending until their available_at
+    """
+
+    PENDING = "pending"
+    PROCESSING = "processing"
+    FAILED = "failed"
+
+    def __init__(
+        self,
+        path: str,
+        poll_interval: float = 0.05,
+        visibility_timeout: float = 300,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = path
+        self.poll_interval = poll_interval
+        self.visibility_timeout = visibility_timeout
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS strava_webhook_event (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                payload TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                status TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                claimed_at REAL,
+                available_at REAL
+            )
+            """
+        )
+        columns = {
+            row[1]
+            for row in self._connection.execute(
+                "PRAGMA table_info(strava_webhook_event)"
+            )
+        }
+        if "claimed_at" not in columns:
+            # files created before claims were leased, their claims count as stale
+            self._connection.execute(
+                "ALTER TABLE strava_webhook_event ADD COLUMN claimed_at REAL"
+            )
+        if "available_at" not in columns:
+            # rows without one are due right away
+            self._connection.execute(
+                "ALTER TABLE strava_webhook_event ADD COLUMN available_at REAL"
+            )
+
+    def put(self, event: schemas.StravaWebhookInput) -> int:
+        with self._lock:
+            cursor = self._connection.execute(
+                "INSERT INTO strava_webhook_event (payload, status, created_at) VALUES (?, ?, ?)",
+                (event.json(), self.PENDING, time.time()),
+            )
+        assert cursor.lastrowid is not None
+        return cursor.lastrowid
+
+    def get(self, timeout: float = 0.0) -> Optional[schemas.StravaQueuedWebhookEvent]:
+        deadline = time.monotonic() + timeout
+        while True:
+            job = self._claim()
+            if job is not None or time.monotonic() >= deadline:
+                return job
+            time.sleep(self.poll_interval)
+
+    def _claim(self) -> Optional[schemas.StravaQueuedWebhookEvent]:
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                now = self.clock()
+                row = self._connection.execute(
+                    "SELECT id, payload, attempts FROM strava_webhook_event WHERE (status = ? AND COALESCE(available_at, 0) <= ?) OR (status = ? AND COALESCE(claimed_at, 0) < ?) ORDER BY id LIMIT 1",
+                    (
+                        self.PENDING,
+                        now,
+                        self.PROCESSING,
+                        now - self.visibility_timeout,
+                    ),
+                ).fetchone()
+                if row is not None:
+                    self._connection.execute(
+                        "UPDATE strava_webhook_event SET status = ?, claimed_at = ? WHERE id = ?",
+                        (self.PROCESSING, now, row[0]),
+                    )
+                self._connection.execute("COMMIT")
+            except Exception:
+                self._connection.execute("ROLLBACK")
+                raise
+        if row is None:
+            return None
+        return schemas.StravaQueuedWebhookEvent(
+            id=row[0],
+            event=schemas.StravaWebhookInput.parse_raw(row[1]),
+            attempts=row[2],
+        )
+
+    def ack(self, job: schemas.StravaQueuedWebhookEvent) -> None:
+        with self._lock:
+            self._connection.execute(
+                "DELETE FROM strava_webhook_event WHERE id = ?", (job.id,)
+            )
+
+    def retry(self, job: schemas.StravaQueuedWebhookEvent, delay: float = 0.0) -> None:
+        with self._lock:
+            self._connection.execute(
+                "UPDATE strava_webhook_event SET status = ?, attempts = attempts + 1, available_at = ? WHERE id = ?",
+                (self.PENDING, self.clock() + delay, job.id),
+            )
+
+    def fail(self, job: schemas.StravaQueuedWebhookEvent) -> None:
+        logging.error(f"Parking Strava webhook event after failures: {job.json()}")
+        with self._lock:
+            self._connection.execute(
+                "UPDATE strava_webhook_event SET status = ?, attempts = attempts + 1 WHERE id = ?",
+                (self.FAILED, job.id),
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM strava_webhook_event WHERE status != ?",
+                (self.FAILED,),
+            ).fetchone()
+        return count
+
+
+_WORKER_STATE = threading.local()
+
+
+def _get_worker_loop() -> asyncio.AbstractEventLoop:
+    """
+    Returns the event loop owned by the current worker thread
+    Keeping one loop per thread lets the async HTTP client reuse its connections
+    """
+    loop = getattr(_WORKER_STATE, "loop", None)
+    if loop is None:
+        loop = asyncio.new_event_loop()
+        _WORKER_STATE.loop = loop
+    return loop
+
+
+def _close_worker_loop() -> None:
+    loop = getattr(_WORKER_STATE, "loop", None)
+    if loop is None:
+        return
+    loop.run_until_complete(close_async_http_client())
+    loop.close()
+    _WORKER_STATE.loop = None
+
+
+def handle_webhook_event(
+    event: schemas.StravaWebhookInput,
+    session_factory: Callable[[], Session] = SessionLocal,
+) -> None:
+    """
+    Handles a single event outside of a request with its own db session
+    """
+    session = session_factory()
+    try:
+        result = _get_worker_loop().run_until_complete(
+            StravaWebhookHandler(event, DatabaseService(session)).handle()
+        )
+        logging.info(f"Handled queued Strava webhook event in stages: {result.timings}")
+    finally:
+        session.close()
+
+
+class WebhookWorkerPool:
+    """
+    Pool of background threads draining a WebhookQueue
+    Failed events are retried after retry_backoff seconds, doubling with every
+    attempt so a short outage of a 3rd party API doesn't use up max_attempts
+    """
+
+    def __init__(
+        self,
+        webhook_queue: WebhookQueue,
+        handler: Callable[[schemas.StravaWebhookInput], None] = handle_webhook_event,
+        workers: int = 4,
+        max_attempts: int = 3,
+        poll_interval: float = 0.5,
+        retry_backoff: float = 5.0,
+    ) -> None:
+        self.queue = webhook_queue
+        self.handler = handler
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.poll_interval = poll_interval
+        self._stopped = threading.Event()
+        self._threads: list[threading.Thread] = []
+
+    def start(self) -> None:
+        self._stopped.clear()
+        for index in range(self.workers):
+            thread = threading.Thread(
+                target=self._run, name=f"strava-webhook-worker-{index}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stopped.set()
+        for thread in self._threads:
+            thread.join(timeout=timeout)
+        self._threads = []
+
+    def _run(self) -> None:
+        try:
+            while not self._stopped.is_set():
+                self.run_once(timeout=self.poll_interval)
+        finally:
+            _close_worker_loop()
+
+    def run_once(self, timeout: float = 0.0) -> bool:
+        """
+        Handles the next queued event, returns False if the queue was empty
+        """
+        job = self.queue.get(timeout=timeout)
+        if job is None:
+            return False
+        try:
+            self.handler(job.event)
+        except Exception:
+            logging.exception(f"Failed to handle Strava webhook event: {job.json()}")
+            if job.attempts + 1 < self.max_attempts:
+                self.queue.retry(job, delay=self.retry_backoff * 2**job.attempts)
+            else:
+                self.queue.fail(job)
+        else:
+            self.queue.ack(job)
+        return True
+
+
+@lru_cache
+def get_webhook_queue() -> WebhookQueue:
+    """
+    Returns the process wide webhook queue configured in settings
+    """
+    backend = settings.ENV_VARS.STRAVA_WEBHOOK_QUEUE_BACKEND
+    if backend == "memory":
+        return InMemoryWebhookQueue()
+    if backend == "sqlite":
+        return SQLiteWebhookQueue(
+            settings.ENV_VARS.STRAVA_WEBHOOK_QUEUE_PATH,
+            visibility_timeout=settings.ENV_VARS.STRAVA_WEBHOOK_VISIBILITY_TIMEOUT_SECONDS,
+        )
+    raise ValueError(f"Unknown Strava webhook queue backend: {backend}")
@@ -1,17 +1,21 @@
 """Routing handler for /strava"""
+import logging
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import RedirectResponse
+from starlette.concurrency import run_in_threadpool
 
 from app import settings, utils
-from app.database.database import get_db_service
-from app.database.service import DatabaseService
+from app.api_utils.auth_state import AuthStateStore, get_auth_state_store
+from app.database.database import get_async_db_service, get_db_service
+from app.database.service import AsyncDatabaseService, DatabaseService
 from app.spotify.schemas import SpotifyTrack
-from app.strava.client import StravaAPIService
+from app.strava.client import AsyncStravaAPIService
 from app.strava.handler import StravaWebhookHandler
 from app.strava.models import StravaAuthStateParam
 from app.strava.models import StravaUserInfo as StravaUserInfoModel
+from app.strava.queue import WebhookQueue, get_webhook_queue
 from app.strava.schemas import StravaAuthParams
 from app.strava.schemas import StravaAuthStateParam as StravaAuthStateParamSchema
 from app.strava.schemas import StravaUserInfo as StravaUserInfoSchema
@@ -23,23 +27,23 @@ ROUTER = APIRouter()
 
 
 @ROUTER.get("/login")
-def login(db_service: DatabaseService = Depends(get_db_service)):
+async def login(store: AuthStateStore = Depends(get_auth_state_store)):
     """
     Redirects to Strava login page
     """
-    state = utils.generate_auth_state()
-    db_service.create(
-        StravaAuthStateParamSchema(id=state),
-        StravaAuthStateParam,
-    )
+    state = store.generate_state(StravaAuthStateParam)
+    await store.put(StravaAuthStateParamSchema(id=state), StravaAuthStateParam)
     auth_url = StravaAuthParams(state=state).format_as_url()
 
     return RedirectResponse(url=auth_url)
 
 
 @ROUTER.get("/authorization")
-def authorization(
-    code: str, state: str, db_service: DatabaseService = Depends(get_db_service)
+async def authorization(
+    code: str,
+    state: str,
+    db_service: AsyncDatabaseService = Depends(get_async_db_service),
+    store: AuthStateStore = Depends(get_auth_state_store),
 ):
     """
     Redirect handler for when a Strava user grants access to the application
@@ -49,18 +53,21 @@ def authorization(
 
     Auth url:
     """
-    StravaAPIService.authorize_redirect_state(
-        state=state, model_type=StravaAuthStateParam, db_service=db_service
+    await AsyncStravaAPIService.authorize_redirect_state(
+        state=state, model_type=StravaAuthStateParam, store=store
     )
 
-    response = StravaAPIService.exchange_code(code)
+    response = await AsyncStravaAPIService.exchange_code(code)
     user = UserCreate(id=response.athlete.id)
     strava_user_info = StravaUserInfoSchema(
         id=user.id, user_id=user.id, **response.dict()
     )
 
-    db_service.merge(input_schema=user, model_type=User)
-    db_service.merge(input_schema=strava_user_info, model_type=StravaUserInfoModel)
+    async with db_service.transaction():
+        await db_service.upsert(input_schema=user, model_type=User)
+        await db_service.upsert(
+            input_schema=strava_user_info, model_type=StravaUserInfoModel
+        )
 
     return RedirectResponse(url=f"{settings.ENV_VARS.FE_HOST}/strava/{user.id}")
 
@@ -82,12 +89,20 @@ def verify_webhook(request: Request):
 
 
 @ROUTER.post("/webhook", status_code=200, response_model=Optional[SpotifyTrack])
-def receive_event(
+async def receive_event(
     request_body: StravaWebhookInput,
     db_service: DatabaseService = Depends(get_db_service),
+    webhook_queue: WebhookQueue = Depends(get_webhook_queue),
 ):
     """
     Recieves event from Strava for processing
+    In queue mode the event is only enqueued and handled by background workers,
+    put blocks on the queue's file and lock so it runs on the threadpool
     """
     # TODO: do i need to check that the request contains the verify_token? How do I know that the request is coming from Strava?
-    return StravaWebhookHandler(request_body, db_service).handle()
+    if settings.ENV_VARS.STRAVA_WEBHOOK_MODE == "queue":
+        await run_in_threadpool(webhook_queue.put, request_body)
+        return None
+    result = await StravaWebhookHandler(request_body, db_service).handle()
+    logging.info(f"Handled Strava webhook event in stages: {result.timings}")
+    return result.track
@@ -1,12 +1,17 @@
 """schemas for Strava"""
+from array import array
+from bisect import bisect_left
 from datetime import datetime, timedelta
 from enum import Enum
+from itertools import accumulate, islice
+from operator import mul, sub
 from typing import Optional
 from urllib.parse import urlencode
 
 from app import settings
 from app.api_utils.schemas import APIAuthParams, APITokenRequest, APIUserInfo
 from app.id_base_model.schemas import CustomBaseModel, IntIDBaseModel, StrIDBaseModel
+from app.spotify.schemas import SpotifyTrack
 
 
 class StravaAspectType(str, Enum):
@@ -46,6 +51,16 @@ class StravaWebhookInput(CustomBaseModel):
     owner_id: int  # athlete id
 
 
+class StravaQueuedWebhookEvent(IntIDBaseModel):
+    event: StravaWebhookInput
+    attempts: int = 0
+
+
+class StravaWebhookResult(CustomBaseModel):
+    track: Optional[SpotifyTrack]
+    timings: dict[str, float] = {}  # seconds spent per handler stage
+
+
 class StravaTokenRequest(APITokenRequest):
     client_id: int = settings.ENV_VARS.STRAVA_CLIENT_ID
     client_secret: str = settings.ENV_VARS.STRAVA_CLIENT_SECRET
@@ -78,19 +93,59 @@ class StravaActivity(CustomBaseModel):
     description: Optional[str]
 
 
+class FloatArray(array):
+    """
+    array('d') built straight from a JSON list of numbers
+    Conversion runs in C instead of validating every sample as a float, and the
+    samples take 8 bytes each instead of a Python float object
+    """
+
+    @classmethod
+    def __get_validators__(cls):
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, value) -> "FloatArray":
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, (str, bytes)):
+            raise TypeError("expected a list of numbers")
+        return cls("d", value)
+
+
 class StravaActivityStreamData(CustomBaseModel):
-    data: list[float]
+    data: FloatArray
+
+    class Config:
+        json_encoders = {array: list}
+
+
+class StravaHeartrateWindow(CustomBaseModel):
+    start: timedelta
+    end: timedelta
+    average_heartrate: float
+
+    @property
+    def time_mark(self) -> timedelta:
+        return self.start + (self.end - self.start) / 2
 
 
 class StravaActivityStream(CustomBaseModel):
     heartrate: StravaActivityStreamData
     time: StravaActivityStreamData
 
+    class Config:
+        json_encoders = {array: list}
+
     def get_max_heartrate(self) -> Optional[tuple[int, float]]:
-        if len(self.heartrate.data) == 0:
+        data = self.heartrate.data
+        if len(data) == 0:
             return None
-        max_heartrate = max(self.heartrate.data)
-        max_heartrate_index = self.heartrate.data.index(max_heartrate)
+        # Two builtin scans are still cheaper than one scan with a key function.
+        # Reading a sample boxes a float, which makes array slower here than
+        # list. See benchmarks/activity_stream.py
+        max_heartrate = max(data)
+        max_heartrate_index = data.index(max_heartrate)
 
         return max_heartrate_index, max_heartrate
 
@@ -105,3 +160,68 @@ class StravaActivityStream(CustomBaseModel):
         seconds_elapsed = self.time.data[index]
 
         return timedelta(seconds=seconds_elapsed)
+
+    def get_peak_heartrate_window(
+        self, window: timedelta = timedelta(seconds=30)
+    ) -> Optional[StravaHeartrateWindow]:
+        """
+        Returns the window with the highest average heart rate, None if the
+        activity is shorter than the window
+
+        Samples are irregularly spaced so each heart rate is held until the next
+        sample and averaged over time rather than per sample
+        The area under a window is then piecewise linear in where it starts, so
+        the peak is a window that either ends or starts on a sample, both are
+        searched with two pointers
+        A prefix sum of heart rate * seconds gives the area of a window in O(1)
+        and neither pointer moves backwards, so the search is O(n)
+        """
+        seconds = window.total_seconds()
+        if seconds <= 0:
+            raise ValueError("window must be positive")
+        heartrate, times = self.heartrate.data, self.time.data
+        n = min(len(heartrate), len(times))
+        if n == 0 or times[n - 1] - times[0] < seconds:
+            return None
+
+        # area[k] is the integral of heart rate from times[0] to times[k]
+        durations = map(sub, islice(times, 1, n), times)
+        area = array("d", accumulate(map(mul, heartrate, durations), initial=0.0))
+
+        best_area, best_start = -1.0, 0.0
+
+        # windows ending on a sample, the sample before the start is held into it
+        start_index = 0
+        for end_index in range(bisect_left(times, times[0] + seconds, 0, n), n):
+            start = times[end_index] - seconds
+            while times[start_index] < start:
+                start_index += 1
+            window_area = area[end_index] - area[start_index]
+            if start_index > 0:
+                window_area += heartrate[start_index - 1] * (times[start_index] - start)
+            if window_area > best_area:
+                best_area, best_start = window_area, start
+
+        # windows starting on a sample, the last sample inside is held to the end
+        end_index = 0
+        for start_index in range(n):
+            end = times[start_index] + seconds
+            if end > times[n - 1]:
+                break
+            while end_index + 1 < n and times[end_index + 1] <= end:
+                end_index += 1
+            window_area = (
+                area[end_index]
+                - area[start_index]
+                + heartrate[end_index] * (end - times[end_index])
+            )
+            if window_area > best_area or (
+                window_area == best_area and times[start_index] < best_start
+            ):
+                best_area, best_start = window_area, times[start_index]
+
+        return StravaHeartrateWindow(
+            start=timedelta(seconds=best_start),
+            end=timedelta(seconds=best_start + seconds),
+            average_heartrate=best_area / seconds,
+        )
@@ -1,39 +1,79 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional
 
+from app import settings
 from app.spotify.schemas import SpotifyTrack
 from app.strava import schemas
-from app.strava.client import StravaAPIService
+from app.strava.client import STREAM_KEYS, AsyncStravaAPIService
 
 
-class StravaService:
-    api: StravaAPIService
+class AsyncStravaService:
+    api: AsyncStravaAPIService
 
-    def __init__(self, api: StravaAPIService) -> None:
+    def __init__(self, api: AsyncStravaAPIService) -> None:
         self.api = api
 
-    def get_max_hr_date_time_for_activity(
+    async def get_max_hr_date_time_for_activity(
         self, activity: schemas.StravaActivity
     ) -> Optional[datetime]:
-        activity_stream = self.api.get_stream_for_activity(
-            id=activity.id,
-            stream_keys=[
-                schemas.StravaStreamKeys.TIME,
-                schemas.StravaStreamKeys.HEARTRATE,
-            ],
-        )
-        max_hr_time_mark = activity_stream.get_max_heartrate_time_mark()
+        max_hr_time_mark = await self.get_max_hr_time_mark(activity.id)
         if max_hr_time_mark is None:
             return None
 
         return activity.start_date + max_hr_time_mark
 
-    def update_activity_with_track(
+    async def get_max_hr_time_mark(self, id: int) -> Optional[timedelta]:
+        """
+        Returns how far into the activity the max heart rate was reached
+        STRAVA_STREAM_MODE decides whether streams are parsed while downloading
+        """
+        if settings.ENV_VARS.STRAVA_STREAM_MODE == "streaming":
+            return await self.api.get_max_heartrate_time_mark_for_activity(id)
+        activity_stream = await self.api.get_stream_for_activity(
+            id=id, stream_keys=STREAM_KEYS
+        )
+        return self.get_peak_time_mark(activity_stream)
+
+    @staticmethod
+    def get_peak_time_mark(
+        activity_stream: schemas.StravaActivityStream,
+    ) -> Optional[timedelta]:
+        """
+        Middle of the highest average heart rate window when STRAVA_PEAK_WINDOW_SECONDS
+        is set, the single highest sample otherwise or if the activity is too short
+        """
+        window_seconds = settings.ENV_VARS.STRAVA_PEAK_WINDOW_SECONDS
+        if window_seconds > 0:
+            peak = activity_stream.get_peak_heartrate_window(
+                timedelta(seconds=window_seconds)
+            )
+            if peak is not None:
+                return peak.time_mark
+        return activity_stream.get_max_heartrate_time_mark()
+
+    async def update_activity_with_track(
         self, activity: schemas.StravaActivity, track: Optional[SpotifyTrack]
     ):
-        if activity.description and "Theme Song:" in activity.description:
+        description = self.get_description_with_track(activity, track)
+        if description is None:
             return
 
+        await self.api.update_activity(
+            id=activity.id,
+            data={"description": description},
+        )
+
+    @staticmethod
+    def get_description_with_track(
+        activity: schemas.StravaActivity, track: Optional[SpotifyTrack]
+    ) -> Optional[str]:
+        """
+        Returns the activity description with the theme song appended
+        None if the activity already has a theme song
+        """
+        if activity.description and "Theme Song:" in activity.description:
+            return None
+
         theme_song_string = (
             f"Theme Song: {track.name} by {', '.join([artist.name for artist in track.artists])} - https://open.spotify.com/track/{track.id}"
             if track is not None
@@ -44,7 +84,4 @@ class StravaService:
         else:
             description = theme_song_string
 
-        self.api.update_activity(
-            id=activity.id,
-            data={"description": description},
-        )
+        return description
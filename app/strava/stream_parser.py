@@ -0,0 +1,185 @@
+"""Module parsing Strava activity stream responses while they download"""
+import re
+from array import array
+from datetime import timedelta
+from typing import Iterable, Optional, Sequence
+
+from app.strava.schemas import StravaStreamKeys
+
+# a structural character, a string or a scalar (number, true, false, null)
+TOKEN = re.compile(rb'\s*(?:([{}\[\]:,])|"((?:[^"\\]|\\.)*)"|([^\s{}\[\]:,"]+))')
+WHITESPACE = re.compile(rb"\s*")
+
+
+class StravaStreamParser:
+    """
+    Incremental parser for the key_by_type streams response, which looks like
+        {"time": {"data": [0, 1, ...], "series_type": ...}, "heartrate": {...}}
+
+    Chunks are fed as they arrive and the samples of the requested streams are
+    returned in batches of (stream key, array of samples), nothing else in the
+    body is kept
+    Memory is bounded by the chunk size rather than the length of the activity
+    """
+
+    def __init__(self, stream_keys: Iterable[str]) -> None:
+        self.stream_keys = {getattr(key, "value", key) for key in stream_keys}
+        self._buffer = b""
+        # one [key, expecting_key] entry per open object, None per open array
+        self._stack: list[Optional[list]] = []
+        # stream key of the data array being read, None outside of one
+        self._data_key: Optional[str] = None
+
+    def feed(self, chunk: bytes) -> list[tuple[str, array]]:
+        """
+        Returns the samples completed by chunk
+        """
+        self._buffer += chunk
+        return self._parse(final=False)
+
+    def close(self) -> list[tuple[str, array]]:
+        """
+        Returns the samples left once the response is complete
+        """
+        samples = self._parse(final=True)
+        if self._stack or WHITESPACE.fullmatch(self._buffer) is None:
+            raise ValueError("Strava stream response ended unexpectedly")
+        return samples
+
+    def _parse(self, final: bool) -> list[tuple[str, array]]:
+        buffer = self._buffer
+        pos = 0
+        samples: list[tuple[str, array]] = []
+        while True:
+            if self._data_key is not None:
+                pos = self._parse_samples(buffer, pos, final, samples)
+                if self._data_key is not None:
+                    break
+            match = TOKEN.match(buffer, pos)
+            if match is None:
+                break
+            structural, string, scalar = match.groups()
+            if scalar is not None and match.end() == len(buffer) and not final:
+                # the scalar may continue in the next chunk
+                break
+            pos = match.end()
+            if structural is not None:
+                self._on_structural(structural)
+            elif string is not None:
+                self._on_string(string)
+            else:
+                self._on_value()
+        self._buffer = buffer[pos:]
+        return samples
+
+    def _parse_samples(
+        self, buffer: bytes, pos: int, final: bool, samples: list
+    ) -> int:
+        """
+        Adds the complete samples of the data array, returns where it stopped
+        Numbers never contain , or ] so complete samples can be split off
+        """
+        end = buffer.find(b"]", pos)
+        closed = end != -1
+        if not closed:
+            end = len(buffer) if final else buffer.rfind(b",", pos)
+            if end == -1:
+                return pos
+        segment = buffer[pos:end]
+        if segment.strip():
+            values = array("d", map(float, segment.split(b",")))
+            samples.append((self._data_key, values))
+        if closed:
+            self._data_key = None
+            self._stack.pop()
+            self._on_value()
+        return end + 1
+
+    def _on_structural(self, character: bytes) -> None:
+        if character == b"{":
+            self._stack.append([None, True])
+        elif character == b"[":
+            self._stack.append(None)
+            if self._is_requested_data():
+                self._data_key = self._stack[0][0]  # type: ignore
+        elif character in (b"}", b"]"):
+            self._stack.pop()
+            self._on_value()
+        elif character == b",":
+            top = self._stack[-1] if self._stack else None
+            if top is not None:
+                top[1] = True
+
+    def _on_string(self, string: bytes) -> None:
+        top = self._stack[-1] if self._stack else None
+        if top is not None and top[1]:
+            top[0], top[1] = string.decode(), False
+        else:
+            self._on_value()
+
+    def _on_value(self) -> None:
+        """
+        A value finished, the enclosing object waits for its next key
+        """
+        top = self._stack[-1] if self._stack else None
+        if top is not None:
+            top[0] = None
+
+    def _is_requested_data(self) -> bool:
+        if len(self._stack) != 3:
+            return False
+        stream, data = self._stack[0], self._stack[1]
+        return (
+            stream is not None
+            and stream[0] in self.stream_keys
+            and data is not None
+            and data[0] == "data"
+        )
+
+
+class StreamOrderError(ValueError):
+    """
+    The time stream arrived before the heartrate stream
+    """
+
+
+class MaxHeartrateTracker:
+    """
+    Running argmax of the heartrate stream and the time it was reached
+    Streams arrive one after the other, the heartrate stream has to come first
+    so only the time sample at the argmax is kept, StreamOrderError otherwise
+    """
+
+    def __init__(self) -> None:
+        self.max_heartrate: Optional[float] = None
+        self.index: Optional[int] = None
+        self._heartrate_count = 0
+        self._time_count = 0
+        self._time: Optional[float] = None
+
+    def add(self, key: str, values: Sequence[float]) -> None:
+        """
+        Adds the next batch of samples of a stream
+        """
+        if not values:
+            return
+        if key == StravaStreamKeys.HEARTRATE.value:
+            # builtin scans, the first sample wins ties like list.index
+            max_heartrate = max(values)
+            if self.max_heartrate is None or max_heartrate > self.max_heartrate:
+                self.max_heartrate = max_heartrate
+                self.index = self._heartrate_count + values.index(max_heartrate)
+            self._heartrate_count += len(values)
+        elif key == StravaStreamKeys.TIME.value:
+            if self._heartrate_count == 0:
+                raise StreamOrderError("time stream arrived before heartrate stream")
+            offset = -1 if self.index is None else self.index - self._time_count
+            if 0 <= offset < len(values):
+                self._time = values[offset]
+            self._time_count += len(values)
+
+    def get_max_heartrate_time_mark(self) -> Optional[timedelta]:
+        if self._time is None:
+            return None
+
+        return timedelta(seconds=self._time)
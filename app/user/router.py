@@ -1,25 +1,41 @@
 """Routing handler for /users"""
-from typing import Any
+from typing import Any, Optional
 
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session, selectinload
 
 from app.auth.utils import get_current_user_id
 from app.database.database import get_session
+from app.database.pagination import build_page, decode_cursor
+from app.database.schemas import Page
 from app.database.service import DatabaseService
 from app.user import models, schemas
 
 ROUTER = APIRouter()
 
 
-@ROUTER.get("/", response_model=list[schemas.User])
+@ROUTER.get("/", response_model=Page[schemas.User])
 def get_all(
-    session: Session = Depends(get_session), user_id: int = Depends(get_current_user_id)
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    session: Session = Depends(get_session),
+    user_id: int = Depends(get_current_user_id),
 ) -> Any:
     """
-    Gets all users
+    Gets all users, a page at a time
+    Pass the returned next_cursor to get the following page
     """
-    return DatabaseService(session).all(model_type=models.User)
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError as error:
+        raise HTTPException(status_code=400, detail=str(error))
+    users = DatabaseService(session).all(
+        model_type=models.User,
+        limit=limit + 1,
+        after=after,
+        options=[selectinload(models.User.strava_user_info)],
+    )
+    return build_page(users, limit=limit, model_type=models.User)
 
 
 @ROUTER.get("/{id}", response_model=schemas.User)
@@ -0,0 +1,30 @@
+"""Module containing user queries shared across routers and handlers"""
+from typing import Optional
+
+from sqlalchemy.orm import joinedload
+
+from app.database.service import ID, DatabaseService
+from app.user.models import User
+
+# both credentials are one-to-one, so joining them keeps it to a single query
+WITH_CREDENTIALS = (
+    joinedload(User.strava_user_info),
+    joinedload(User.spotify_user_info),
+)
+
+
+class UserService:
+    """
+    Service for reading users and their 3rd party credentials
+    """
+
+    db_service: DatabaseService
+
+    def __init__(self, db_service: DatabaseService) -> None:
+        self.db_service = db_service
+
+    def get_with_credentials(self, id: ID) -> Optional[User]:
+        """
+        Gets a user with its Strava and Spotify user info in one round trip
+        """
+        return self.db_service.get(id=id, model_type=User, options=WITH_CREDENTIALS)
@@ -1,4 +1,4 @@
-import random
+import secrets
 import string
 from typing import Dict
 
@@ -15,4 +15,4 @@ def get_query_params_as_dict(request: Request) -> Dict[str, str]:
 
 
 def generate_auth_state() -> str:
-    return "".join(random.choices(string.ascii_letters, k=16))
+    return "".join(secrets.choice(string.ascii_letters) for _ in range(16))
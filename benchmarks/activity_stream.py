@@ -0,0 +1,107 @@
+"""
+Compares the array backed StravaActivityStream with the previous list[float] one
+and with a single scan argmax
+The activity stream fixture used by tests/strava/test_schemas.py is repeated
+until it has the requested number of samples
+
+    python -m benchmarks.activity_stream --samples 50000
+"""
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+from app.id_base_model.schemas import CustomBaseModel
+from app.strava.schemas import StravaActivityStream
+
+FIXTURE_PATH = (
+    Path(__file__).parent.parent / "tests" / "test_data" / "activity_stream.json"
+)
+
+
+class ListStravaActivityStreamData(CustomBaseModel):
+    data: list[float]
+
+
+class ListStravaActivityStream(CustomBaseModel):
+    """
+    StravaActivityStream before it was backed by arrays
+    """
+
+    heartrate: ListStravaActivityStreamData
+    time: ListStravaActivityStreamData
+
+    def get_max_heartrate(self) -> Optional[tuple[int, float]]:
+        if len(self.heartrate.data) == 0:
+            return None
+        max_heartrate = max(self.heartrate.data)
+        max_heartrate_index = self.heartrate.data.index(max_heartrate)
+
+        return max_heartrate_index, max_heartrate
+
+
+class SingleScanStravaActivityStream(StravaActivityStream):
+    """
+    StravaActivityStream finding the max heart rate index in a single scan
+    """
+
+    def get_max_heartrate(self) -> Optional[tuple[int, float]]:
+        data = self.heartrate.data
+        if len(data) == 0:
+            return None
+        max_heartrate_index = max(range(len(data)), key=data.__getitem__)
+
+        return max_heartrate_index, data[max_heartrate_index]
+
+
+def make_body(samples: int) -> bytes:
+    """
+    Returns a stream response body with the fixture repeated to samples length
+    """
+    fixture = json.loads(FIXTURE_PATH.read_text())
+    heartrate, times = fixture["heartrate"]["data"], fixture["time"]["data"]
+    body: dict = {"heartrate": {"data": []}, "time": {"data": []}}
+    offset = 0
+    while len(body["time"]["data"]) < samples:
+        body["heartrate"]["data"].extend(heartrate)
+        body["time"]["data"].extend(time + offset for time in times)
+        offset += times[-1] + 1
+    for key in ("heartrate", "time"):
+        del body[key]["data"][samples:]
+    return json.dumps(body).encode()
+
+
+def run(body: bytes, model_type: Callable, repeat: int) -> tuple[float, float]:
+    """
+    Returns the best time parsing the body and finding the max heart rate
+    """
+    parse, argmax = float("inf"), float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        stream = model_type(**json.loads(body))
+        parsed = time.perf_counter()
+        stream.get_max_heartrate()
+        done = time.perf_counter()
+        parse, argmax = min(parse, parsed - start), min(argmax, done - parsed)
+    return parse, argmax
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--samples", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    body = make_body(args.samples)
+    print(f"{args.samples} samples per stream, best of {args.repeat}")
+    for name, model_type in (
+        ("list[float]", ListStravaActivityStream),
+        ("array('d')", StravaActivityStream),
+        ("single scan", SingleScanStravaActivityStream),
+    ):
+        parse, argmax = run(body, model_type, args.repeat)
+        print(f"{name:>12}: parse {parse * 1000:.1f}ms  max hr {argmax * 1000:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
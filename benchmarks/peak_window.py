@@ -0,0 +1,68 @@
+"""
+Compares the O(n) peak heart rate window search with a brute force rescan
+
+    python -m benchmarks.peak_window --samples 100000 --window 30
+"""
+import argparse
+import json
+import time
+from bisect import bisect_right
+from datetime import timedelta
+from typing import Optional
+
+from app.strava.schemas import StravaActivityStream
+from benchmarks.activity_stream import make_body
+
+
+def rescanning_peak_window(
+    activity_stream: StravaActivityStream, window: timedelta
+) -> Optional[float]:
+    """
+    Brute force over every window that starts or ends on a sample, summing the
+    samples inside each one again, O(n * samples per window)
+    """
+    seconds = window.total_seconds()
+    heartrate, times = activity_stream.heartrate.data, activity_stream.time.data
+    n = len(times)
+    best_area = None
+    for index in range(n):
+        for start in (times[index], times[index] - seconds):
+            end = start + seconds
+            if start < times[0] or end > times[n - 1]:
+                continue
+            # first sample after the window start
+            first = bisect_right(times, start)
+            area = heartrate[first - 1] * (min(times[first], end) - start)
+            for sample in range(first, n - 1):
+                if times[sample] >= end:
+                    break
+                area += heartrate[sample] * (
+                    min(times[sample + 1], end) - times[sample]
+                )
+            if best_area is None or area > best_area:
+                best_area = area
+    return None if best_area is None else best_area / seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--samples", type=int, default=100000)
+    parser.add_argument("--window", type=float, default=30, help="seconds")
+    args = parser.parse_args()
+    activity_stream = StravaActivityStream(**json.loads(make_body(args.samples)))
+    window = timedelta(seconds=args.window)
+    print(f"{args.samples} samples, {args.window:g}s window")
+
+    start = time.perf_counter()
+    average = rescanning_peak_window(activity_stream, window)
+    print(f"brute force: {time.perf_counter() - start:.3f}s  average {average:.1f}")
+
+    start = time.perf_counter()
+    peak = activity_stream.get_peak_heartrate_window(window)
+    print(
+        f"prefix sums: {time.perf_counter() - start:.3f}s  average {peak.average_heartrate:.1f}"  # type: ignore
+    )
+
+
+if __name__ == "__main__":
+    main()
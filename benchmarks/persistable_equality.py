@@ -0,0 +1,68 @@
+"""
+Compares Persistable equality against the previous deepcopy based implementation
+
+    python -m benchmarks.persistable_equality --objects 10000
+"""
+import argparse
+import time
+from copy import deepcopy
+from datetime import datetime, timezone
+from typing import Callable
+
+from app.strava.models import StravaUserInfo
+
+
+def deepcopy_eq(self, other) -> bool:
+    """
+    Persistable.__eq__ before it compared mapped columns
+    """
+    classes_match = isinstance(other, self.__class__)
+    self_dict, other_dict = deepcopy(self.__dict__), deepcopy(other.__dict__)
+    # ignore SQLAlchemy internal stuff
+    self_dict.pop("_sa_instance_state", None)
+    other_dict.pop("_sa_instance_state", None)
+    attrs_match = self_dict == other_dict
+
+    return classes_match and attrs_match
+
+
+def column_eq(self, other) -> bool:
+    return self == other
+
+
+def make_user_infos(objects: int) -> list[StravaUserInfo]:
+    return [
+        StravaUserInfo(
+            id=id,
+            user_id=id,
+            access_token="access",
+            refresh_token="refresh",
+            expires_at=datetime(2030, 1, 1, tzinfo=timezone.utc),
+        )
+        for id in range(objects)
+    ]
+
+
+def run(
+    left: list[StravaUserInfo],
+    right: list[StravaUserInfo],
+    eq: Callable[[StravaUserInfo, StravaUserInfo], bool],
+) -> float:
+    start = time.perf_counter()
+    for a, b in zip(left, right):
+        eq(a, b)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--objects", type=int, default=10000)
+    args = parser.parse_args()
+    left, right = make_user_infos(args.objects), make_user_infos(args.objects)
+    print(f"{args.objects} equal pairs of StravaUserInfo")
+    for name, eq in (("deepcopy", deepcopy_eq), ("columns", column_eq)):
+        print(f"{name:>9}: {run(left, right, eq):.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Compares peak memory and time of buffered and streaming activity stream parsing
+Only allocations made while parsing are counted, not the response body itself
+
+    python -m benchmarks.stream_parser --samples 100000 1000000
+"""
+import argparse
+import json
+import time
+import tracemalloc
+from datetime import timedelta
+from typing import Callable, Optional
+
+from app.api_utils.service import STREAM_CHUNK_SIZE
+from app.strava.client import STREAM_KEYS
+from app.strava.schemas import StravaActivityStream
+from app.strava.stream_parser import MaxHeartrateTracker, StravaStreamParser
+from benchmarks.activity_stream import make_body
+
+
+def buffered(body: bytes) -> Optional[timedelta]:
+    return StravaActivityStream(**json.loads(body)).get_max_heartrate_time_mark()
+
+
+def streaming(body: bytes) -> Optional[timedelta]:
+    parser = StravaStreamParser(STREAM_KEYS)
+    tracker = MaxHeartrateTracker()
+    for start in range(0, len(body), STREAM_CHUNK_SIZE):
+        end = start + STREAM_CHUNK_SIZE
+        for key, values in parser.feed(body[start:end]):
+            tracker.add(key, values)
+    for key, values in parser.close():
+        tracker.add(key, values)
+    return tracker.get_max_heartrate_time_mark()
+
+
+def run(body: bytes, parse: Callable[[bytes], Optional[timedelta]]) -> tuple:
+    tracemalloc.start()
+    start = time.perf_counter()
+    time_mark = parse(body)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return time_mark, elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--samples", type=int, nargs="+", default=[100000, 1000000])
+    args = parser.parse_args()
+    for samples in args.samples:
+        body = make_body(samples)
+        print(f"{samples} samples per stream, {len(body) / 2**20:.1f}MB body")
+        for name, parse in (("buffered", buffered), ("streaming", streaming)):
+            time_mark, elapsed, peak = run(body, parse)
+            print(
+                f"{name:>10}: {elapsed:.3f}s  peak {peak / 2**20:.1f}MB  max hr at {time_mark}"
+            )
+
+
+if __name__ == "__main__":
+    main()
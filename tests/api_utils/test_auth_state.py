@@ -0,0 +1,208 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import sessionmaker
+
+from app import settings
+from app.api_utils.auth_state import (
+    AuthStateSweeper,
+    DatabaseAuthStateStore,
+    InMemoryAuthStateStore,
+    SignedAuthStateStore,
+    get_in_memory_auth_state_store,
+)
+from app.database.service import AsyncDatabaseService
+from app.spotify.models import SpotifyAuthStateParam
+from app.spotify.schemas import SpotifyAuthStateParam as SpotifyAuthStateParamSchema
+from app.strava.models import StravaAuthStateParam
+from app.strava.schemas import StravaAuthStateParam as StravaAuthStateParamSchema
+from tests.conftest import TestingAsyncSessionLocal
+
+
+class FakeClock:
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_pop_returns_state_once():
+    # Arrange
+    store = InMemoryAuthStateStore()
+    state_param = SpotifyAuthStateParamSchema(id="abc", user_id=1)
+    asyncio.run(store.put(state_param, SpotifyAuthStateParam))
+    # Act
+    first = asyncio.run(store.pop("abc", SpotifyAuthStateParam))
+    second = asyncio.run(store.pop("abc", SpotifyAuthStateParam))
+    # Assert
+    assert first == SpotifyAuthStateParam(id="abc", user_id=1)
+    assert second is None
+
+
+def test_pop_is_scoped_to_model_type():
+    # Arrange
+    store = InMemoryAuthStateStore()
+    asyncio.run(store.put(StravaAuthStateParamSchema(id="abc"), StravaAuthStateParam))
+    # Act
+    result = asyncio.run(store.pop("abc", SpotifyAuthStateParam))
+    # Assert
+    assert result is None
+
+
+def test_pop_expired_state():
+    # Arrange
+    clock = FakeClock(1000)
+    store = InMemoryAuthStateStore(ttl=60, clock=clock)
+    asyncio.run(store.put(StravaAuthStateParamSchema(id="abc"), StravaAuthStateParam))
+    clock.now = 1060
+    # Act
+    result = asyncio.run(store.pop("abc", StravaAuthStateParam))
+    # Assert
+    assert result is None
+
+
+def test_put_drops_expired_and_oldest_states():
+    # Arrange
+    clock = FakeClock(1000)
+    store = InMemoryAuthStateStore(ttl=60, max_size=2, clock=clock)
+    for state in ("a", "b"):
+        asyncio.run(
+            store.put(StravaAuthStateParamSchema(id=state), StravaAuthStateParam)
+        )
+    clock.now = 1030
+    for state in ("c", "d"):
+        asyncio.run(
+            store.put(StravaAuthStateParamSchema(id=state), StravaAuthStateParam)
+        )
+    clock.now = 1070
+    # Act
+    asyncio.run(store.put(StravaAuthStateParamSchema(id="e"), StravaAuthStateParam))
+    # Assert
+    assert len(store) == 2
+    assert asyncio.run(store.pop("c", StravaAuthStateParam)) is None
+    assert asyncio.run(store.pop("d", StravaAuthStateParam)) is not None
+
+
+def test_login_with_memory_store(test_client, mocker, local_session):
+    # Arrange
+    mocker.patch.object(settings.ENV_VARS, "AUTH_STATE_STORE", "memory")
+    mocker.patch("app.api_utils.auth_state.generate_auth_state", return_value="abc")
+    # Act
+    test_client.get("/spotify/login?user_id=1", allow_redirects=False)
+    state_param = asyncio.run(
+        get_in_memory_auth_state_store().pop("abc", SpotifyAuthStateParam)
+    )
+    persisted = local_session.query(SpotifyAuthStateParam).get("abc")
+    # Assert
+    assert state_param == SpotifyAuthStateParam(id="abc", user_id=1)
+    assert persisted is None
+
+
+def test_signed_state_round_trip():
+    # Arrange
+    store = SignedAuthStateStore(secret="secret")
+    state = store.generate_state(SpotifyAuthStateParam, user_id=1)
+    # Act
+    result = asyncio.run(store.pop(state, SpotifyAuthStateParam))
+    # Assert
+    assert result == SpotifyAuthStateParam(id=state, user_id=1)
+
+
+@pytest.mark.parametrize(
+    "tamper",
+    [
+        lambda state: state[:-2] + ("AA" if state[-2:] != "AA" else "BB"),
+        lambda state: "e30." + state.split(".")[1],
+        lambda state: "not-a-state",
+    ],
+    ids=["Signature", "Payload", "Garbage"],
+)
+def test_signed_state_rejects_tampering(tamper):
+    # Arrange
+    store = SignedAuthStateStore(secret="secret")
+    state = store.generate_state(SpotifyAuthStateParam, user_id=1)
+    # Act
+    result = asyncio.run(store.pop(tamper(state), SpotifyAuthStateParam))
+    # Assert
+    assert result is None
+
+
+def test_signed_state_rejects_other_secret_and_scope():
+    # Arrange
+    store = SignedAuthStateStore(secret="secret")
+    state = SignedAuthStateStore(secret="other").generate_state(StravaAuthStateParam)
+    strava_state = store.generate_state(StravaAuthStateParam)
+    # Act
+    other_secret = asyncio.run(store.pop(state, StravaAuthStateParam))
+    other_scope = asyncio.run(store.pop(strava_state, SpotifyAuthStateParam))
+    # Assert
+    assert other_secret is None
+    assert other_scope is None
+
+
+def test_signed_state_rejects_replay_and_expiry():
+    # Arrange
+    clock = FakeClock(1000)
+    store = SignedAuthStateStore(secret="secret", ttl=60, clock=clock)
+    replayed_state = store.generate_state(StravaAuthStateParam)
+    expired_state = store.generate_state(StravaAuthStateParam)
+    # Act
+    first = asyncio.run(store.pop(replayed_state, StravaAuthStateParam))
+    replay = asyncio.run(store.pop(replayed_state, StravaAuthStateParam))
+    clock.now = 1060
+    expired = asyncio.run(store.pop(expired_state, StravaAuthStateParam))
+    # Assert
+    assert first is not None
+    assert replay is None
+    assert expired is None
+
+
+def test_signed_state_requires_secret():
+    # Act / Assert
+    with pytest.raises(ValueError):
+        SignedAuthStateStore(secret="")
+
+
+def test_database_store_pop_rejects_expired_state(local_session):
+    # Arrange
+    created_at = datetime.now(timezone.utc) - timedelta(seconds=120)
+    local_session.add(StravaAuthStateParam(id="abc", created_at=created_at))
+    local_session.commit()
+
+    async def pop():
+        async with TestingAsyncSessionLocal() as session:
+            store = DatabaseAuthStateStore(AsyncDatabaseService(session), ttl=60)
+            return await store.pop("abc", StravaAuthStateParam)
+
+    # Act
+    result = asyncio.run(pop())
+    # Assert
+    assert result is None
+    assert local_session.get(StravaAuthStateParam, "abc") is None
+
+
+def test_sweeper_deletes_expired_state_in_batches(local_session):
+    # Arrange
+    expired = datetime.now(timezone.utc) - timedelta(hours=1)
+    local_session.add_all(
+        [StravaAuthStateParam(id=f"old{i}", created_at=expired) for i in range(5)]
+        + [StravaAuthStateParam(id="new")]
+        + [SpotifyAuthStateParam(id="old", user_id=1, created_at=expired)]
+    )
+    local_session.commit()
+    sweeper = AuthStateSweeper(
+        [StravaAuthStateParam, SpotifyAuthStateParam],
+        session_factory=sessionmaker(bind=local_session.get_bind()),
+        ttl=timedelta(minutes=10),
+        batch_size=2,
+    )
+    # Act
+    reclaimed = sweeper.run_once()
+    # Assert
+    assert reclaimed == {"strava_auth_state_param": 5, "spotify_auth_state_param": 1}
+    remaining = local_session.scalars(select(StravaAuthStateParam.id)).all()
+    assert remaining == ["new"]
+    assert local_session.scalar(select(func.count(SpotifyAuthStateParam.id))) == 0
@@ -0,0 +1,110 @@
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.api_utils.http_client import (
+    AsyncHTTPClient,
+    HTTPClient,
+    close_async_http_client,
+    get_async_http_client,
+    get_http_client,
+)
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"{}"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(name="server_url")
+def fixture_server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_request_reuses_connection(server_url):
+    # Arrange
+    client = HTTPClient()
+    # Act
+    for _ in range(3):
+        client.request("GET", f"{server_url}/ping").raise_for_status()
+    # Assert
+    [stats] = client.stats()
+    assert stats.host == "127.0.0.1"
+    assert stats.requests == 3
+    assert stats.connections == 1
+    assert stats.reused == 2
+    client.close()
+
+
+def test_http_pools_endpoint_skips_jwks_client(test_client, server_url):
+    # Arrange
+    get_http_client().request("GET", f"{server_url}/ping")
+    # Act
+    response = test_client.get("/health/http")
+    # Assert
+    assert response.status_code == 200
+    assert all(pool["client"] == "httpx" for pool in response.json())
+
+
+def test_async_request_reuses_connection(server_url):
+    # Arrange
+    client = AsyncHTTPClient()
+
+    async def send_requests():
+        for _ in range(3):
+            response = await client.request("GET", f"{server_url}/ping")
+            response.raise_for_status()
+        await client.aclose()
+
+    # Act
+    asyncio.run(send_requests())
+    # Assert
+    [stats] = client.stats()
+    assert stats.client == "httpx"
+    assert stats.host == "127.0.0.1"
+    assert stats.requests == 3
+    assert stats.connections == 1
+    assert stats.reused == 2
+
+
+def test_http_pools_endpoint_reports_async_client(test_client, server_url):
+    # Arrange
+    port = int(server_url.rsplit(":", 1)[1])
+
+    async def send_request():
+        response = await get_async_http_client().request("GET", f"{server_url}/ping")
+        response.raise_for_status()
+
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(send_request())
+    # Act
+    response = test_client.get("/health/http")
+    # Assert
+    assert response.status_code == 200
+    assert {
+        "client": "httpx",
+        "host": "127.0.0.1",
+        "port": port,
+        "requests": 1,
+        "connections": 1,
+        "reused": 0,
+    } in response.json()
+    loop.run_until_complete(close_async_http_client())
+    loop.close()
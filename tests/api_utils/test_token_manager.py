@@ -0,0 +1,158 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.api_utils.token_manager import TokenManager
+from app.strava import models, schemas
+
+EXPIRED = datetime(2023, 7, 9, tzinfo=timezone.utc)
+
+
+def expired_user_info(access_token: str = "old") -> schemas.StravaUserInfo:
+    return schemas.StravaUserInfo(
+        id=123,
+        user_id=123,
+        access_token=access_token,
+        refresh_token="refresh",
+        expires_at=EXPIRED,
+    )
+
+
+def refreshed(user_info: schemas.StravaUserInfo) -> schemas.StravaUserInfo:
+    return user_info.copy(
+        update={
+            "access_token": "new",
+            "expires_at": datetime.now(timezone.utc) + timedelta(hours=6),
+        }
+    )
+
+
+async def arefreshed(user_info: schemas.StravaUserInfo) -> schemas.StravaUserInfo:
+    return refreshed(user_info)
+
+
+@pytest.fixture(name="token_manager")
+def fixture_token_manager():
+    return TokenManager(
+        model_type=models.StravaUserInfo, schema_type=schemas.StravaUserInfo
+    )
+
+
+@pytest.fixture(name="seeded_session")
+def fixture_seeded_session(local_session):
+    local_session.add(
+        models.StravaUserInfo(
+            id=123,
+            user_id=123,
+            access_token="old",
+            refresh_token="refresh",
+            expires_at=EXPIRED.isoformat(),
+        )
+    )
+    local_session.commit()
+    return local_session
+
+
+def test_aensure_valid_skips_refresh_for_valid_token(token_manager, local_session):
+    # Arrange
+    user_info = refreshed(expired_user_info())
+    # Act
+    result = asyncio.run(
+        token_manager.aensure_valid(
+            user_info, refresh=arefreshed, bind=local_session.get_bind()
+        )
+    )
+    # Assert
+    assert result == user_info
+    assert token_manager.refresh_count == 0
+
+
+def test_aensure_valid_single_flight(token_manager, seeded_session):
+    # Arrange
+    calls = []
+
+    async def refresh(user_info):
+        calls.append(user_info)
+        await asyncio.sleep(0.02)
+        return refreshed(user_info)
+
+    async def check_auth_concurrently():
+        return await asyncio.gather(
+            *[
+                token_manager.aensure_valid(
+                    expired_user_info(),
+                    refresh=refresh,
+                    bind=seeded_session.get_bind(),
+                )
+                for _ in range(10)
+            ]
+        )
+
+    # Act
+    results = asyncio.run(check_auth_concurrently())
+    # Assert
+    assert len(calls) == 1
+    assert {result.access_token for result in results} == {"new"}
+    assert token_manager.refresh_count == 1
+
+
+def test_aensure_valid_uses_token_refreshed_by_other_worker(
+    token_manager, seeded_session
+):
+    # Arrange
+    other_worker_token = refreshed(expired_user_info())
+    seeded_session.get(models.StravaUserInfo, 123).access_token = "new"
+    seeded_session.get(
+        models.StravaUserInfo, 123
+    ).expires_at = other_worker_token.expires_at.isoformat()
+    seeded_session.commit()
+
+    async def refresh(user_info):
+        pytest.fail("token was refreshed again")
+
+    # Act
+    result = asyncio.run(
+        token_manager.aensure_valid(
+            expired_user_info(), refresh=refresh, bind=seeded_session.get_bind()
+        )
+    )
+    # Assert
+    assert result.access_token == "new"
+    assert token_manager.refresh_count == 0
+
+
+def test_aensure_valid_compare_and_swap(token_manager, seeded_session):
+    # Arrange
+    async def refresh(user_info):
+        # another worker swaps the token while this one is refreshing
+        seeded_session.get(models.StravaUserInfo, 123).access_token = "other"
+        seeded_session.commit()
+        return refreshed(user_info)
+
+    # Act
+    result = asyncio.run(
+        token_manager.aensure_valid(
+            expired_user_info(), refresh=refresh, bind=seeded_session.get_bind()
+        )
+    )
+    # Assert
+    assert result.access_token == "other"
+
+
+def test_get_cached_evicts_least_recently_used():
+    # Arrange
+    token_manager = TokenManager(
+        model_type=models.StravaUserInfo, schema_type=schemas.StravaUserInfo, maxsize=2
+    )
+    first, second, third = [
+        refreshed(expired_user_info()).copy(update={"id": id}) for id in (1, 2, 3)
+    ]
+    token_manager.get_cached(first)
+    token_manager.get_cached(second)
+    token_manager.get_cached(first.copy(update={"expires_at": EXPIRED}))
+    # Act
+    token_manager.get_cached(third)
+    # Assert
+    assert token_manager.get_cached(first.copy(update={"expires_at": EXPIRED}))
+    assert token_manager.get_cached(second.copy(update={"expires_at": EXPIRED})) is None
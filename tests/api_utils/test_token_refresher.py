@@ -0,0 +1,144 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.orm import sessionmaker
+
+from app.api_utils.token_refresher import TokenRefresher
+from app.spotify import models as spotify_models
+from app.spotify.client import AsyncSpotifyAPIService
+from app.spotify.schemas import SpotifyAuth
+from app.strava import models as strava_models
+from app.strava.client import AsyncStravaAPIService
+from app.strava.schemas import StravaAuth
+
+
+def test_run_once_refreshes_expiring_tokens(local_session, mocker):
+    # Arrange
+    now = datetime.now(timezone.utc)
+    local_session.add_all(
+        [
+            strava_models.StravaUserInfo(
+                id=1,
+                user_id=1,
+                access_token="old",
+                refresh_token="refresh",
+                expires_at=(now + timedelta(minutes=5)).isoformat(),
+            ),
+            strava_models.StravaUserInfo(
+                id=2,
+                user_id=2,
+                access_token="old",
+                refresh_token="refresh",
+                expires_at=(now + timedelta(hours=5)).isoformat(),
+            ),
+            spotify_models.SpotifyUserInfo(
+                id="3",
+                user_id=3,
+                access_token="old",
+                refresh_token="refresh",
+                expires_at=(now - timedelta(minutes=5)).isoformat(),
+            ),
+        ]
+    )
+    local_session.commit()
+    new_expires_at = now + timedelta(hours=6)
+    strava_refresh = mocker.patch.object(
+        AsyncStravaAPIService,
+        "refresh_token",
+        return_value=StravaAuth(
+            access_token="new", refresh_token="refresh", expires_at=new_expires_at
+        ),
+    )
+    spotify_refresh = mocker.patch.object(
+        AsyncSpotifyAPIService,
+        "refresh_token",
+        return_value=SpotifyAuth(
+            access_token="new", refresh_token="refresh", expires_at=new_expires_at
+        ),
+    )
+    refresher = TokenRefresher(
+        [AsyncStravaAPIService, AsyncSpotifyAPIService],
+        session_factory=sessionmaker(bind=local_session.get_bind()),
+        horizon=timedelta(minutes=10),
+        batch_size=1,
+    )
+    # Act
+    result = asyncio.run(refresher.run_once())
+    # Assert
+    assert result == 2
+    strava_refresh.assert_called_once()
+    spotify_refresh.assert_called_once()
+    local_session.expire_all()
+    assert local_session.get(strava_models.StravaUserInfo, 1).access_token == "new"
+    assert local_session.get(strava_models.StravaUserInfo, 2).access_token == "old"
+    assert local_session.get(spotify_models.SpotifyUserInfo, "3").access_token == "new"
+
+
+def test_run_once_skips_long_expired_tokens(local_session, mocker):
+    # Arrange
+    now = datetime.now(timezone.utc)
+    local_session.add(
+        strava_models.StravaUserInfo(
+            id=1,
+            user_id=1,
+            access_token="old",
+            refresh_token="revoked",
+            expires_at=(now - timedelta(days=3)).isoformat(),
+        )
+    )
+    local_session.commit()
+    strava_refresh = mocker.patch.object(AsyncStravaAPIService, "refresh_token")
+    refresher = TokenRefresher(
+        [AsyncStravaAPIService],
+        session_factory=sessionmaker(bind=local_session.get_bind()),
+        max_expired=timedelta(days=1),
+    )
+    # Act
+    result = asyncio.run(refresher.run_once())
+    # Assert
+    assert result == 0
+    strava_refresh.assert_not_called()
+
+
+def test_run_once_limits_concurrency(local_session, mocker):
+    # Arrange
+    expires_at = datetime.now(timezone.utc) + timedelta(minutes=5)
+    local_session.add_all(
+        [
+            strava_models.StravaUserInfo(
+                id=id,
+                user_id=id,
+                access_token="old",
+                refresh_token="refresh",
+                expires_at=expires_at.isoformat(),
+            )
+            for id in range(10)
+        ]
+    )
+    local_session.commit()
+    in_flight = 0
+    max_in_flight = 0
+
+    async def refresh_token(self):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return StravaAuth(
+            access_token=f"new{self.user_info.id}",
+            refresh_token="refresh",
+            expires_at=expires_at + timedelta(hours=6),
+        )
+
+    mocker.patch.object(AsyncStravaAPIService, "refresh_token", refresh_token)
+    refresher = TokenRefresher(
+        [AsyncStravaAPIService],
+        session_factory=sessionmaker(bind=local_session.get_bind()),
+        concurrency=3,
+    )
+    # Act
+    result = asyncio.run(refresher.run_once())
+    # Assert
+    assert result == 10
+    assert max_in_flight == 3
@@ -0,0 +1,61 @@
+"""Local stand-in for an Auth0 JWKS endpoint"""
+import json
+import time
+from typing import Optional
+
+import jwt
+import requests
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from app.auth.config import Auth0Config
+
+DOMAIN = "test.auth0.com"
+JWKS_URL = f"https://{DOMAIN}/.well-known/jwks.json"
+AUDIENCE = "https://api.test.com"
+ISSUER = f"https://{DOMAIN}/"
+CONFIG = Auth0Config(DOMAIN=DOMAIN, API_AUDIENCE=AUDIENCE, ISSUER=ISSUER)
+
+
+class JWKSStub:
+    """
+    Holds RSA signing keys, serves them as a JWKS document and issues tokens
+    """
+
+    def __init__(self, kids: tuple[str, ...] = ("key-1",)) -> None:
+        self.keys = {kid: self._generate_key() for kid in kids}
+        self.fetch_count = 0
+        # anything other than 200 is raised like fetch_jwks does
+        self.status_code = 200
+
+    @staticmethod
+    def _generate_key() -> rsa.RSAPrivateKey:
+        return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+    def rotate(self, kid: str) -> None:
+        self.keys[kid] = self._generate_key()
+
+    def fetch(self, url: str) -> dict:
+        assert url == JWKS_URL
+        self.fetch_count += 1
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.url = url
+        response.raise_for_status()
+        jwks = []
+        for kid, key in self.keys.items():
+            jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(key.public_key()))
+            jwks.append({**jwk, "kid": kid, "use": "sig", "alg": "RS256"})
+        return {"keys": jwks}
+
+    def issue_token(
+        self, sub: str = "123", kid: str = "key-1", exp: Optional[int] = None
+    ) -> str:
+        payload = {
+            "sub": sub,
+            "aud": AUDIENCE,
+            "iss": ISSUER,
+            "exp": exp if exp is not None else int(time.time()) + 3600,
+        }
+        return jwt.encode(
+            payload, self.keys[kid], algorithm="RS256", headers={"kid": kid}
+        )
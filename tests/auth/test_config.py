@@ -0,0 +1,115 @@
+import os
+import time
+
+import pytest
+
+from app.auth.config import Auth0Config, ConfigStore, load_config
+from app.auth.token_cache import get_verified_token_cache
+
+CONFIG_FILE = """
+[AUTH0]
+DOMAIN = {domain}
+API_AUDIENCE = https://api.test.com
+ISSUER = https://{domain}/
+ALGORITHMS = RS256
+"""
+
+
+@pytest.fixture(name="config_path")
+def fixture_config_path(tmp_path, monkeypatch):
+    monkeypatch.delenv("ENV", raising=False)
+    path = tmp_path / ".config"
+    path.write_text(CONFIG_FILE.format(domain="first.auth0.com"))
+    return path
+
+
+def test_load_config_from_file(config_path):
+    # Act
+    config = load_config(str(config_path))
+    # Assert
+    assert config == Auth0Config(
+        DOMAIN="first.auth0.com",
+        API_AUDIENCE="https://api.test.com",
+        ISSUER="https://first.auth0.com/",
+        ALGORITHMS=["RS256"],
+    )
+    assert config.jwks_url == "https://first.auth0.com/.well-known/jwks.json"
+
+
+def test_load_config_from_env(monkeypatch):
+    # Arrange
+    monkeypatch.setenv("ENV", "prod")
+    monkeypatch.setenv("DOMAIN", "env.auth0.com")
+    monkeypatch.setenv("ALGORITHMS", "RS256,ES256")
+    # Act
+    config = load_config()
+    # Assert
+    assert config.DOMAIN == "env.auth0.com"
+    assert config.ALGORITHMS == ["RS256", "ES256"]
+
+
+def test_load_config_missing_section(tmp_path, monkeypatch):
+    # Arrange
+    monkeypatch.delenv("ENV", raising=False)
+    # Act / Assert
+    with pytest.raises(ValueError):
+        load_config(str(tmp_path / "missing"))
+
+
+def test_config_store_reads_file_once(config_path, mocker):
+    # Arrange
+    store = ConfigStore(str(config_path))
+    read = mocker.spy(Auth0Config, "parse_obj")
+    # Act
+    configs = [store.get() for _ in range(5)]
+    # Assert
+    assert all(config is configs[0] for config in configs)
+    assert read.call_count == 1
+
+
+def test_config_store_reload_if_changed(config_path):
+    # Arrange
+    store = ConfigStore(str(config_path))
+    store.get()
+    config_path.write_text(CONFIG_FILE.format(domain="second.auth0.com"))
+    os.utime(config_path, (0, 0))
+    # Act
+    reloaded = store.reload_if_changed()
+    unchanged = store.reload_if_changed()
+    # Assert
+    assert reloaded is True
+    assert unchanged is False
+    assert store.get().DOMAIN == "second.auth0.com"
+
+
+def test_config_store_reload_clears_verified_tokens(config_path):
+    # Arrange
+    store = ConfigStore(str(config_path))
+    store.get()
+    cache = get_verified_token_cache()
+    cache.put("token", {"exp": time.time() + 60})
+    # Act
+    store.reload()
+    # Assert
+    assert cache.get("token") is None
+
+
+def test_config_store_keeps_config_on_invalid_reload(config_path):
+    # Arrange
+    store = ConfigStore(str(config_path))
+    store.get()
+    config_path.write_text("[OTHER]\n")
+    os.utime(config_path, (0, 0))
+    # Act
+    reloaded = store.reload_if_changed()
+    # Assert
+    assert reloaded is False
+    assert store.get().DOMAIN == "first.auth0.com"
+
+
+def test_config_is_immutable(config_path):
+    # Arrange
+    config = ConfigStore(str(config_path)).get()
+    # Act / Assert
+    with pytest.raises(TypeError):
+        config.DOMAIN = "other.auth0.com"
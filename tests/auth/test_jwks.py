@@ -0,0 +1,123 @@
+import threading
+
+import jwt
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.auth.jwks import JWKSCache
+from app.auth.utils import get_current_user_id, verify_token
+from tests.auth.jwks_stub import CONFIG, JWKS_URL, JWKSStub
+
+
+@pytest.fixture(name="jwks_stub")
+def fixture_jwks_stub():
+    return JWKSStub(kids=("key-1", "key-2"))
+
+
+def test_get_signing_key_fetches_once(jwks_stub):
+    # Arrange
+    cache = JWKSCache(JWKS_URL, fetch=jwks_stub.fetch)
+    # Act
+    for _ in range(5):
+        cache.get_signing_key_from_jwt(jwks_stub.issue_token(kid="key-1"))
+        cache.get_signing_key_from_jwt(jwks_stub.issue_token(kid="key-2"))
+    # Assert
+    assert jwks_stub.fetch_count == 1
+
+
+def test_get_signing_key_refetches_on_kid_miss(jwks_stub):
+    # Arrange
+    cache = JWKSCache(JWKS_URL, min_refetch_interval=0, fetch=jwks_stub.fetch)
+    cache.refresh()
+    jwks_stub.keys["key-3"] = jwks_stub._generate_key()
+    # Act
+    key = cache.get_signing_key_from_jwt(jwks_stub.issue_token(kid="key-3"))
+    # Assert
+    assert key.key_id == "key-3"
+    assert jwks_stub.fetch_count == 2
+
+
+def test_get_signing_key_rate_limits_kid_miss(jwks_stub):
+    # Arrange
+    cache = JWKSCache(JWKS_URL, min_refetch_interval=60, fetch=jwks_stub.fetch)
+    cache.refresh()
+    # Act
+    for _ in range(5):
+        with pytest.raises(jwt.exceptions.PyJWKClientError):
+            cache.get_signing_key("unknown")
+    # Assert
+    assert jwks_stub.fetch_count == 1
+
+
+def test_get_signing_key_refreshes_expired_keys_in_background(jwks_stub):
+    # Arrange
+    release = threading.Event()
+    refreshed = threading.Event()
+
+    def slow_fetch(url):
+        if jwks_stub.fetch_count:
+            release.wait(timeout=5)
+        jwks = jwks_stub.fetch(url)
+        if jwks_stub.fetch_count > 1:
+            refreshed.set()
+        return jwks
+
+    cache = JWKSCache(JWKS_URL, ttl=0, fetch=slow_fetch)
+    cache.refresh()
+    stale_key = cache.get_signing_key("key-1")
+    jwks_stub.rotate("key-1")
+    # Act
+    key = cache.get_signing_key("key-1")
+    release.set()
+    refreshed.wait(timeout=5)
+    # Assert
+    assert key is stale_key
+    assert jwks_stub.fetch_count == 2
+
+
+def test_verify_token_uses_cached_keys(jwks_stub, mocker):
+    # Arrange
+    cache = JWKSCache(JWKS_URL, fetch=jwks_stub.fetch)
+    mocker.patch("app.auth.utils.get_jwks_cache", return_value=cache)
+    # Act
+    payloads = [
+        verify_token(token=jwks_stub.issue_token(sub="123"), config=CONFIG)
+        for _ in range(3)
+    ]
+    # Assert
+    assert [payload["sub"] for payload in payloads] == ["123", "123", "123"]
+    assert jwks_stub.fetch_count == 1
+
+
+def test_verify_token_accepts_bearer_credentials(jwks_stub, mocker):
+    # Arrange
+    cache = JWKSCache(JWKS_URL, fetch=jwks_stub.fetch)
+    mocker.patch("app.auth.utils.get_jwks_cache", return_value=cache)
+    credentials = HTTPAuthorizationCredentials(
+        scheme="Bearer", credentials=jwks_stub.issue_token(sub="123")
+    )
+    # Act
+    payload = verify_token(token=credentials, config=CONFIG)
+    # Assert
+    assert payload["sub"] == "123"
+
+
+def test_get_signing_key_wraps_fetch_errors(jwks_stub):
+    # Arrange
+    jwks_stub.status_code = 503
+    cache = JWKSCache(JWKS_URL, fetch=jwks_stub.fetch)
+    # Act / Assert
+    with pytest.raises(jwt.exceptions.PyJWKClientError):
+        cache.get_signing_key_from_jwt(jwks_stub.issue_token(kid="key-1"))
+
+
+def test_get_current_user_id_rejects_when_jwks_unavailable(jwks_stub, mocker):
+    # Arrange
+    jwks_stub.status_code = 503
+    cache = JWKSCache(JWKS_URL, fetch=jwks_stub.fetch)
+    mocker.patch("app.auth.utils.get_jwks_cache", return_value=cache)
+    # Act / Assert
+    with pytest.raises(HTTPException) as error:
+        get_current_user_id(token=jwks_stub.issue_token(), config=CONFIG)
+    assert error.value.status_code == 400
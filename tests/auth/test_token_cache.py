@@ -0,0 +1,93 @@
+import jwt
+import pytest
+
+from app.auth.jwks import JWKSCache
+from app.auth.token_cache import VerifiedTokenCache, get_verified_token_cache
+from app.auth.utils import verify_token
+from tests.auth.jwks_stub import CONFIG, JWKS_URL, JWKSStub
+
+
+class FakeClock:
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_get_returns_payload_until_exp():
+    # Arrange
+    clock = FakeClock(1000)
+    cache = VerifiedTokenCache(clock=clock)
+    cache.put("token", {"sub": "123", "exp": 1100})
+    # Act
+    before_exp = cache.get("token")
+    clock.now = 1100
+    after_exp = cache.get("token")
+    # Assert
+    assert before_exp == {"sub": "123", "exp": 1100}
+    assert after_exp is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [{"sub": "123"}, {"sub": "123", "exp": 900}],
+    ids=["No exp", "Expired"],
+)
+def test_put_skips_payloads_without_future_exp(payload):
+    # Arrange
+    cache = VerifiedTokenCache(clock=FakeClock(1000))
+    # Act
+    cache.put("token", payload)
+    # Assert
+    assert cache.stats().size == 0
+
+
+def test_put_evicts_least_recently_used():
+    # Arrange
+    cache = VerifiedTokenCache(maxsize=2, clock=FakeClock(1000))
+    cache.put("a", {"sub": "a", "exp": 2000})
+    cache.put("b", {"sub": "b", "exp": 2000})
+    cache.get("a")
+    # Act
+    cache.put("c", {"sub": "c", "exp": 2000})
+    # Assert
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+
+
+def test_verify_token_skips_verification_on_hit(mocker):
+    # Arrange
+    jwks_stub = JWKSStub()
+    mocker.patch(
+        "app.auth.utils.get_jwks_cache",
+        return_value=JWKSCache(JWKS_URL, fetch=jwks_stub.fetch),
+    )
+    token = jwks_stub.issue_token(sub="123")
+    verify_token(token=token, config=CONFIG)
+    decode = mocker.spy(jwt, "decode")
+    # Act
+    payload = verify_token(token=token, config=CONFIG)
+    # Assert
+    assert payload["sub"] == "123"
+    decode.assert_not_called()
+    assert get_verified_token_cache().stats().hits == 1
+
+
+def test_health_auth(test_client):
+    # Arrange
+    get_verified_token_cache().put("token", {"sub": "123", "exp": 2**40})
+    get_verified_token_cache().get("token")
+    # Act
+    response = test_client.get("/health/auth")
+    # Assert
+    assert response.status_code == 200
+    assert response.json() == {
+        "size": 1,
+        "maxsize": 1024,
+        "hits": 1,
+        "misses": 0,
+        "hit_ratio": 1.0,
+    }
@@ -1,10 +1,12 @@
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 
 from app import settings
-from app.database.database import get_session
+from app.database.database import get_async_session, get_session
 from app.persistable.models import Base
 
 settings.ENV_VARS = settings.EnvironmentVariables(
@@ -16,16 +18,25 @@ settings.ENV_VARS = settings.EnvironmentVariables(
     SPOTIFY_CLIENT_SECRET="lmnopqrstuv",
 )
 
+from app.auth.token_cache import get_verified_token_cache  # noqa: E402
 from app.main import app  # noqa: E402
+from app.spotify.client import TOKEN_MANAGER as SPOTIFY_TOKEN_MANAGER  # noqa: E402
+from app.strava.client import TOKEN_MANAGER as STRAVA_TOKEN_MANAGER  # noqa: E402
 
 # CONSTANTS
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+ASYNC_SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
 
 # TEST DB SETUP
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# every TestClient request runs on a new event loop, so connections aren't pooled
+async_engine = create_async_engine(ASYNC_SQLALCHEMY_DATABASE_URL, poolclass=NullPool)
+TestingAsyncSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False
+)
 
 
 @pytest.fixture(autouse=True)
@@ -36,6 +47,9 @@ def run_before_and_after_tests():
     yield
 
     Base.metadata.drop_all(bind=engine)
+    STRAVA_TOKEN_MANAGER.clear()
+    SPOTIFY_TOKEN_MANAGER.clear()
+    get_verified_token_cache().clear()
 
 
 def get_local_db():
@@ -51,7 +65,13 @@ def local_session():
     return next(get_local_db())
 
 
+async def get_local_async_db():
+    async with TestingAsyncSessionLocal() as session:
+        yield session
+
+
 app.dependency_overrides[get_session] = get_local_db
+app.dependency_overrides[get_async_session] = get_local_async_db
 
 
 @pytest.fixture(name="test_client")
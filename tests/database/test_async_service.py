@@ -0,0 +1,180 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.database.service import AsyncDatabaseService
+from app.persistable.models import Base
+from app.strava.models import StravaUserInfo as StravaUserInfoModel
+from app.strava.schemas import StravaUserInfo
+from app.user.models import User
+from app.user.schemas import UserCreate
+
+STRAVA_AUTH = {
+    "user_id": 1,
+    "refresh_token": "refresh",
+    "expires_at": datetime(2023, 7, 9, tzinfo=timezone.utc),
+}
+
+
+@pytest.fixture(name="run")
+def fixture_run(tmp_path):
+    """
+    Runs a coroutine against a fresh aiosqlite database, passing it a service
+    """
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'async.db'}", poolclass=NullPool
+    )
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    def run(test):
+        async def main():
+            async with engine.begin() as connection:
+                await connection.run_sync(Base.metadata.create_all)
+            async with session_factory() as session:
+                return await test(AsyncDatabaseService(session))
+
+        return asyncio.run(main())
+
+    return run
+
+
+def test_create_and_get(run):
+    # Arrange
+    async def test(service):
+        await service.create(input_schema=UserCreate(id=1), model_type=User)
+        return await service.get(id=1, model_type=User)
+
+    # Act
+    result = run(test)
+    # Assert
+    assert result is not None
+    assert result.id == 1
+
+
+def test_get_none(run):
+    # Act
+    result = run(lambda service: service.get(id=1, model_type=User))
+    # Assert
+    assert result is None
+
+
+def test_all(run):
+    # Arrange
+    async def test(service):
+        for id in range(1, 4):
+            await service.create(input_schema=UserCreate(id=id), model_type=User)
+        return await service.all(model_type=User, skip=1, limit=1)
+
+    # Act
+    result = run(test)
+    # Assert
+    assert [user.id for user in result] == [2]
+
+
+def test_merge(run):
+    # Arrange
+    async def test(service):
+        await service.merge(input_schema=UserCreate(id=1), model_type=User)
+        await service.merge(input_schema=UserCreate(id=1), model_type=User)
+        return await service.all(model_type=User)
+
+    # Act
+    result = run(test)
+    # Assert
+    assert [user.id for user in result] == [1]
+
+
+def test_delete(run):
+    # Arrange
+    async def test(service):
+        await service.create(input_schema=UserCreate(id=1), model_type=User)
+        deleted = await service.delete(id=1, model_type=User)
+        return deleted, await service.get(id=1, model_type=User)
+
+    # Act
+    deleted, result = run(test)
+    # Assert
+    assert deleted.id == 1
+    assert result is None
+
+
+def test_delete_none(run):
+    # Act
+    result = run(lambda service: service.delete(id=1, model_type=User))
+    # Assert
+    assert result is None
+
+
+def test_transaction_commits_once(run, mocker):
+    # Arrange
+    async def test(service):
+        commit = mocker.spy(service.session, "commit")
+        async with service.transaction():
+            await service.create(input_schema=UserCreate(id=1), model_type=User)
+            await service.merge(input_schema=UserCreate(id=2), model_type=User)
+        return commit.call_count, await service.all(model_type=User)
+
+    # Act
+    commits, result = run(test)
+    # Assert
+    assert commits == 1
+    assert [user.id for user in result] == [1, 2]
+
+
+def test_transaction_rolls_back(run):
+    # Arrange
+    async def test(service):
+        with pytest.raises(ValueError):
+            async with service.transaction():
+                await service.create(input_schema=UserCreate(id=1), model_type=User)
+                raise ValueError
+        return await service.all(model_type=User)
+
+    # Act
+    result = run(test)
+    # Assert
+    assert result == []
+
+
+def test_upsert(run):
+    # Arrange
+    async def test(service):
+        await service.upsert(input_schema=UserCreate(id=1), model_type=User)
+        upserted = await service.upsert(input_schema=UserCreate(id=1), model_type=User)
+        return upserted, await service.all(model_type=User)
+
+    # Act
+    upserted, result = run(test)
+    # Assert
+    assert upserted.id == 1
+    assert [user.id for user in result] == [1]
+
+
+def test_update_without_select(run):
+    # Arrange
+    async def test(service):
+        await service.create(
+            input_schema=StravaUserInfo(id=1, **STRAVA_AUTH, access_token="old"),
+            model_type=StravaUserInfoModel,
+        )
+        updated = await service.update(
+            id=1,
+            input_schema=StravaUserInfo(id=1, **STRAVA_AUTH, access_token="new"),
+            model_type=StravaUserInfoModel,
+            select_first=False,
+        )
+        unchanged = await service.update(
+            id=1,
+            input_schema=StravaUserInfo(id=1, **STRAVA_AUTH, access_token="new"),
+            model_type=StravaUserInfoModel,
+        )
+        return updated, unchanged
+
+    # Act
+    updated, unchanged = run(test)
+    # Assert
+    assert updated.access_token == "new"
+    assert unchanged is updated
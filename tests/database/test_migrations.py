@@ -0,0 +1,103 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import Session
+
+from app.database.migrations import (
+    add_missing_columns,
+    add_missing_indexes,
+    convert_string_datetime_columns,
+    migrate,
+)
+from app.persistable.models import Base
+from app.strava.models import StravaUserInfo
+
+
+def create_engine_with_table(tmp_path, table_ddl: str):
+    engine = create_engine(f"sqlite:///{tmp_path / 'migrations.db'}")
+    Base.metadata.create_all(bind=engine)
+    table_name = table_ddl.split()[2]
+    with engine.begin() as connection:
+        connection.execute(text(f"DROP TABLE {table_name}"))
+        connection.execute(text(table_ddl))
+    return engine
+
+
+def test_add_missing_columns(tmp_path):
+    # Arrange
+    engine = create_engine_with_table(
+        tmp_path, "CREATE TABLE strava_auth_state_param (id VARCHAR PRIMARY KEY)"
+    )
+    # Act
+    added = add_missing_columns(engine)
+    indexes_added = add_missing_indexes(engine)
+    # Assert
+    inspector = inspect(engine)
+    columns = {
+        column["name"] for column in inspector.get_columns("strava_auth_state_param")
+    }
+    assert added == ["strava_auth_state_param.created_at"]
+    assert "created_at" in columns
+    assert set(indexes_added) == {
+        "ix_strava_auth_state_param_id",
+        "ix_strava_auth_state_param_created_at",
+    }
+
+
+def test_convert_string_datetime_columns(tmp_path):
+    # Arrange
+    engine = create_engine_with_table(
+        tmp_path,
+        "CREATE TABLE strava_user_info (id INTEGER PRIMARY KEY, user_id INTEGER, "
+        "access_token VARCHAR, refresh_token VARCHAR, expires_at VARCHAR)",
+    )
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "INSERT INTO strava_user_info (id, expires_at) VALUES "
+                "(1, '2023-07-09T00:00:00'), (2, '2023-07-09T02:00:00+02:00')"
+            )
+        )
+    # Act
+    migrate(engine)
+    converted_again = convert_string_datetime_columns(engine)
+    # Assert
+    with Session(engine) as session:
+        expires_at = [
+            user_info.expires_at
+            for user_info in session.query(StravaUserInfo).order_by(StravaUserInfo.id)
+        ]
+        expiring = session.query(StravaUserInfo).filter(
+            StravaUserInfo.expires_at
+            <= datetime(2023, 7, 9, tzinfo=timezone.utc) + timedelta(minutes=1)
+        )
+        assert expiring.count() == 2
+    assert expires_at == [datetime(2023, 7, 9, tzinfo=timezone.utc)] * 2
+    assert converted_again == []
+    indexes = {
+        index["name"] for index in inspect(engine).get_indexes("strava_user_info")
+    }
+    assert "ix_strava_user_info_expires_at" in indexes
+
+
+def test_migrate_up_to_date(tmp_path):
+    # Arrange
+    engine = create_engine(f"sqlite:///{tmp_path / 'migrations.db'}")
+    Base.metadata.create_all(bind=engine)
+    # Act
+    added = add_missing_columns(engine)
+    converted = convert_string_datetime_columns(engine)
+    indexes_added = add_missing_indexes(engine)
+    # Assert
+    assert added == []
+    assert converted == []
+    assert indexes_added == []
+
+
+def test_migrate_creates_missing_tables(tmp_path):
+    # Arrange
+    engine = create_engine(f"sqlite:///{tmp_path / 'migrations.db'}")
+    # Act
+    migrate(engine)
+    # Assert
+    assert set(inspect(engine).get_table_names()) == set(Base.metadata.tables)
@@ -0,0 +1,111 @@
+import threading
+
+import pytest
+from sqlalchemy import create_engine, exc, text
+
+from app import settings
+from app.database.database import (
+    get_engine_options,
+    get_engine_pool_size,
+    get_pool_size,
+)
+from app.database.pool import InstrumentedAsyncAdaptedQueuePool, InstrumentedQueuePool
+
+
+@pytest.mark.parametrize(
+    "overrides,expected",
+    [
+        ({"DB_POOL_SIZING": "fixed"}, (5, 10)),
+        ({"DB_POOL_SIZING": "per_worker", "DB_WORKERS": 4}, (5, 17)),
+        ({"DB_POOL_SIZING": "per_worker", "DB_WORKERS": 30}, (3, 0)),
+    ],
+    ids=["Fixed", "Per Worker", "Per Worker Budget Below Pool Size"],
+)
+def test_get_pool_size(overrides, expected):
+    # Arrange
+    env_vars = settings.ENV_VARS.copy(update=overrides)
+    # Act
+    pool_size = get_pool_size(env_vars)
+    # Assert
+    assert pool_size == expected
+
+
+@pytest.mark.parametrize(
+    "overrides,expected_sync,expected_async",
+    [
+        ({"DB_POOL_SIZING": "fixed"}, (4, 8), (1, 2)),
+        ({"DB_POOL_SIZING": "fixed", "DB_ASYNC_POOL_SHARE": 0.5}, (2, 5), (2, 6)),
+        ({"DB_POOL_SIZING": "per_worker", "DB_WORKERS": 30}, (2, 0), (1, 0)),
+    ],
+    ids=["Default", "Even Split", "Per Worker Budget Below Pool Size"],
+)
+def test_get_engine_pool_size_splits_process_budget(
+    overrides, expected_sync, expected_async
+):
+    # Arrange
+    env_vars = settings.ENV_VARS.copy(update=overrides)
+    # Act
+    sync_pool_size = get_engine_pool_size(env_vars)
+    async_pool_size = get_engine_pool_size(env_vars, is_async=True)
+    # Assert
+    assert sync_pool_size == expected_sync
+    assert async_pool_size == expected_async
+    assert sum(sync_pool_size) + sum(async_pool_size) == sum(get_pool_size(env_vars))
+
+
+def test_get_engine_options_async_pool():
+    # Act
+    options = get_engine_options(settings.ENV_VARS, is_async=True)
+    # Assert
+    assert options["poolclass"] is InstrumentedAsyncAdaptedQueuePool
+
+
+def test_get_engine_options_disables_echo_by_default():
+    # Act
+    options = get_engine_options(settings.ENV_VARS)
+    # Assert
+    assert options["echo"] is False
+    assert options["poolclass"] is InstrumentedQueuePool
+
+
+def test_instrumented_pool_records_checkouts_and_timeouts(tmp_path):
+    # Arrange
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.1,
+    )
+    connection = engine.connect()
+    connection.execute(text("SELECT 1"))
+    # Act
+    errors = []
+
+    def checkout():
+        try:
+            engine.connect()
+        except exc.TimeoutError as error:
+            errors.append(error)
+
+    thread = threading.Thread(target=checkout)
+    thread.start()
+    thread.join()
+    stats = engine.pool.stats()
+    connection.close()
+    # Assert
+    assert len(errors) == 1
+    assert stats.checkouts == 2
+    assert stats.timeouts == 1
+    assert stats.checked_out == 1
+    assert stats.max_wait_seconds >= 0.1
+
+
+def test_health_db(test_client):
+    # Act
+    response = test_client.get("/health/db")
+    # Assert
+    assert response.status_code == 200
+    assert [pool["engine"] for pool in response.json()] == ["sync", "async"]
+    for pool in response.json():
+        assert set(pool) >= {"checkouts", "timeouts", "max_wait_seconds"}
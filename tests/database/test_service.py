@@ -1,9 +1,23 @@
+from datetime import datetime, timezone
 from typing import Optional
 
-from sqlalchemy import Column, Integer, String
+import pytest
+from sqlalchemy import Column, Integer, String, event
+from sqlalchemy.dialects import postgresql
 
 from app.database.service import DatabaseService
+from app.database.statements import build_upsert
 from app.persistable.models import Persistable
+from app.strava.models import StravaUserInfo as StravaUserInfoModel
+from app.strava.schemas import StravaUserInfo
+from app.user.models import User
+from app.user.schemas import UserCreate
+
+STRAVA_AUTH = {
+    "user_id": 1,
+    "refresh_token": "refresh",
+    "expires_at": datetime(2023, 7, 9, tzinfo=timezone.utc),
+}
 
 
 class MockSchemaCreate:
@@ -193,3 +207,245 @@ def test_update_model_object_from_input(local_session):
     assert result.id == model_object.id
     assert result.name == "test2"
     assert result.other == "other"
+
+
+def test_transaction_commits_once(local_session, mocker):
+    """
+    Tests writes inside a transaction share one commit
+    """
+    # Arrange
+    service = DatabaseService(session=local_session)
+    commit = mocker.spy(local_session, "commit")
+    # Act
+    with service.transaction():
+        service.create(input_schema=UserCreate(id=1), model_type=User)
+        service.merge(input_schema=UserCreate(id=2), model_type=User)
+    # Assert
+    assert commit.call_count == 1
+    assert [user.id for user in local_session.query(User).all()] == [1, 2]
+
+
+def test_transaction_rolls_back(local_session):
+    """
+    Tests an exception inside a transaction discards every write
+    """
+    # Arrange
+    service = DatabaseService(session=local_session)
+    # Act
+    with pytest.raises(ValueError):
+        with service.transaction():
+            service.create(input_schema=UserCreate(id=1), model_type=User)
+            raise ValueError
+    # Assert
+    assert local_session.query(User).all() == []
+
+
+def test_bulk_create(local_session):
+    """
+    Tests bulk_create method
+    """
+    # Arrange
+    service = DatabaseService(session=local_session)
+    # Act
+    result = service.bulk_create(
+        input_schemas=[UserCreate(id=id) for id in range(1, 6)],
+        model_type=User,
+        batch_size=2,
+    )
+    # Assert
+    assert result == 5
+    assert local_session.query(User).count() == 5
+
+
+def test_bulk_upsert(local_session):
+    """
+    Tests bulk_upsert inserts new rows and updates existing ones
+    """
+    # Arrange
+    service = DatabaseService(session=local_session)
+    service.create(
+        input_schema=StravaUserInfo(id=1, **STRAVA_AUTH, access_token="old"),
+        model_type=StravaUserInfoModel,
+    )
+    # Act
+    result = service.bulk_upsert(
+        input_schemas=[
+            StravaUserInfo(id=id, **STRAVA_AUTH, access_token="new")
+            for id in range(1, 4)
+        ],
+        model_type=StravaUserInfoModel,
+    )
+    # Assert
+    local_session.expire_all()
+    rows = local_session.query(StravaUserInfoModel).order_by("id").all()
+    assert result == 3
+    assert [(row.id, row.access_token) for row in rows] == [
+        (1, "new"),
+        (2, "new"),
+        (3, "new"),
+    ]
+
+
+def test_bulk_upsert_postgres_statement():
+    """
+    Tests the upsert statement built for postgres
+    """
+    # Arrange
+    columns = ["id", "user_id", "access_token"]
+    # Act
+    statement = build_upsert(StravaUserInfoModel, columns, "postgresql")
+    # Assert
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert sql.endswith(
+        "ON CONFLICT (id) DO UPDATE SET user_id = excluded.user_id, access_token = excluded.access_token"
+    )
+
+
+def test_bulk_delete(local_session):
+    """
+    Tests bulk_delete method
+    """
+    # Arrange
+    service = DatabaseService(session=local_session)
+    service.bulk_create([UserCreate(id=id) for id in range(1, 6)], User)
+    # Act
+    result = service.bulk_delete(ids=[1, 2, 3, 99], model_type=User, batch_size=2)
+    # Assert
+    assert result == 3
+    assert [user.id for user in local_session.query(User).all()] == [4, 5]
+
+
+def test_upsert(local_session):
+    """
+    Tests upsert inserts, then updates with a single statement
+    """
+    # Arrange
+    service = DatabaseService(session=local_session)
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(local_session.get_bind(), "before_cursor_execute", record)
+    # Act
+    created = service.upsert(
+        input_schema=StravaUserInfo(id=1, **STRAVA_AUTH, access_token="old"),
+        model_type=StravaUserInfoModel,
+    )
+    updated = service.upsert(
+        input_schema=StravaUserInfo(id=1, **STRAVA_AUTH, access_token="new"),
+        model_type=StravaUserInfoModel,
+    )
+    event.remove(local_session.get_bind(), "before_cursor_execute", record)
+    # Assert
+    assert len(statements) == 2
+    assert all(statement.startswith("INSERT") for statement in statements)
+    assert created is updated
+    assert updated.access_token == "new"
+    assert local_session.query(StravaUserInfoModel).count() == 1
+
+
+def test_update_writes_changed_columns(local_session, mocker):
+    """
+    Tests update only writes changed columns and skips unchanged updates
+    """
+    # Arrange
+    service = DatabaseService(session=local_session)
+    service.create(
+        input_schema=StravaUserInfo(id=1, **STRAVA_AUTH, access_token="old"),
+        model_type=StravaUserInfoModel,
+    )
+    commit = mocker.spy(local_session, "commit")
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(local_session.get_bind(), "before_cursor_execute", record)
+    # Act
+    updated = service.update(
+        id=1,
+        input_schema=StravaUserInfo(id=1, **STRAVA_AUTH, access_token="new"),
+        model_type=StravaUserInfoModel,
+    )
+    unchanged = service.update(
+        id=1,
+        input_schema=StravaUserInfo(id=1, **STRAVA_AUTH, access_token="new"),
+        model_type=StravaUserInfoModel,
+    )
+    event.remove(local_session.get_bind(), "before_cursor_execute", record)
+    # Assert
+    (update_statement,) = [s for s in statements if s.startswith("UPDATE")]
+    assert "access_token" in update_statement
+    assert "refresh_token" not in update_statement
+    assert commit.call_count == 1
+    assert updated is unchanged
+    assert unchanged.access_token == "new"
+
+
+def test_update_without_select(local_session):
+    """
+    Tests update with select_first=False issues a single UPDATE
+    """
+    # Arrange
+    service = DatabaseService(session=local_session)
+    service.create(
+        input_schema=StravaUserInfo(id=1, **STRAVA_AUTH, access_token="old"),
+        model_type=StravaUserInfoModel,
+    )
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(local_session.get_bind(), "before_cursor_execute", record)
+    # Act
+    updated = service.update(
+        id=1,
+        input_schema=StravaUserInfo(id=1, **STRAVA_AUTH, access_token="new"),
+        model_type=StravaUserInfoModel,
+        select_first=False,
+    )
+    missing = service.update(
+        id=2,
+        input_schema=StravaUserInfo(id=2, **STRAVA_AUTH, access_token="new"),
+        model_type=StravaUserInfoModel,
+        select_first=False,
+    )
+    event.remove(local_session.get_bind(), "before_cursor_execute", record)
+    # Assert
+    assert len(statements) == 2
+    assert all(statement.startswith("UPDATE") for statement in statements)
+    assert updated is not None
+    assert updated.access_token == "new"
+    assert updated.expires_at == STRAVA_AUTH["expires_at"]
+    assert missing is None
+
+
+def test_upsert_primary_key_only(local_session):
+    """
+    Tests upsert returns the existing row for tables with only a primary key
+    """
+    # Arrange
+    service = DatabaseService(session=local_session)
+    service.create(input_schema=UserCreate(id=1), model_type=User)
+    # Act
+    result = service.upsert(input_schema=UserCreate(id=1), model_type=User)
+    # Assert
+    assert result.id == 1
+    assert local_session.query(User).count() == 1
+
+
+def test_query(local_session):
+    """
+    Tests query filters, orders and limits
+    """
+    # Arrange
+    service = DatabaseService(session=local_session)
+    service.bulk_create([UserCreate(id=id) for id in range(1, 6)], User)
+    # Act
+    result = service.query(
+        User, User.id > 2, order_by=[User.id.desc()], limit=2  # type: ignore
+    )
+    # Assert
+    assert [user.id for user in result] == [5, 4]
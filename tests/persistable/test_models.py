@@ -0,0 +1,64 @@
+from datetime import datetime, timezone
+
+from app.spotify.models import SpotifyUserInfo
+from app.strava.models import StravaUserInfo
+from app.user.models import User
+
+EXPIRES_AT = datetime(2023, 7, 9, tzinfo=timezone.utc)
+
+
+def make_user_info(**kwargs) -> StravaUserInfo:
+    values = dict(
+        id=1,
+        user_id=1,
+        access_token="access",
+        refresh_token="refresh",
+        expires_at=EXPIRES_AT,
+    )
+    values.update(kwargs)
+    return StravaUserInfo(**values)
+
+
+def test_eq():
+    # Arrange
+    user_info = make_user_info()
+    # Act
+    # Assert
+    assert user_info == make_user_info()
+    assert user_info != make_user_info(access_token="other")
+    assert user_info != make_user_info(expires_at=None)
+    assert user_info != SpotifyUserInfo(id=1)
+
+
+def test_eq_ignores_relationships(local_session):
+    # Arrange
+    local_session.add_all([User(id=1), make_user_info()])
+    local_session.commit()
+    user = local_session.get(User, 1)
+    # Act
+    user.strava_user_info
+    # Assert
+    assert user == User(id=1)
+
+
+def test_hash():
+    # Arrange
+    user_infos = {make_user_info(), make_user_info()}
+    # Act
+    # Assert
+    assert len(user_infos) == 1
+    assert make_user_info() in user_infos
+
+
+def test_diff():
+    # Arrange
+    user_info = make_user_info()
+    other = make_user_info(access_token="new", refresh_token=None)
+    # Act
+    changed = user_info.diff(other)
+    # Assert
+    assert changed == {
+        "access_token": ("access", "new"),
+        "refresh_token": ("refresh", None),
+    }
+    assert user_info.diff(make_user_info()) == {}
@@ -7,7 +7,7 @@ from app.user.models import User
 
 def test_login(test_client, mocker, local_session):
     # Arrange
-    mocker.patch("app.spotify.router.generate_auth_state", return_value="123")
+    mocker.patch("app.api_utils.auth_state.generate_auth_state", return_value="123")
     # Act
     response = test_client.get("/spotify/login?user_id=456")
     # Assert
@@ -15,9 +15,10 @@ def test_login(test_client, mocker, local_session):
         response.request.url
         == "https://accounts.spotify.com/authorize?response_type=code&client_id=0987654321&redirect_uri=https%3A%2F%2F123abctest.com%2Fspotify%2Fauthorization&scope=user-read-private+user-read-email+user-read-recently-played&state=123"
     )
-    assert local_session.query(SpotifyAuthStateParam).get(
-        "123"
-    ) == SpotifyAuthStateParam(id="123", user_id=456)
+    state_param = local_session.query(SpotifyAuthStateParam).get("123")
+    assert state_param is not None
+    assert state_param.user_id == 456
+    assert state_param.created_at is not None
 
 
 def test_authorization(test_client, mocker, local_session):
@@ -34,11 +35,11 @@ def test_authorization(test_client, mocker, local_session):
         expires_at=datetime(2023, 7, 9, 0, 0, 0, 0),
     )
     mocker.patch(
-        "app.spotify.router.SpotifyAPIService.exchange_code",
+        "app.spotify.router.AsyncSpotifyAPIService.exchange_code",
         return_value=spotify_token_response,
     )
     mocker.patch(
-        "app.spotify.router.SpotifyAPIService.get_user",
+        "app.spotify.router.AsyncSpotifyAPIService.get_user",
         return_value=SpotifyUserResponse(id="def"),
     )
     # Act
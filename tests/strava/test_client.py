@@ -0,0 +1,171 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from app import settings
+from app.api_utils.http_client import AsyncHTTPClient
+from app.strava import schemas
+from app.strava.client import AsyncStravaAPIService
+from app.strava.service import AsyncStravaService
+
+USER_INFO = schemas.StravaUserInfo(
+    id=123,
+    user_id=123,
+    access_token="abc",
+    refresh_token="def",
+    expires_at=datetime.now(timezone.utc) + timedelta(hours=1),
+)
+
+
+def test_async_get_activity(mocker):
+    # Arrange
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(
+            200,
+            json={"id": 456, "start_date": "2021-07-09T00:00:00Z", "description": ""},
+        )
+
+    mocker.patch(
+        "app.api_utils.service.get_async_http_client",
+        return_value=AsyncHTTPClient(transport=httpx.MockTransport(handler)),
+    )
+    service = AsyncStravaAPIService(USER_INFO, db_service=mocker.MagicMock())
+    # Act
+    result = asyncio.run(service.get_activity(456))
+    # Assert
+    assert result.id == 456
+    assert result.description == ""
+    [request] = requests
+    assert request.method == "GET"
+    assert str(request.url) == "https://www.strava.com/api/v3/activities/456"
+    assert request.headers["Authorization"] == "Bearer abc"
+
+
+def test_async_concurrent_requests(mocker):
+    # Arrange
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(
+            200,
+            json={"id": 456, "start_date": "2021-07-09T00:00:00Z", "description": ""},
+        )
+
+    mocker.patch(
+        "app.api_utils.service.get_async_http_client",
+        return_value=AsyncHTTPClient(transport=httpx.MockTransport(handler)),
+    )
+    service = AsyncStravaAPIService(USER_INFO, db_service=mocker.MagicMock())
+
+    async def get_activities():
+        return await asyncio.gather(*[service.get_activity(i) for i in range(100)])
+
+    # Act
+    results = asyncio.run(get_activities())
+    # Assert
+    assert len(results) == 100
+    assert max_in_flight == 100
+
+
+def test_async_get_max_heartrate_time_mark_streaming(mocker):
+    # Arrange
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(
+            200,
+            json={
+                "heartrate": {"data": [100, 160, 150]},
+                "time": {"data": [0, 5, 10]},
+            },
+        )
+
+    mocker.patch(
+        "app.api_utils.service.get_async_http_client",
+        return_value=AsyncHTTPClient(transport=httpx.MockTransport(handler)),
+    )
+    mocker.patch.object(settings.ENV_VARS, "STRAVA_STREAM_MODE", "streaming")
+    service = AsyncStravaService(
+        AsyncStravaAPIService(USER_INFO, db_service=mocker.MagicMock())
+    )
+    # Act
+    result = asyncio.run(service.get_max_hr_time_mark(456))
+    # Assert
+    assert result == timedelta(seconds=5)
+    [request] = requests
+    assert request.url.path == "/api/v3/activities/456/streams"
+    assert request.url.params["keys"] == "heartrate,time"
+    assert request.headers["Authorization"] == "Bearer abc"
+
+
+def test_async_get_max_heartrate_time_mark_streaming_time_first(mocker):
+    # Arrange
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(
+            200,
+            json={
+                "time": {"data": [0, 5, 10]},
+                "heartrate": {"data": [100, 160, 150]},
+            },
+        )
+
+    mocker.patch(
+        "app.api_utils.service.get_async_http_client",
+        return_value=AsyncHTTPClient(transport=httpx.MockTransport(handler)),
+    )
+    service = AsyncStravaAPIService(USER_INFO, db_service=mocker.MagicMock())
+    # Act
+    result = asyncio.run(service.get_max_heartrate_time_mark_for_activity(456))
+    # Assert
+    assert result == timedelta(seconds=5)
+    assert len(requests) == 2
+
+
+def test_async_get_max_heartrate_time_mark_streaming_closes_on_error(mocker):
+    # Arrange
+    closed = []
+
+    class Chunks(httpx.AsyncByteStream):
+        async def __aiter__(self):
+            # larger than STREAM_CHUNK_SIZE so parsing starts mid download
+            yield b'{"heartrate": {"data": [100, oops, ' + b"100, " * 20000
+            yield b"160]}}"
+
+        async def aclose(self):
+            closed.append(True)
+
+    class StreamingTransport(httpx.AsyncBaseTransport):
+        # MockTransport reads the whole body before handing the response over
+        async def handle_async_request(self, request):
+            return httpx.Response(200, stream=Chunks())
+
+    mocker.patch(
+        "app.api_utils.service.get_async_http_client",
+        return_value=AsyncHTTPClient(transport=StreamingTransport()),
+    )
+    service = AsyncStravaAPIService(USER_INFO, db_service=mocker.MagicMock())
+
+    async def get_time_mark():
+        with pytest.raises(ValueError):
+            await service.get_max_heartrate_time_mark_for_activity(456)
+        return list(closed)
+
+    # Act
+    closed_before_shutdown = asyncio.run(get_time_mark())
+    # Assert
+    assert closed_before_shutdown == [True]
@@ -0,0 +1,173 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.database.service import DatabaseService
+from app.spotify.client import AsyncSpotifyAPIService
+from app.spotify.models import SpotifyUserInfo
+from app.spotify.schemas import (
+    SpotifyArtist,
+    SpotifyPlayHistoryObject,
+    SpotifyRecentlyPlayedResponse,
+    SpotifyTrack,
+)
+from app.strava import schemas
+from app.strava.client import AsyncStravaAPIService
+from app.strava.handler import StravaWebhookHandler
+from app.strava.models import StravaUserInfo
+from app.user.models import User
+
+EVENT = schemas.StravaWebhookInput(
+    aspect_type=schemas.StravaAspectType.CREATE,
+    object_id=123,
+    object_type=schemas.StravaObjectType.ACTIVITY,
+    owner_id=123,
+)
+TRACK = SpotifyTrack(
+    id="123",
+    name="test",
+    duration_ms=10000,
+    artists=[SpotifyArtist(id="456", name="artist")],
+)
+
+
+@pytest.fixture(name="seeded_session")
+def fixture_seeded_session(local_session):
+    expires_at = (datetime.now(timezone.utc) + timedelta(hours=1)).isoformat()
+    local_session.add_all(
+        [
+            User(id=123),
+            StravaUserInfo(
+                id=123,
+                user_id=123,
+                access_token="123",
+                refresh_token="123",
+                expires_at=expires_at,
+            ),
+            SpotifyUserInfo(
+                id="123",
+                user_id=123,
+                access_token="123",
+                refresh_token="123",
+                expires_at=expires_at,
+            ),
+        ]
+    )
+    local_session.commit()
+    return local_session
+
+
+def test_handle_activity_create_fans_out(seeded_session, mocker):
+    # Arrange
+    in_flight: set[str] = set()
+    overlaps: list[set[str]] = []
+
+    def slow(name, return_value=None):
+        async def call(*args, **kwargs):
+            in_flight.add(name)
+            overlaps.append(set(in_flight))
+            await asyncio.sleep(0.02)
+            in_flight.discard(name)
+            return return_value
+
+        return call
+
+    mocker.patch.object(
+        AsyncStravaAPIService,
+        "get_activity",
+        slow(
+            "activity",
+            schemas.StravaActivity(
+                id=123, start_date=datetime(2021, 7, 9), description=""
+            ),
+        ),
+    )
+    mocker.patch.object(
+        AsyncStravaAPIService,
+        "get_stream_for_activity",
+        slow(
+            "stream",
+            schemas.StravaActivityStream(
+                heartrate=schemas.StravaActivityStreamData(data=[1, 2, 3]),
+                time=schemas.StravaActivityStreamData(data=[1, 2, 3]),
+            ),
+        ),
+    )
+    mocker.patch.object(AsyncStravaAPIService, "update_activity", slow("update"))
+    mocker.patch.object(
+        AsyncSpotifyAPIService,
+        "get_recenty_played",
+        slow(
+            "recently_played",
+            SpotifyRecentlyPlayedResponse(
+                next="",
+                items=[
+                    SpotifyPlayHistoryObject(
+                        played_at=datetime(2021, 7, 9, 0, 0, 5), track=TRACK
+                    )
+                ],
+            ),
+        ),
+    )
+    handler = StravaWebhookHandler(EVENT, DatabaseService(seeded_session))
+    # Act
+    result = asyncio.run(handler.handle())
+    # Assert
+    assert result.track == TRACK
+    assert {"activity", "stream"} in overlaps
+    assert set(result.timings) == {
+        "user",
+        "strava_auth",
+        "spotify_auth",
+        "activity",
+        "stream",
+        "recently_played",
+        "update_activity",
+        "total",
+    }
+
+
+def test_handle_activity_create_cancels_stream_on_failure(seeded_session, mocker):
+    # Arrange
+    cancelled = []
+
+    async def get_activity(*args, **kwargs):
+        raise ValueError("activity failed")
+
+    async def get_stream_for_activity(*args, **kwargs):
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append("stream")
+            raise
+
+    mocker.patch.object(AsyncStravaAPIService, "get_activity", get_activity)
+    mocker.patch.object(
+        AsyncStravaAPIService, "get_stream_for_activity", get_stream_for_activity
+    )
+    handler = StravaWebhookHandler(EVENT, DatabaseService(seeded_session))
+
+    async def handle():
+        with pytest.raises(ValueError):
+            await handler.handle()
+        # let the cancellation reach the stream download
+        await asyncio.sleep(0)
+        # asyncio.run would cancel leftover tasks itself, check before it returns
+        return list(cancelled)
+
+    # Act
+    cancelled_before_shutdown = asyncio.run(handle())
+    # Assert
+    assert cancelled_before_shutdown == ["stream"]
+
+
+def test_handle_ignores_other_events(local_session):
+    # Arrange
+    event = EVENT.copy(update={"aspect_type": schemas.StravaAspectType.DELETE})
+    handler = StravaWebhookHandler(event, DatabaseService(local_session))
+    # Act
+    result = asyncio.run(handler.handle())
+    # Assert
+    assert result.track is None
+    assert set(result.timings) == {"total"}
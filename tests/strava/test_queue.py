@@ -0,0 +1,191 @@
+import asyncio
+
+import pytest
+
+from app import settings
+from app.strava.queue import (
+    InMemoryWebhookQueue,
+    SQLiteWebhookQueue,
+    WebhookWorkerPool,
+    get_webhook_queue,
+)
+from app.strava.schemas import StravaAspectType, StravaObjectType, StravaWebhookInput
+
+EVENT = StravaWebhookInput(
+    aspect_type=StravaAspectType.CREATE,
+    object_id=123,
+    object_type=StravaObjectType.ACTIVITY,
+    owner_id=456,
+)
+
+
+class FakeClock:
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(name="clock")
+def fixture_clock():
+    return FakeClock(1000)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def webhook_queue(request, tmp_path, clock):
+    if request.param == "memory":
+        return InMemoryWebhookQueue(clock=clock)
+    return SQLiteWebhookQueue(
+        str(tmp_path / "queue.db"), poll_interval=0.01, clock=clock
+    )
+
+
+def test_put_get_ack(webhook_queue):
+    # Arrange
+    webhook_queue.put(EVENT)
+    # Act
+    job = webhook_queue.get()
+    webhook_queue.ack(job)
+    # Assert
+    assert job is not None
+    assert job.event == EVENT
+    assert job.attempts == 0
+    assert len(webhook_queue) == 0
+    assert webhook_queue.get() is None
+
+
+def test_retry(webhook_queue):
+    # Arrange
+    webhook_queue.put(EVENT)
+    job = webhook_queue.get()
+    # Act
+    webhook_queue.retry(job)
+    # Assert
+    retried_job = webhook_queue.get()
+    assert retried_job is not None
+    assert retried_job.id == job.id
+    assert retried_job.attempts == 1
+
+
+def test_retry_after_delay(webhook_queue, clock):
+    # Arrange
+    webhook_queue.put(EVENT)
+    job = webhook_queue.get()
+    webhook_queue.retry(job, delay=30)
+    # Act
+    before_delay = webhook_queue.get()
+    clock.now += 30
+    after_delay = webhook_queue.get()
+    # Assert
+    assert before_delay is None
+    assert after_delay is not None
+    assert after_delay.id == job.id
+    assert after_delay.attempts == 1
+
+
+def test_sqlite_queue_recovers_stale_claims(tmp_path):
+    # Arrange
+    path = str(tmp_path / "queue.db")
+    clock = FakeClock(1000)
+    SQLiteWebhookQueue(path, clock=clock).put(EVENT)
+    claimed = SQLiteWebhookQueue(path, visibility_timeout=60, clock=clock).get()
+    # Act
+    # another process starting up while the claim is held
+    while_claimed = SQLiteWebhookQueue(path, visibility_timeout=60, clock=clock).get()
+    clock.now = 1061
+    job = SQLiteWebhookQueue(path, visibility_timeout=60, clock=clock).get()
+    # Assert
+    assert claimed is not None
+    assert while_claimed is None
+    assert job is not None
+    assert job.id == claimed.id
+    assert job.event == EVENT
+
+
+def test_worker_pool_run_once(webhook_queue, mocker):
+    # Arrange
+    handler = mocker.MagicMock()
+    webhook_queue.put(EVENT)
+    pool = WebhookWorkerPool(webhook_queue, handler=handler)
+    # Act
+    result = pool.run_once()
+    # Assert
+    assert result is True
+    handler.assert_called_once_with(EVENT)
+    assert len(webhook_queue) == 0
+    assert pool.run_once() is False
+
+
+def test_worker_pool_run_once_fails_after_max_attempts(webhook_queue, mocker):
+    # Arrange
+    handler = mocker.MagicMock(side_effect=Exception("boom"))
+    webhook_queue.put(EVENT)
+    pool = WebhookWorkerPool(
+        webhook_queue, handler=handler, max_attempts=2, retry_backoff=0
+    )
+    # Act
+    pool.run_once()
+    pool.run_once()
+    # Assert
+    assert handler.call_count == 2
+    assert len(webhook_queue) == 0
+    assert webhook_queue.get() is None
+
+
+def test_worker_pool_run_once_backs_off(webhook_queue, clock, mocker):
+    # Arrange
+    handler = mocker.MagicMock(side_effect=Exception("boom"))
+    webhook_queue.put(EVENT)
+    pool = WebhookWorkerPool(
+        webhook_queue, handler=handler, max_attempts=3, retry_backoff=10
+    )
+    pool.run_once()
+    # Act
+    before_first_retry = pool.run_once()
+    clock.now += 10
+    first_retry = pool.run_once()
+    clock.now += 10
+    before_second_retry = pool.run_once()
+    clock.now += 10
+    second_retry = pool.run_once()
+    # Assert
+    assert [before_first_retry, first_retry] == [False, True]
+    assert [before_second_retry, second_retry] == [False, True]
+    assert handler.call_count == 3
+
+
+def test_receive_event_queue_mode(test_client, mocker):
+    # Arrange
+    mocker.patch.object(settings.ENV_VARS, "STRAVA_WEBHOOK_MODE", "queue")
+    handle = mocker.patch("app.strava.router.StravaWebhookHandler.handle")
+    webhook_queue = get_webhook_queue()
+    # Act
+    response = test_client.post("/strava/webhook", json=EVENT.dict())
+    # Assert
+    assert response.status_code == 200
+    assert response.json() is None
+    handle.assert_not_called()
+    job = webhook_queue.get()
+    assert job is not None
+    assert job.event == EVENT
+
+
+def test_receive_event_queue_mode_puts_off_the_event_loop(test_client, mocker):
+    # Arrange
+    mocker.patch.object(settings.ENV_VARS, "STRAVA_WEBHOOK_MODE", "queue")
+    loops = []
+
+    def put(event):
+        try:
+            loops.append(asyncio.get_running_loop())
+        except RuntimeError:
+            loops.append(None)
+        return 1
+
+    mocker.patch.object(get_webhook_queue(), "put", side_effect=put)
+    # Act
+    response = test_client.post("/strava/webhook", json=EVENT.dict())
+    # Assert
+    assert response.status_code == 200
+    assert loops == [None]
@@ -1,14 +1,15 @@
-from datetime import datetime
+from datetime import datetime, timezone
 
-from app.spotify.client import SpotifyAPIService
+from app.spotify.client import AsyncSpotifyAPIService
 from app.spotify.models import SpotifyUserInfo
 from app.spotify.schemas import (
+    SpotifyArtist,
     SpotifyPlayHistoryObject,
     SpotifyRecentlyPlayedResponse,
     SpotifyTrack,
 )
 from app.strava import schemas
-from app.strava.client import StravaAPIService
+from app.strava.client import AsyncStravaAPIService
 from app.strava.models import StravaAuthStateParam, StravaUserInfo
 from app.strava.schemas import StravaAthlete, StravaTokenResponse
 from app.user.models import User
@@ -16,7 +17,7 @@ from app.user.models import User
 
 def test_login(test_client, mocker, local_session):
     # Arrange
-    mocker.patch("app.strava.router.utils.generate_auth_state", return_value="123")
+    mocker.patch("app.api_utils.auth_state.generate_auth_state", return_value="123")
     # Act
     response = test_client.get("/strava/login")
     # Assert
@@ -24,9 +25,9 @@ def test_login(test_client, mocker, local_session):
         response.request.url
         == "http://www.strava.com/oauth/authorize?response_type=code&client_id=1234567890&redirect_uri=https%3A%2F%2F123abctest.com%2Fstrava%2Fauthorization&scope=activity%3Aread_all%2Cactivity%3Awrite&state=123&approval_prompt=force"
     )
-    assert local_session.query(StravaAuthStateParam).get("123") == StravaAuthStateParam(
-        id="123"
-    )
+    state_param = local_session.query(StravaAuthStateParam).get("123")
+    assert state_param is not None
+    assert state_param.created_at is not None
 
 
 def test_authorization(test_client, mocker, local_session):
@@ -48,7 +49,7 @@ def test_authorization(test_client, mocker, local_session):
         ),
     )
     mocker.patch(
-        "app.strava.router.StravaAPIService.exchange_code",
+        "app.strava.router.AsyncStravaAPIService.exchange_code",
         return_value=strava_token_response,
     )
     # Act
@@ -70,9 +71,7 @@ def test_authorization(test_client, mocker, local_session):
     assert strava_user_info.user_id == 123
     assert strava_user_info.access_token == "123"
     assert strava_user_info.refresh_token == "123"
-    assert strava_user_info.expires_at == datetime(2023, 7, 9, 0, 0, 0, 0).strftime(
-        "%Y-%m-%dT%H:%M:%S"
-    )
+    assert strava_user_info.expires_at == datetime(2023, 7, 9, tzinfo=timezone.utc)
 
 
 def test_authorization_403(test_client):
@@ -141,8 +140,8 @@ def test_receive_event(test_client, mocker, local_session):
         description="",
     )
     mocker.patch.object(
-        StravaAPIService,
-        StravaAPIService.get_activity.__name__,
+        AsyncStravaAPIService,
+        AsyncStravaAPIService.get_activity.__name__,
         return_value=strava_activity,
     )
     strava_activity_stream = schemas.StravaActivityStream(
@@ -150,26 +149,37 @@ def test_receive_event(test_client, mocker, local_session):
         time=schemas.StravaActivityStreamData(data=[1, 2, 3]),
     )
     mocker.patch.object(
-        StravaAPIService,
-        StravaAPIService.get_stream_for_activity.__name__,
+        AsyncStravaAPIService,
+        AsyncStravaAPIService.get_stream_for_activity.__name__,
         return_value=strava_activity_stream,
     )
-    mocker.patch.object(StravaAPIService, StravaAPIService.update_activity.__name__)
+    mocker.patch.object(
+        AsyncStravaAPIService, AsyncStravaAPIService.update_activity.__name__
+    )
+    mocker.patch.object(
+        AsyncStravaAPIService, AsyncStravaAPIService.check_auth.__name__
+    )
     # mock spotify api service
+    mocker.patch.object(
+        AsyncSpotifyAPIService, AsyncSpotifyAPIService.check_auth.__name__
+    )
     recently_played = SpotifyRecentlyPlayedResponse(
         next="",
         items=[
             SpotifyPlayHistoryObject(
                 played_at=datetime(2021, 7, 9, 0, 0, 5, 0),
                 track=SpotifyTrack(
-                    id="123", name="test", duration_ms=10000, href="test"
+                    id="123",
+                    name="test",
+                    duration_ms=10000,
+                    artists=[SpotifyArtist(id="456", name="artist")],
                 ),
             )
         ],
     )
     mocker.patch.object(
-        SpotifyAPIService,
-        SpotifyAPIService.get_recenty_played.__name__,
+        AsyncSpotifyAPIService,
+        AsyncSpotifyAPIService.get_recenty_played.__name__,
         return_value=recently_played,
     )
     # Act
@@ -188,5 +198,5 @@ def test_receive_event(test_client, mocker, local_session):
         "id": "123",
         "name": "test",
         "duration_ms": 10000,
-        "href": "test",
+        "artists": [{"id": "456", "name": "artist"}],
     }
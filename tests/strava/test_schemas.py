@@ -1,9708 +1,21 @@
+import json
+from array import array
 from datetime import timedelta
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
 
 from app.strava.schemas import StravaActivityStream
 
+ACTIVITY_STREAM_PATH = (
+    Path(__file__).parent.parent / "test_data" / "activity_stream.json"
+)
+
 
 def test_get_max_heartrate_time_mark():
     # Arrange
-    test_data = {
-        "distance": {
-            "data": [
-                0.0,
-                1.0,
-                1.9,
-                2.9,
-                3.8,
-                4.8,
-                5.8,
-                6.7,
-                7.7,
-                8.6,
-                9.6,
-                10.6,
-                11.5,
-                12.5,
-                13.5,
-                14.4,
-                15.4,
-                16.3,
-                17.3,
-                18.3,
-                19.2,
-                20.2,
-                21.1,
-                22.1,
-                27.1,
-                30.6,
-                37.9,
-                41.6,
-                43.2,
-                50.1,
-                54.3,
-                72.1,
-                99.3,
-                102.1,
-                114.1,
-                127.8,
-                130.1,
-                133.3,
-                133.3,
-                146.7,
-                150.9,
-                167.4,
-                180.5,
-                195.2,
-                216.7,
-                218.9,
-                221.9,
-                233.9,
-                253.0,
-                260.6,
-                264.4,
-                281.3,
-                293.3,
-                305.4,
-                317.4,
-                329.4,
-                356.8,
-                367.1,
-                375.5,
-                383.6,
-                392.8,
-                410.3,
-                418.0,
-                424.6,
-                437.8,
-                444.4,
-                450.8,
-                464.7,
-                472.0,
-                479.6,
-                495.2,
-                502.2,
-                518.3,
-                532.8,
-                539.5,
-                543.3,
-                550.8,
-                567.1,
-                570.3,
-                573.0,
-                573.9,
-                582.8,
-                582.8,
-                587.6,
-                594.6,
-                598.8,
-                614.1,
-                618.2,
-                623.3,
-                634.9,
-                639.1,
-                644.8,
-                648.3,
-                652.4,
-                657.1,
-                669.3,
-                683.2,
-                697.5,
-                707.5,
-                716.3,
-                724.2,
-                732.8,
-                750.8,
-                774.7,
-                794.1,
-                797.9,
-                802.3,
-                807.5,
-                824.8,
-                833.1,
-                841.6,
-                850.6,
-                859.5,
-                877.4,
-                886.1,
-                928.0,
-                936.5,
-                953.8,
-                983.1,
-                993.7,
-                1001.0,
-                1005.7,
-                1008.2,
-                1008.8,
-                1012.1,
-                1015.4,
-                1028.2,
-                1033.8,
-                1055.1,
-                1059.7,
-                1068.3,
-                1077.8,
-                1082.7,
-                1094.4,
-                1097.8,
-                1098.2,
-                1100.5,
-                1101.5,
-                1110.4,
-                1132.1,
-                1141.4,
-                1159.8,
-                1167.8,
-                1182.3,
-                1194.9,
-                1224.5,
-                1230.5,
-                1236.8,
-                1263.0,
-                1294.5,
-                1300.2,
-                1305.3,
-                1310.3,
-                1314.6,
-                1319.1,
-                1343.0,
-                1347.4,
-                1356.8,
-                1361.8,
-                1370.2,
-                1388.9,
-                1393.6,
-                1411.7,
-                1415.7,
-                1419.7,
-                1423.0,
-                1425.9,
-                1430.3,
-                1434.4,
-                1436.5,
-                1438.6,
-                1439.9,
-                1444.4,
-                1446.4,
-                1451.1,
-                1452.6,
-                1453.4,
-                1455.3,
-                1460.2,
-                1464.8,
-                1472.4,
-                1474.2,
-                1475.7,
-                1482.8,
-                1497.1,
-                1501.3,
-                1504.6,
-                1507.0,
-                1513.6,
-                1515.4,
-                1527.7,
-                1530.3,
-                1546.2,
-                1552.1,
-                1558.8,
-                1561.9,
-                1568.1,
-                1581.5,
-                1583.2,
-                1584.2,
-                1588.8,
-                1592.7,
-                1599.6,
-                1612.4,
-                1616.8,
-                1639.6,
-                1648.9,
-                1666.6,
-                1671.5,
-                1684.0,
-                1699.8,
-                1711.9,
-                1715.7,
-                1719.4,
-                1732.3,
-                1740.9,
-                1750.9,
-                1756.3,
-                1780.3,
-                1822.9,
-                1848.6,
-                1879.5,
-                1896.4,
-                1912.9,
-                1922.8,
-                1931.5,
-                1935.4,
-                1938.7,
-                1949.5,
-                1953.5,
-                1956.8,
-                1972.8,
-                1976.4,
-                1980.9,
-                1997.1,
-                2003.4,
-                2018.2,
-                2033.9,
-                2037.5,
-                2053.3,
-                2056.9,
-                2067.6,
-                2069.7,
-                2074.7,
-                2085.5,
-                2089.5,
-                2109.4,
-                2131.9,
-                2150.4,
-                2170.4,
-                2193.9,
-                2198.9,
-                2202.8,
-                2212.0,
-                2226.1,
-                2230.1,
-                2234.7,
-                2237.8,
-                2239.6,
-                2244.2,
-                2251.4,
-                2255.3,
-                2261.2,
-                2273.4,
-                2276.6,
-                2282.9,
-                2291.5,
-                2294.0,
-                2297.8,
-                2304.4,
-                2307.9,
-                2310.2,
-                2312.0,
-                2313.6,
-                2315.9,
-                2318.6,
-                2321.2,
-                2327.3,
-                2331.3,
-                2334.2,
-                2355.5,
-                2373.4,
-                2390.2,
-                2394.3,
-                2404.3,
-                2415.4,
-                2417.7,
-                2420.4,
-                2427.4,
-                2439.2,
-                2447.7,
-                2454.3,
-                2459.1,
-                2463.9,
-                2468.7,
-                2476.0,
-                2479.4,
-                2481.2,
-                2484.7,
-                2493.7,
-                2497.1,
-                2498.9,
-                2501.1,
-                2506.1,
-                2510.0,
-                2522.9,
-                2529.3,
-                2543.0,
-                2553.3,
-                2558.8,
-                2562.5,
-                2568.8,
-                2572.7,
-                2576.5,
-                2584.7,
-                2587.1,
-                2590.1,
-                2594.6,
-                2597.0,
-                2600.1,
-                2608.4,
-                2615.9,
-                2619.5,
-                2628.4,
-                2631.6,
-                2649.2,
-                2671.1,
-                2679.5,
-                2695.0,
-                2700.4,
-                2707.1,
-                2709.9,
-                2724.9,
-                2734.2,
-                2739.9,
-                2745.7,
-                2754.5,
-                2765.8,
-                2773.4,
-                2782.9,
-                2786.9,
-                2797.3,
-                2800.0,
-                2807.7,
-                2817.0,
-                2820.9,
-                2830.8,
-                2832.2,
-                2835.8,
-                2843.3,
-                2854.7,
-                2857.6,
-                2867.8,
-                2874.8,
-                2886.3,
-                2889.9,
-                2901.4,
-                2915.2,
-                2919.9,
-                2928.0,
-                2944.4,
-                2948.5,
-                2952.6,
-                2959.9,
-                2968.0,
-                2975.7,
-                2979.4,
-                2987.4,
-                2999.5,
-                3006.7,
-                3010.6,
-                3022.5,
-                3038.3,
-                3042.4,
-                3057.4,
-                3063.3,
-                3066.9,
-                3089.5,
-                3099.1,
-                3109.3,
-                3137.1,
-                3141.6,
-                3155.5,
-                3164.5,
-                3169.0,
-                3177.9,
-                3187.0,
-                3195.5,
-                3199.9,
-                3208.8,
-                3227.9,
-                3255.4,
-                3289.4,
-                3300.2,
-                3323.3,
-                3329.2,
-                3360.6,
-                3373.0,
-                3427.6,
-                3453.6,
-                3464.5,
-                3469.2,
-                3480.6,
-                3482.9,
-                3484.6,
-                3485.6,
-                3485.9,
-                3488.0,
-                3488.9,
-                3489.0,
-                3489.6,
-                3489.6,
-                3490.6,
-                3491.7,
-                3492.5,
-                3493.0,
-                3493.3,
-                3493.9,
-                3494.6,
-                3494.8,
-                3495.1,
-                3498.3,
-                3498.3,
-                3498.4,
-                3498.5,
-                3498.7,
-                3498.8,
-                3499.1,
-                3499.8,
-                3499.8,
-                3500.8,
-                3503.6,
-                3506.9,
-                3509.5,
-                3523.4,
-                3542.6,
-                3546.2,
-                3559.9,
-                3575.4,
-                3584.9,
-                3599.3,
-                3613.3,
-                3618.6,
-                3642.5,
-                3650.2,
-                3665.8,
-                3679.8,
-                3705.9,
-                3717.9,
-                3732.1,
-                3758.4,
-                3764.6,
-                3770.3,
-                3781.5,
-                3792.2,
-                3797.4,
-                3807.3,
-                3812.5,
-                3822.7,
-                3827.4,
-                3832.6,
-                3844.3,
-                3849.1,
-                3865.9,
-                3872.5,
-                3878.1,
-                3891.9,
-                3892.8,
-                3894.3,
-                3896.7,
-                3900.5,
-                3900.5,
-                3903.4,
-                3903.6,
-                3905.3,
-                3912.0,
-                3914.3,
-                3915.4,
-                3915.6,
-                3915.6,
-                3918.2,
-                3920.9,
-                3932.9,
-                3934.6,
-                3934.9,
-                3938.1,
-                3942.5,
-                3944.3,
-                3947.1,
-                3948.0,
-                3948.6,
-                3956.3,
-                3956.3,
-                3956.3,
-                3957.2,
-                3958.2,
-                3970.1,
-                3983.3,
-                3997.9,
-                4004.6,
-                4008.4,
-                4020.9,
-                4042.4,
-                4046.4,
-                4054.9,
-                4059.5,
-                4064.0,
-                4068.5,
-                4080.7,
-                4084.8,
-                4097.9,
-                4107.6,
-                4117.3,
-                4122.5,
-                4127.7,
-                4138.0,
-                4161.2,
-                4177.1,
-                4185.4,
-                4203.1,
-                4207.7,
-                4216.3,
-                4229.8,
-                4242.5,
-                4250.9,
-                4263.7,
-                4267.8,
-                4276.0,
-                4289.9,
-                4294.1,
-                4298.0,
-                4301.6,
-                4304.8,
-                4307.6,
-                4313.8,
-                4330.0,
-                4334.2,
-                4358.2,
-                4363.0,
-                4376.5,
-                4395.6,
-                4400.3,
-                4405.2,
-                4414.6,
-                4429.9,
-                4434.7,
-                4453.2,
-                4457.7,
-                4462.0,
-                4470.5,
-                4478.7,
-                4482.9,
-                4491.8,
-                4500.8,
-                4505.3,
-                4514.0,
-                4518.4,
-                4532.0,
-                4536.6,
-                4571.2,
-                4576.2,
-                4581.5,
-                4602.4,
-                4621.5,
-                4637.3,
-                4646.4,
-                4655.2,
-                4663.3,
-                4674.5,
-                4682.2,
-                4689.9,
-                4697.9,
-                4705.6,
-                4713.3,
-                4717.5,
-                4728.4,
-                4739.6,
-                4743.3,
-                4750.6,
-                4757.6,
-                4761.0,
-                4774.6,
-                4778.7,
-                4812.5,
-                4846.6,
-                4872.4,
-                4876.8,
-                4887.6,
-                4900.6,
-                4912.5,
-                4921.5,
-                4926.8,
-                4940.6,
-                4951.7,
-                4959.4,
-                4969.9,
-                4995.6,
-                5013.3,
-                5016.2,
-                5021.3,
-                5024.4,
-                5028.1,
-                5028.2,
-                5029.2,
-                5029.6,
-                5031.3,
-                5032.4,
-                5033.9,
-                5033.9,
-                5034.2,
-                5034.6,
-                5035.4,
-                5035.4,
-                5035.9,
-                5037.1,
-                5037.7,
-                5038.3,
-                5038.5,
-                5038.7,
-                5040.5,
-                5041.3,
-                5041.5,
-                5042.0,
-                5042.1,
-                5042.9,
-                5043.2,
-                5043.8,
-                5044.0,
-                5044.1,
-                5044.8,
-                5045.3,
-                5045.8,
-                5046.2,
-                5046.8,
-                5047.4,
-                5048.2,
-                5050.5,
-                5051.3,
-                5054.6,
-                5060.0,
-                5064.1,
-                5075.4,
-                5099.0,
-                5106.4,
-                5113.3,
-                5121.2,
-                5134.9,
-                5145.3,
-                5149.4,
-                5155.9,
-                5163.4,
-                5172.1,
-                5189.8,
-                5199.5,
-                5206.9,
-                5223.0,
-                5233.4,
-                5251.4,
-                5262.4,
-                5272.4,
-                5281.2,
-                5299.9,
-                5308.8,
-                5318.5,
-                5328.0,
-                5337.5,
-                5346.5,
-                5355.1,
-                5363.8,
-                5372.0,
-                5378.8,
-                5384.3,
-                5394.9,
-                5400.9,
-                5407.9,
-                5409.6,
-                5411.2,
-                5416.6,
-                5427.2,
-                5441.4,
-                5462.6,
-                5467.1,
-                5481.2,
-                5494.2,
-                5498.8,
-                5504.0,
-                5524.0,
-                5539.1,
-                5549.7,
-                5554.8,
-                5565.7,
-                5571.4,
-                5577.6,
-                5583.2,
-                5592.5,
-                5601.4,
-                5609.0,
-                5613.3,
-                5621.5,
-                5626.0,
-                5630.0,
-                5632.8,
-                5641.3,
-                5646.5,
-                5651.6,
-                5656.5,
-                5665.0,
-                5675.6,
-                5679.5,
-                5688.3,
-                5701.7,
-                5715.1,
-                5723.3,
-                5727.6,
-                5736.3,
-                5740.6,
-                5744.9,
-                5749.2,
-                5753.7,
-                5758.3,
-                5763.0,
-                5767.4,
-                5771.7,
-                5781.6,
-                5799.3,
-                5811.9,
-                5832.1,
-                5838.9,
-                5845.7,
-                5858.6,
-                5878.2,
-                5897.7,
-                5923.0,
-                5934.5,
-                5946.7,
-                5959.7,
-                5986.2,
-                6003.2,
-                6013.5,
-                6018.8,
-                6028.9,
-                6033.7,
-                6038.8,
-                6043.6,
-                6048.5,
-                6058.3,
-                6063.3,
-                6068.5,
-                6082.8,
-                6091.0,
-                6094.0,
-                6099.6,
-                6102.7,
-                6121.5,
-                6125.6,
-                6132.7,
-                6140.4,
-                6144.0,
-                6147.5,
-                6155.1,
-                6162.2,
-                6165.3,
-                6172.5,
-                6182.3,
-                6185.4,
-                6191.5,
-                6206.1,
-                6211.8,
-                6217.6,
-                6227.0,
-                6230.1,
-                6246.0,
-                6253.1,
-                6263.3,
-                6278.5,
-                6282.1,
-                6292.6,
-                6299.1,
-                6312.2,
-                6318.1,
-                6332.7,
-                6343.8,
-                6346.6,
-                6364.1,
-                6375.9,
-                6388.6,
-                6396.0,
-                6402.9,
-                6409.0,
-                6415.3,
-                6421.1,
-                6430.0,
-                6432.8,
-                6435.5,
-                6440.6,
-                6443.6,
-                6449.9,
-                6452.9,
-                6462.5,
-                6468.6,
-                6475.0,
-                6478.1,
-                6484.2,
-                6493.4,
-                6496.5,
-                6499.6,
-                6505.8,
-                6511.6,
-                6516.2,
-                6524.8,
-                6533.4,
-                6542.9,
-                6556.2,
-                6560.0,
-                6574.9,
-                6585.9,
-                6593.7,
-                6605.5,
-                6628.4,
-                6632.3,
-                6640.1,
-                6652.3,
-                6656.8,
-                6668.4,
-                6685.1,
-                6689.8,
-                6701.0,
-                6713.3,
-                6721.7,
-                6742.5,
-                6751.1,
-                6758.5,
-                6765.8,
-                6769.4,
-                6776.3,
-                6788.8,
-                6812.4,
-                6827.1,
-                6850.2,
-                6864.3,
-                6871.9,
-                6879.5,
-                6887.0,
-                6902.2,
-                6918.8,
-                6927.3,
-                6944.0,
-                6952.2,
-                6959.9,
-                6974.8,
-                6982.0,
-                6996.6,
-                7012.5,
-                7028.8,
-                7053.0,
-                7090.9,
-                7099.0,
-                7132.8,
-                7172.5,
-                7204.6,
-                7220.2,
-                7249.4,
-                7262.1,
-                7273.2,
-                7277.8,
-                7287.5,
-                7297.3,
-                7310.9,
-                7332.1,
-                7338.3,
-                7355.1,
-                7368.8,
-                7414.1,
-                7427.9,
-                7440.6,
-                7447.0,
-                7460.2,
-                7467.0,
-                7472.8,
-                7480.5,
-                7491.1,
-                7497.0,
-                7513.0,
-                7518.5,
-                7531.1,
-                7537.3,
-                7550.0,
-                7563.4,
-                7570.1,
-                7590.1,
-                7596.9,
-                7603.1,
-                7609.4,
-                7621.9,
-                7641.2,
-                7647.1,
-                7657.5,
-                7668.7,
-                7675.5,
-                7682.0,
-                7693.6,
-                7704.5,
-                7710.9,
-                7726.8,
-                7731.1,
-                7735.4,
-                7739.0,
-                7746.9,
-                7751.7,
-                7763.4,
-                7776.0,
-                7782.1,
-                7801.0,
-                7812.6,
-                7817.6,
-                7822.7,
-                7838.2,
-                7853.6,
-                7858.1,
-                7867.0,
-                7871.4,
-                7886.1,
-                7894.0,
-                7898.2,
-                7906.6,
-                7918.9,
-                7923.5,
-                7940.8,
-                7962.2,
-                7976.3,
-                7986.4,
-                7998.8,
-                8003.6,
-                8025.9,
-                8042.1,
-                8046.9,
-                8063.5,
-                8073.2,
-                8085.1,
-                8090.5,
-                8101.6,
-                8114.3,
-                8125.2,
-                8141.4,
-                8146.3,
-                8151.9,
-                8157.4,
-                8168.0,
-                8182.8,
-                8196.6,
-                8206.0,
-                8210.7,
-                8229.2,
-                8238.3,
-                8256.5,
-                8265.3,
-                8277.8,
-                8295.3,
-                8300.3,
-                8320.8,
-                8325.7,
-                8330.6,
-                8349.1,
-                8354.1,
-                8372.8,
-                8377.6,
-                8382.7,
-                8392.3,
-                8402.4,
-                8418.0,
-                8428.2,
-                8432.8,
-                8437.6,
-                8447.6,
-                8465.2,
-                8469.2,
-                8478.2,
-                8487.4,
-                8505.3,
-                8510.5,
-                8526.5,
-                8536.5,
-                8541.4,
-                8546.5,
-                8556.2,
-                8576.5,
-                8599.5,
-                8630.3,
-                8655.6,
-                8690.9,
-                8697.7,
-                8704.2,
-                8719.7,
-                8728.6,
-                8753.3,
-                8759.5,
-                8765.3,
-                8779.8,
-                8785.1,
-                8790.0,
-                8810.1,
-                8836.5,
-                8855.0,
-                8863.2,
-                8873.2,
-                8893.6,
-                8906.8,
-                8927.9,
-                8941.5,
-                8949.5,
-                8963.1,
-                9006.4,
-                9032.2,
-                9039.9,
-                9054.6,
-                9069.1,
-                9075.8,
-                9102.5,
-                9121.9,
-                9133.8,
-                9139.5,
-                9144.8,
-                9155.6,
-                9165.3,
-                9169.5,
-                9177.1,
-                9180.4,
-                9186.1,
-                9192.1,
-                9195.2,
-                9198.3,
-                9210.6,
-                9214.7,
-                9218.9,
-                9234.1,
-                9245.2,
-                9250.0,
-                9260.0,
-                9269.4,
-                9284.4,
-                9303.4,
-                9307.7,
-                9320.8,
-                9334.4,
-                9342.2,
-                9354.8,
-                9363.9,
-                9375.1,
-                9383.7,
-                9387.4,
-                9394.5,
-                9405.7,
-                9419.3,
-                9435.6,
-                9452.9,
-                9455.6,
-                9458.2,
-                9466.5,
-                9468.9,
-                9475.1,
-                9479.3,
-                9483.0,
-                9486.1,
-                9488.5,
-                9493.1,
-                9502.2,
-                9508.3,
-                9519.3,
-                9526.2,
-                9535.4,
-                9543.4,
-                9562.0,
-                9575.3,
-                9586.5,
-                9598.0,
-                9603.6,
-                9619.1,
-                9622.7,
-                9639.5,
-                9642.8,
-                9652.0,
-                9656.1,
-                9658.8,
-                9661.5,
-                9662.2,
-                9665.1,
-                9671.3,
-                9675.0,
-                9688.6,
-                9691.0,
-                9693.2,
-                9697.6,
-                9699.7,
-                9701.7,
-                9705.8,
-                9708.0,
-                9710.0,
-                9712.6,
-                9718.6,
-                9723.8,
-                9734.6,
-                9739.3,
-                9742.5,
-                9745.7,
-                9748.4,
-                9751.8,
-                9755.1,
-                9767.8,
-                9776.4,
-                9777.3,
-                9781.6,
-                9782.1,
-                9788.7,
-                9792.9,
-                9795.1,
-                9797.2,
-                9804.3,
-                9808.2,
-                9811.9,
-                9822.0,
-                9828.7,
-                9835.2,
-                9842.1,
-                9845.5,
-                9848.6,
-                9855.8,
-                9858.1,
-                9859.6,
-                9864.4,
-                9879.3,
-                9884.6,
-                9907.0,
-                9915.2,
-                9916.6,
-                9919.3,
-                9920.6,
-                9920.6,
-                9920.6,
-                9921.3,
-                9921.4,
-                9923.5,
-                9923.7,
-                9924.2,
-                9926.0,
-                9927.3,
-                9928.0,
-                9929.6,
-                9930.4,
-                9933.3,
-                9943.5,
-                9945.0,
-                9947.0,
-                9947.0,
-                9947.3,
-                9948.0,
-                9948.0,
-                9948.2,
-                9948.6,
-                9949.2,
-                9949.2,
-                9949.2,
-                9949.2,
-                9950.1,
-                9953.7,
-                9955.8,
-                9960.3,
-                9962.2,
-                9963.0,
-                9969.0,
-                9971.2,
-                9974.6,
-                9976.5,
-                9978.6,
-                9979.0,
-                9981.4,
-                9989.8,
-                9989.8,
-                9992.9,
-                9995.7,
-                9995.7,
-                9995.7,
-                9999.5,
-                10001.7,
-                10003.8,
-                10003.8,
-                10005.2,
-                10008.7,
-                10010.1,
-                10012.3,
-                10013.8,
-                10014.1,
-                10016.9,
-                10017.8,
-                10027.6,
-                10028.3,
-                10036.0,
-                10037.8,
-                10038.8,
-                10040.4,
-                10043.5,
-                10044.8,
-                10051.7,
-                10056.7,
-                10062.9,
-                10068.2,
-                10073.1,
-                10077.0,
-                10081.2,
-                10085.1,
-                10090.3,
-                10098.7,
-                10105.7,
-                10117.3,
-                10122.4,
-                10124.0,
-                10132.7,
-                10136.3,
-                10142.0,
-                10144.0,
-                10145.4,
-                10146.0,
-                10147.3,
-                10148.3,
-                10150.1,
-                10154.2,
-                10159.8,
-                10162.2,
-                10169.2,
-                10179.8,
-                10190.0,
-                10195.4,
-                10211.5,
-                10216.9,
-                10224.2,
-                10226.5,
-                10230.1,
-                10234.2,
-                10237.2,
-                10242.8,
-                10244.6,
-                10248.4,
-                10252.3,
-                10256.7,
-                10262.6,
-                10265.9,
-                10269.0,
-                10273.4,
-                10277.8,
-                10277.8,
-                10283.3,
-                10289.7,
-                10293.5,
-                10296.2,
-                10302.3,
-                10302.3,
-                10305.5,
-                10308.8,
-                10311.9,
-                10320.2,
-                10324.8,
-                10329.1,
-                10334.4,
-                10338.8,
-                10343.5,
-                10351.1,
-                10360.5,
-                10369.0,
-                10375.5,
-                10382.4,
-                10387.0,
-                10396.6,
-                10399.4,
-                10406.6,
-                10408.5,
-                10409.8,
-                10412.3,
-                10419.1,
-                10419.1,
-                10419.3,
-                10420.7,
-                10423.5,
-                10430.9,
-                10434.6,
-                10437.9,
-                10440.8,
-                10443.5,
-                10447.6,
-                10452.8,
-                10458.9,
-                10469.3,
-                10478.0,
-                10488.1,
-                10500.3,
-                10522.2,
-                10536.4,
-                10540.2,
-                10544.3,
-                10551.9,
-                10554.9,
-                10557.5,
-                10564.8,
-                10568.7,
-                10572.0,
-                10579.6,
-                10585.2,
-                10592.4,
-                10599.6,
-                10605.9,
-                10613.2,
-                10619.2,
-                10625.4,
-                10631.8,
-                10643.9,
-                10655.3,
-                10681.4,
-                10718.5,
-                10758.3,
-                10766.4,
-                10781.8,
-                10794.6,
-                10807.3,
-                10818.1,
-                10828.5,
-                10833.9,
-                10850.9,
-                10866.7,
-                10873.5,
-                10879.3,
-                10893.7,
-                10903.1,
-                10908.6,
-                10913.6,
-                10918.0,
-                10922.6,
-                10926.5,
-                10941.1,
-                10950.3,
-                10957.5,
-                10969.0,
-                10972.8,
-                10976.0,
-                10982.5,
-                10984.2,
-                10991.1,
-                10999.1,
-                11009.1,
-                11015.4,
-                11021.3,
-                11033.4,
-                11040.5,
-                11044.5,
-                11048.8,
-                11054.3,
-                11059.3,
-                11064.0,
-                11067.9,
-                11093.9,
-                11106.8,
-                11117.3,
-                11135.7,
-                11141.4,
-                11145.8,
-                11152.4,
-                11162.6,
-                11166.4,
-                11170.6,
-                11173.8,
-                11178.2,
-                11182.9,
-                11206.2,
-                11215.4,
-                11218.2,
-                11222.0,
-                11227.3,
-                11232.8,
-                11238.6,
-                11249.5,
-                11261.4,
-                11267.1,
-                11279.6,
-                11292.9,
-                11321.0,
-                11340.9,
-                11349.0,
-                11361.2,
-                11365.3,
-                11372.2,
-                11381.5,
-                11385.8,
-                11391.9,
-                11397.7,
-                11419.5,
-                11424.9,
-                11430.0,
-                11433.8,
-                11440.9,
-                11442.0,
-                11443.0,
-                11451.1,
-                11460.9,
-                11465.7,
-                11467.8,
-                11472.9,
-                11476.0,
-                11490.8,
-                11509.8,
-                11515.2,
-                11521.2,
-                11529.7,
-                11535.1,
-                11566.4,
-                11574.4,
-                11575.9,
-                11580.3,
-                11591.2,
-                11599.8,
-                11608.4,
-                11626.4,
-                11636.8,
-                11645.6,
-                11652.1,
-                11657.4,
-                11661.8,
-                11666.3,
-                11671.8,
-                11678.3,
-                11703.2,
-                11713.3,
-                11723.1,
-                11736.3,
-                11745.5,
-                11750.2,
-                11755.7,
-                11762.7,
-                11775.5,
-                11779.5,
-                11784.8,
-                11790.8,
-                11802.2,
-                11810.0,
-                11816.5,
-                11823.5,
-                11830.1,
-                11836.9,
-                11843.0,
-                11861.8,
-                11870.5,
-                11885.3,
-                11907.3,
-                11914.7,
-                11923.0,
-                11930.8,
-                11939.1,
-                11949.6,
-                11953.9,
-                11955.0,
-                11955.4,
-                11955.4,
-                11956.8,
-                11966.1,
-                11978.8,
-                11980.8,
-                11981.4,
-                11982.9,
-                11983.3,
-                11984.0,
-                11985.3,
-                11986.5,
-                11987.6,
-                11988.1,
-                11988.6,
-                11989.8,
-                11990.7,
-                11990.8,
-                11991.8,
-                11991.9,
-                11992.8,
-                11993.3,
-                11993.7,
-                11993.9,
-                11993.9,
-                11994.1,
-                11994.8,
-                11995.2,
-                11995.2,
-                12000.1,
-                12000.9,
-                12001.0,
-                12001.0,
-                12001.2,
-                12001.3,
-                12003.0,
-                12005.3,
-                12006.7,
-                12009.1,
-                12010.9,
-                12012.1,
-                12012.8,
-                12012.8,
-                12013.1,
-                12015.0,
-                12015.8,
-                12017.9,
-                12022.3,
-                12037.5,
-                12049.5,
-                12066.2,
-                12074.5,
-                12081.5,
-                12094.4,
-                12109.5,
-                12116.9,
-                12122.6,
-                12130.9,
-                12135.5,
-                12141.4,
-                12153.1,
-                12156.5,
-                12159.3,
-                12161.5,
-                12165.0,
-                12172.5,
-                12183.8,
-                12191.3,
-                12199.6,
-                12208.8,
-                12219.0,
-                12230.3,
-                12240.9,
-                12249.4,
-                12256.4,
-                12264.5,
-                12273.3,
-                12282.7,
-                12302.3,
-                12310.1,
-                12315.3,
-                12320.8,
-                12335.0,
-                12343.6,
-                12358.8,
-                12375.5,
-                12384.8,
-                12392.1,
-                12399.7,
-                12415.1,
-                12428.5,
-                12441.6,
-                12460.2,
-                12465.0,
-                12478.5,
-                12495.7,
-                12503.1,
-                12505.2,
-                12506.6,
-                12514.5,
-                12523.9,
-                12529.6,
-                12536.7,
-                12541.9,
-                12546.3,
-                12550.7,
-                12555.1,
-                12560.4,
-                12565.8,
-                12571.4,
-                12575.5,
-                12576.7,
-                12579.5,
-                12591.8,
-                12597.0,
-                12603.3,
-                12608.4,
-                12612.3,
-                12615.8,
-                12624.3,
-                12630.0,
-                12637.0,
-                12645.3,
-                12651.5,
-                12657.5,
-                12668.1,
-                12681.8,
-                12686.8,
-                12694.8,
-                12698.4,
-                12703.8,
-                12710.0,
-                12716.2,
-                12719.8,
-                12723.1,
-                12737.1,
-                12745.0,
-                12757.6,
-                12762.2,
-                12770.0,
-                12775.8,
-                12783.4,
-                12791.9,
-                12797.6,
-                12802.2,
-                12809.7,
-                12815.4,
-                12821.3,
-                12829.6,
-                12845.6,
-                12858.3,
-                12868.3,
-                12884.8,
-                12890.7,
-                12896.8,
-                12903.3,
-                12908.3,
-                12915.0,
-                12925.5,
-                12942.3,
-                12950.3,
-                12959.2,
-                12971.5,
-                12977.1,
-                12981.7,
-                12986.0,
-                12992.2,
-                12997.6,
-                13005.3,
-                13013.6,
-                13017.3,
-                13025.6,
-                13035.8,
-                13044.4,
-                13049.3,
-                13052.6,
-                13055.1,
-                13059.5,
-                13087.0,
-                13097.1,
-                13103.2,
-                13112.3,
-                13120.0,
-                13125.2,
-                13136.4,
-                13146.4,
-                13160.1,
-                13172.6,
-                13185.8,
-                13196.9,
-                13205.5,
-                13212.3,
-                13225.6,
-                13250.0,
-                13267.0,
-                13280.3,
-                13286.5,
-                13292.5,
-                13298.5,
-                13305.6,
-                13313.3,
-                13329.1,
-                13338.2,
-                13345.0,
-                13350.4,
-                13354.6,
-                13358.2,
-                13362.3,
-                13366.8,
-                13376.0,
-                13386.6,
-                13392.7,
-                13400.6,
-                13408.1,
-                13419.8,
-                13434.1,
-                13439.0,
-                13445.3,
-                13452.5,
-                13460.4,
-                13468.5,
-                13476.7,
-                13485.2,
-                13499.0,
-                13505.7,
-                13527.2,
-                13535.0,
-                13550.6,
-                13558.0,
-                13565.0,
-                13573.0,
-                13579.6,
-                13585.8,
-                13591.8,
-                13598.0,
-                13611.4,
-                13619.3,
-                13627.9,
-                13636.9,
-                13644.2,
-                13651.1,
-                13657.5,
-                13672.9,
-                13676.0,
-                13678.1,
-                13680.1,
-                13685.9,
-                13688.0,
-                13698.4,
-                13702.1,
-                13712.2,
-                13715.8,
-                13717.5,
-                13728.0,
-                13734.9,
-                13742.0,
-                13755.6,
-                13762.3,
-                13770.3,
-                13776.4,
-                13780.2,
-                13789.9,
-                13797.1,
-                13801.0,
-                13812.9,
-                13820.7,
-                13824.8,
-                13828.3,
-                13834.9,
-                13850.0,
-                13868.7,
-                13884.0,
-                13896.4,
-                13904.3,
-                13915.4,
-                13922.8,
-                13929.7,
-                13940.4,
-                13944.1,
-                13951.2,
-                13966.2,
-                13970.2,
-                13977.9,
-                13993.7,
-                14010.6,
-                14019.0,
-                14043.9,
-                14048.1,
-                14060.6,
-                14069.4,
-                14073.4,
-                14080.9,
-                14100.0,
-                14108.1,
-                14118.9,
-                14130.3,
-                14134.2,
-                14138.0,
-                14149.7,
-                14162.0,
-                14166.4,
-                14185.2,
-                14198.8,
-                14225.3,
-                14229.8,
-                14234.3,
-                14242.0,
-                14252.2,
-                14254.7,
-                14261.0,
-                14264.9,
-                14277.1,
-                14285.0,
-                14292.2,
-                14304.5,
-                14311.5,
-                14314.8,
-                14323.5,
-                14329.1,
-                14332.2,
-                14347.1,
-                14350.2,
-                14368.1,
-                14376.2,
-                14383.7,
-                14387.5,
-                14393.0,
-                14401.3,
-                14411.7,
-                14420.5,
-                14436.9,
-                14440.0,
-                14447.7,
-                14459.8,
-                14465.2,
-                14475.0,
-                14489.1,
-                14494.1,
-                14503.7,
-                14511.6,
-                14518.9,
-                14525.3,
-                14531.2,
-                14533.8,
-                14537.3,
-                14542.6,
-                14554.4,
-                14567.0,
-                14576.2,
-                14581.1,
-                14597.3,
-                14607.1,
-                14612.8,
-                14622.9,
-                14637.8,
-                14646.8,
-                14662.5,
-                14672.9,
-                14682.5,
-                14692.2,
-                14697.4,
-                14711.3,
-                14719.8,
-                14724.1,
-                14738.2,
-                14748.2,
-                14753.3,
-                14777.4,
-                14782.0,
-                14794.6,
-                14798.9,
-                14807.4,
-                14815.6,
-                14822.0,
-                14829.0,
-                14846.1,
-                14850.3,
-                14872.7,
-                14878.2,
-                14888.9,
-                14905.2,
-                14913.1,
-                14916.3,
-                14924.3,
-                14926.1,
-                14928.5,
-                14932.3,
-                14934.0,
-                14938.4,
-                14950.9,
-                14953.4,
-                14964.7,
-                14971.9,
-                14974.6,
-                14986.6,
-                14996.8,
-                15002.8,
-                15008.9,
-                15011.9,
-                15015.2,
-                15018.3,
-                15028.7,
-                15034.5,
-                15044.8,
-                15052.7,
-                15067.8,
-                15076.7,
-                15082.2,
-                15094.2,
-                15112.2,
-                15116.9,
-                15125.3,
-                15140.2,
-                15147.1,
-                15158.5,
-                15167.6,
-                15172.7,
-                15177.0,
-                15186.2,
-                15208.2,
-                15212.8,
-                15217.2,
-                15234.0,
-                15242.0,
-                15248.8,
-                15251.5,
-                15263.4,
-                15272.9,
-                15278.6,
-                15281.5,
-                15290.3,
-                15300.7,
-                15312.3,
-                15323.6,
-                15333.9,
-                15337.5,
-                15349.7,
-                15360.0,
-                15364.7,
-                15369.9,
-                15392.4,
-                15410.5,
-                15416.1,
-                15421.7,
-                15432.9,
-                15436.5,
-                15440.3,
-                15452.3,
-                15456.3,
-                15472.4,
-                15485.2,
-                15495.0,
-                15499.0,
-                15506.5,
-                15520.8,
-                15539.2,
-                15544.8,
-                15577.5,
-                15591.4,
-                15610.5,
-                15616.9,
-                15623.2,
-                15634.5,
-                15640.0,
-                15647.7,
-                15654.1,
-                15670.1,
-                15683.6,
-                15689.6,
-                15707.8,
-                15726.2,
-                15745.5,
-                15765.3,
-                15770.4,
-                15779.8,
-                15785.3,
-                15790.7,
-                15800.4,
-                15805.6,
-                15810.3,
-                15820.8,
-                15826.3,
-                15830.7,
-                15834.6,
-                15839.0,
-                15850.2,
-                15855.1,
-                15860.8,
-                15865.6,
-                15870.9,
-                15882.0,
-                15892.7,
-                15898.7,
-                15904.3,
-                15920.2,
-                15936.6,
-                15951.5,
-                15956.0,
-                15967.8,
-                15976.0,
-                15980.0,
-                15998.2,
-                16010.9,
-                16016.1,
-                16021.6,
-                16032.2,
-                16054.9,
-                16060.1,
-                16081.3,
-                16086.6,
-                16096.7,
-                16105.7,
-                16119.7,
-                16141.5,
-                16151.8,
-                16166.8,
-                16181.1,
-                16185.9,
-                16211.2,
-                16216.2,
-                16226.6,
-                16242.3,
-                16247.2,
-                16262.5,
-                16277.5,
-                16287.3,
-                16297.6,
-                16303.0,
-                16323.8,
-                16328.5,
-                16337.9,
-                16349.4,
-                16353.3,
-                16364.6,
-                16366.8,
-                16382.6,
-                16388.0,
-                16388.8,
-                16401.7,
-                16406.1,
-                16406.1,
-                16407.8,
-                16408.3,
-                16409.2,
-                16410.4,
-                16410.5,
-                16410.7,
-                16410.9,
-                16411.4,
-                16414.2,
-                16414.2,
-                16416.1,
-                16418.5,
-                16423.9,
-                16430.3,
-                16434.8,
-                16439.9,
-                16445.3,
-                16457.0,
-                16463.7,
-                16470.4,
-                16481.9,
-                16487.3,
-                16498.3,
-                16505.1,
-                16510.9,
-                16516.3,
-                16522.6,
-                16543.1,
-                16549.3,
-                16558.6,
-                16566.1,
-                16569.4,
-                16578.9,
-                16586.7,
-                16595.3,
-                16604.8,
-                16611.1,
-                16616.7,
-                16628.1,
-                16631.3,
-                16633.7,
-                16640.7,
-                16662.5,
-                16671.4,
-                16675.9,
-                16688.4,
-                16692.5,
-                16697.1,
-                16715.8,
-                16728.6,
-                16746.5,
-                16752.8,
-                16759.0,
-                16763.6,
-                16769.7,
-                16792.7,
-                16799.4,
-                16811.5,
-                16820.6,
-                16843.2,
-                16855.1,
-                16866.2,
-                16870.6,
-                16875.9,
-                16885.6,
-                16894.2,
-                16901.0,
-                16912.4,
-                16925.1,
-                16931.0,
-                16937.3,
-                16949.7,
-                16956.2,
-                16963.0,
-                16979.0,
-                16984.3,
-                16996.5,
-                17009.2,
-                17023.2,
-                17027.5,
-                17032.5,
-                17037.9,
-                17044.4,
-                17051.6,
-                17059.2,
-                17068.0,
-                17078.6,
-                17084.3,
-                17091.2,
-                17097.9,
-                17109.6,
-                17116.0,
-                17123.1,
-                17131.6,
-                17137.8,
-                17146.5,
-                17155.5,
-                17166.6,
-                17172.8,
-                17178.5,
-                17200.2,
-                17207.1,
-                17223.8,
-                17236.4,
-                17252.6,
-                17272.6,
-                17286.5,
-                17298.6,
-                17307.5,
-                17315.5,
-                17324.4,
-                17334.2,
-                17360.2,
-                17368.1,
-                17374.3,
-                17380.0,
-                17386.6,
-                17395.0,
-                17401.8,
-                17409.2,
-                17417.3,
-                17438.5,
-                17448.0,
-                17456.1,
-                17464.5,
-                17473.4,
-                17481.6,
-                17488.7,
-                17495.0,
-                17502.3,
-                17511.0,
-                17517.3,
-                17527.4,
-                17535.8,
-                17541.1,
-                17557.3,
-                17563.5,
-                17583.9,
-                17603.4,
-                17608.7,
-                17617.8,
-                17625.6,
-                17641.9,
-                17654.8,
-                17674.3,
-                17708.4,
-                17725.6,
-                17760.3,
-                17768.0,
-                17792.0,
-                17810.0,
-                17829.6,
-                17838.6,
-                17847.3,
-                17864.8,
-                17873.4,
-                17880.7,
-                17928.9,
-                17951.8,
-                17959.1,
-                17974.1,
-                17988.5,
-                18012.6,
-                18037.3,
-                18053.5,
-                18061.8,
-                18069.7,
-                18085.0,
-                18092.4,
-                18120.5,
-                18133.3,
-                18139.9,
-                18159.8,
-                18173.0,
-                18185.2,
-                18191.3,
-                18214.2,
-                18224.9,
-                18230.1,
-                18235.5,
-                18246.1,
-                18276.5,
-                18282.2,
-                18298.9,
-                18309.6,
-                18326.6,
-                18350.6,
-                18369.4,
-                18375.8,
-                18392.5,
-                18402.8,
-                18408.0,
-                18418.4,
-                18434.6,
-                18445.3,
-                18450.5,
-                18470.8,
-                18486.1,
-                18507.2,
-                18518.4,
-                18535.2,
-                18547.0,
-                18558.9,
-                18570.8,
-                18593.8,
-                18606.1,
-                18640.6,
-                18653.7,
-                18699.6,
-                18735.6,
-                18749.2,
-                18770.4,
-                18796.0,
-                18801.5,
-                18807.3,
-                18818.9,
-                18830.9,
-                18836.2,
-                18856.4,
-                18861.0,
-                18865.7,
-                18869.9,
-                18885.1,
-                18892.0,
-                18896.5,
-                18914.5,
-                18919.6,
-                18930.1,
-                18947.2,
-                18962.4,
-                18972.2,
-                18977.5,
-                18993.6,
-                19008.3,
-                19012.4,
-                19023.1,
-                19038.4,
-                19051.8,
-                19073.7,
-                19091.6,
-                19118.1,
-                19126.4,
-                19137.9,
-                19145.5,
-                19148.0,
-                19154.6,
-                19156.7,
-                19157.2,
-                19159.7,
-                19161.5,
-                19161.8,
-                19161.8,
-                19162.2,
-                19162.2,
-                19165.3,
-                19166.3,
-                19167.1,
-                19167.3,
-                19167.8,
-                19168.3,
-                19168.3,
-                19169.4,
-                19170.2,
-                19170.9,
-                19171.0,
-                19171.5,
-                19171.8,
-                19172.1,
-                19172.2,
-                19172.3,
-                19172.5,
-                19172.7,
-                19172.8,
-                19173.0,
-                19173.0,
-                19173.1,
-                19173.3,
-                19175.1,
-                19176.4,
-                19177.6,
-                19177.7,
-                19178.8,
-                19179.7,
-                19181.6,
-                19183.2,
-                19186.3,
-                19186.4,
-                19187.3,
-                19193.3,
-                19195.1,
-                19196.0,
-                19196.3,
-                19196.3,
-                19196.9,
-                19198.7,
-                19200.1,
-                19201.8,
-                19202.1,
-                19203.1,
-                19203.7,
-                19204.1,
-                19205.0,
-                19205.5,
-                19206.6,
-                19209.8,
-                19210.7,
-                19213.5,
-                19219.9,
-                19224.7,
-                19228.6,
-                19233.7,
-                19241.1,
-                19246.7,
-                19251.8,
-                19257.5,
-                19263.2,
-                19268.7,
-                19281.7,
-                19295.2,
-                19302.2,
-                19310.5,
-                19317.7,
-                19334.2,
-                19339.6,
-                19345.2,
-                19352.4,
-                19360.0,
-                19373.3,
-                19380.0,
-                19387.0,
-                19392.3,
-                19418.9,
-                19428.0,
-                19435.7,
-                19443.8,
-                19451.6,
-                19459.3,
-                19466.8,
-                19472.7,
-                19477.0,
-                19482.1,
-                19493.3,
-                19501.7,
-                19514.6,
-                19525.3,
-                19529.2,
-                19534.5,
-                19539.2,
-                19543.9,
-                19547.9,
-                19565.0,
-                19573.9,
-                19582.0,
-                19590.7,
-                19595.6,
-                19605.3,
-                19627.2,
-                19635.1,
-                19642.3,
-                19650.4,
-                19660.5,
-                19674.9,
-                19683.7,
-                19694.5,
-                19703.0,
-                19710.0,
-                19724.2,
-                19739.1,
-                19756.3,
-                19763.5,
-                19770.6,
-                19784.4,
-                19790.5,
-                19796.3,
-                19802.3,
-                19809.3,
-                19816.5,
-                19824.4,
-                19831.8,
-                19853.6,
-                19861.2,
-                19867.9,
-                19874.3,
-                19881.6,
-                19889.5,
-                19897.0,
-                19905.0,
-                19912.9,
-                19922.2,
-                19931.3,
-                19941.2,
-                19949.3,
-                19957.1,
-                19964.9,
-                19973.3,
-                20002.7,
-                20015.7,
-                20029.1,
-                20051.4,
-                20059.5,
-                20074.1,
-                20081.6,
-                20089.0,
-                20111.6,
-                20118.4,
-                20124.5,
-                20131.0,
-                20140.6,
-                20150.7,
-                20160.6,
-                20169.7,
-                20179.2,
-                20187.6,
-                20196.8,
-                20205.3,
-                20213.5,
-                20230.5,
-                20247.9,
-                20254.6,
-                20261.0,
-                20267.2,
-                20296.0,
-                20299.9,
-                20304.8,
-                20316.1,
-                20324.2,
-                20333.6,
-                20339.6,
-                20345.3,
-                20346.3,
-                20347.9,
-                20349.0,
-                20349.5,
-                20354.3,
-                20360.1,
-                20363.1,
-                20374.4,
-                20378.1,
-                20391.1,
-                20399.3,
-                20408.3,
-                20417.1,
-                20425.0,
-                20431.9,
-                20439.2,
-                20447.2,
-                20456.0,
-                20464.1,
-                20482.4,
-                20491.5,
-                20500.7,
-                20509.1,
-                20516.9,
-                20524.3,
-                20531.9,
-                20539.9,
-                20548.1,
-                20554.8,
-                20562.7,
-                20581.1,
-                20587.0,
-                20592.3,
-                20604.6,
-                20619.0,
-                20625.3,
-                20631.6,
-                20639.1,
-                20646.3,
-                20653.4,
-                20660.7,
-                20667.9,
-                20674.8,
-                20682.6,
-                20690.5,
-                20705.3,
-                20720.5,
-                20736.5,
-                20743.5,
-                20751.0,
-                20758.5,
-                20774.1,
-                20782.7,
-                20790.8,
-                20798.1,
-                20806.1,
-                20814.3,
-                20822.4,
-                20838.1,
-                20852.6,
-                20861.7,
-                20870.0,
-                20873.9,
-                20879.0,
-                20883.3,
-                20890.1,
-                20897.4,
-                20900.1,
-                20909.2,
-                20930.3,
-                20948.9,
-                20952.0,
-                20954.5,
-                20961.9,
-                20971.3,
-                20976.0,
-                20980.2,
-                20987.7,
-                21008.4,
-                21032.8,
-                21035.3,
-                21037.4,
-                21042.7,
-                21092.6,
-                21109.2,
-                21118.4,
-                21133.9,
-                21173.7,
-                21182.3,
-                21204.0,
-                21233.6,
-                21254.1,
-                21258.9,
-                21276.0,
-                21280.4,
-                21294.3,
-                21303.8,
-                21307.3,
-                21309.8,
-                21315.3,
-                21320.7,
-                21324.2,
-                21324.4,
-                21325.3,
-                21336.7,
-                21340.3,
-                21346.2,
-                21355.1,
-                21357.8,
-                21366.2,
-                21378.8,
-                21389.7,
-                21396.9,
-                21401.6,
-                21413.9,
-                21418.3,
-                21433.3,
-                21436.7,
-                21441.4,
-                21451.4,
-                21461.1,
-                21474.9,
-                21495.3,
-                21514.2,
-                21518.4,
-                21523.0,
-                21528.7,
-                21536.1,
-                21550.4,
-                21559.7,
-                21569.3,
-                21576.1,
-                21585.4,
-                21594.1,
-                21613.6,
-                21621.5,
-                21626.7,
-                21643.2,
-                21655.1,
-                21659.1,
-                21674.5,
-                21677.3,
-                21695.8,
-                21699.4,
-                21707.7,
-                21729.1,
-                21734.1,
-                21738.2,
-                21744.5,
-                21749.8,
-                21767.0,
-                21772.1,
-                21782.0,
-                21793.5,
-                21795.9,
-                21808.5,
-                21816.8,
-                21828.4,
-                21835.1,
-                21848.3,
-                21854.2,
-                21860.5,
-                21867.1,
-                21875.9,
-                21884.5,
-                21890.1,
-                21895.7,
-                21906.3,
-                21918.9,
-                21923.4,
-                21927.1,
-                21935.5,
-                21940.3,
-                21946.1,
-                21956.2,
-                21960.1,
-                21962.3,
-                21965.1,
-                21972.6,
-                21975.2,
-                21980.5,
-                21987.9,
-                21996.3,
-                22010.6,
-                22016.3,
-                22018.9,
-                22029.5,
-                22042.6,
-                22045.0,
-                22052.1,
-                22056.9,
-                22061.3,
-                22068.9,
-                22077.3,
-                22078.9,
-                22083.9,
-                22089.6,
-                22095.2,
-                22106.4,
-                22109.4,
-                22115.8,
-                22132.1,
-                22145.8,
-                22155.7,
-                22177.3,
-                22193.9,
-                22209.5,
-                22219.4,
-                22228.2,
-                22232.4,
-                22237.1,
-                22246.1,
-                22255.7,
-                22265.8,
-                22275.4,
-                22292.4,
-                22308.0,
-                22320.8,
-                22325.1,
-                22333.8,
-                22351.5,
-                22359.8,
-                22369.5,
-                22381.9,
-                22409.1,
-                22412.9,
-                22415.9,
-                22417.8,
-                22420.1,
-                22422.4,
-                22426.4,
-                22431.7,
-                22437.1,
-                22447.9,
-                22452.9,
-                22458.7,
-                22465.5,
-                22474.8,
-                22480.1,
-                22485.5,
-                22491.1,
-                22495.3,
-                22497.6,
-                22504.3,
-                22508.0,
-                22513.9,
-                22520.3,
-                22526.1,
-                22532.2,
-                22542.0,
-                22545.6,
-                22547.9,
-                22554.9,
-                22557.1,
-                22564.8,
-                22567.6,
-                22570.9,
-                22575.9,
-                22584.9,
-                22589.8,
-                22594.3,
-                22598.8,
-                22607.7,
-                22611.5,
-                22628.5,
-                22632.4,
-                22635.9,
-                22638.5,
-                22645.5,
-                22648.8,
-                22663.3,
-                22679.6,
-                22687.3,
-                22690.5,
-                22706.2,
-                22721.2,
-                22727.3,
-                22732.9,
-                22738.2,
-                22744.1,
-                22749.2,
-                22760.4,
-                22763.5,
-                22765.8,
-                22766.8,
-                22770.5,
-                22775.1,
-                22777.5,
-                22781.1,
-                22781.8,
-                22786.2,
-                22789.5,
-                22791.2,
-                22793.8,
-                22795.0,
-                22797.2,
-                22799.0,
-                22802.7,
-                22803.6,
-                22805.3,
-                22809.3,
-                22822.8,
-                22837.0,
-                22839.7,
-                22850.0,
-                22853.9,
-                22859.0,
-                22861.4,
-                22861.5,
-                22863.3,
-                22864.8,
-                22879.2,
-                22885.1,
-                22887.9,
-                22891.2,
-                22904.8,
-                22920.7,
-                22936.9,
-                22939.6,
-                22950.6,
-                22958.8,
-                22970.1,
-                22976.5,
-                22980.7,
-                22982.0,
-                22989.6,
-                22991.8,
-                22994.0,
-                23008.9,
-                23022.3,
-                23027.2,
-                23034.2,
-                23039.7,
-                23044.8,
-                23055.8,
-                23061.2,
-                23074.3,
-                23078.6,
-                23081.2,
-                23089.4,
-                23093.6,
-                23095.7,
-                23102.4,
-                23104.6,
-                23107.8,
-                23118.2,
-                23123.0,
-                23137.1,
-                23140.6,
-                23143.6,
-                23146.3,
-                23147.9,
-                23149.4,
-                23151.2,
-                23151.3,
-                23154.4,
-                23159.6,
-                23165.8,
-                23168.4,
-                23172.3,
-                23176.3,
-                23181.3,
-                23188.2,
-                23192.3,
-                23194.8,
-                23198.9,
-                23202.3,
-                23213.2,
-                23213.6,
-                23219.9,
-                23226.6,
-                23235.4,
-                23240.9,
-                23246.8,
-                23261.7,
-                23266.4,
-                23279.7,
-                23286.7,
-                23294.8,
-                23306.2,
-                23322.7,
-                23327.7,
-                23344.8,
-                23359.4,
-                23369.6,
-                23377.3,
-                23383.8,
-                23389.0,
-                23393.2,
-                23397.3,
-                23402.9,
-                23420.3,
-                23426.3,
-                23433.2,
-                23438.6,
-                23446.2,
-                23458.3,
-                23463.8,
-                23479.4,
-                23486.4,
-                23498.0,
-                23503.1,
-                23512.0,
-                23517.2,
-                23520.9,
-                23524.4,
-                23527.4,
-                23530.8,
-                23535.4,
-                23547.3,
-                23552.3,
-                23560.1,
-                23565.0,
-                23577.5,
-                23597.9,
-                23602.1,
-                23606.2,
-                23615.3,
-                23620.5,
-                23626.2,
-                23638.3,
-                23649.3,
-                23661.2,
-                23671.2,
-                23686.7,
-                23693.1,
-                23698.0,
-                23705.6,
-                23715.1,
-                23731.0,
-                23736.3,
-                23743.4,
-                23749.1,
-                23763.3,
-                23780.7,
-                23785.8,
-                23795.5,
-                23798.2,
-                23802.3,
-                23814.4,
-                23817.3,
-                23825.1,
-                23841.6,
-                23847.7,
-                23857.3,
-                23866.3,
-                23874.9,
-                23886.9,
-                23897.4,
-                23906.4,
-                23910.0,
-                23919.2,
-                23925.4,
-                23929.2,
-                23932.4,
-                23935.9,
-                23938.0,
-                23941.6,
-                23945.9,
-                23950.1,
-                23955.2,
-                23961.1,
-                23966.2,
-                23990.9,
-                24000.5,
-                24014.0,
-                24027.7,
-                24052.8,
-                24059.4,
-                24062.5,
-                24066.0,
-                24073.3,
-                24086.1,
-                24095.5,
-                24101.8,
-                24109.4,
-                24117.5,
-                24127.1,
-                24132.9,
-                24142.6,
-                24155.5,
-                24160.6,
-                24181.9,
-                24201.8,
-                24215.5,
-                24220.8,
-                24225.5,
-                24239.6,
-                24251.1,
-                24259.8,
-                24268.5,
-                24278.9,
-                24286.0,
-                24293.6,
-                24303.1,
-                24328.8,
-                24341.3,
-                24352.0,
-                24368.3,
-                24388.3,
-                24404.7,
-                24419.2,
-                24427.4,
-                24440.3,
-                24450.2,
-                24455.8,
-                24461.3,
-                24471.4,
-                24483.9,
-                24487.0,
-                24490.4,
-                24499.7,
-                24504.1,
-                24512.0,
-                24519.3,
-                24522.1,
-                24526.8,
-                24535.5,
-                24546.4,
-                24549.2,
-                24556.7,
-                24564.6,
-                24581.1,
-                24588.5,
-                24591.5,
-                24603.7,
-                24610.0,
-                24619.1,
-                24626.4,
-                24633.6,
-                24640.5,
-                24643.7,
-                24659.2,
-                24670.1,
-                24678.8,
-                24687.6,
-                24692.6,
-                24695.0,
-                24700.4,
-                24720.0,
-                24733.7,
-                24746.8,
-                24759.7,
-                24777.5,
-                24783.8,
-                24795.2,
-                24800.5,
-                24824.8,
-                24838.7,
-                24845.2,
-                24851.2,
-                24856.7,
-                24877.7,
-                24884.7,
-                24898.5,
-                24905.5,
-                24928.4,
-                24945.7,
-                24950.7,
-                24968.7,
-                24980.9,
-                24985.5,
-                24991.9,
-                24997.8,
-                25021.3,
-                25031.2,
-                25041.1,
-                25053.5,
-                25068.0,
-                25084.4,
-                25099.7,
-                25103.2,
-                25107.2,
-                25111.9,
-                25117.1,
-                25122.3,
-                25132.8,
-                25138.4,
-                25149.0,
-                25154.5,
-                25160.9,
-                25189.1,
-                25196.8,
-                25204.8,
-                25212.7,
-                25220.9,
-                25229.2,
-                25251.6,
-                25258.8,
-                25265.7,
-                25272.3,
-                25279.0,
-                25288.7,
-                25304.0,
-                25306.4,
-                25308.2,
-                25312.8,
-                25315.3,
-                25318.9,
-                25333.3,
-                25341.3,
-                25349.9,
-                25358.7,
-                25367.0,
-                25375.1,
-                25382.9,
-                25399.4,
-                25406.9,
-                25418.9,
-                25436.3,
-                25441.0,
-                25451.6,
-                25457.9,
-                25464.8,
-                25483.8,
-                25490.7,
-                25504.6,
-                25517.8,
-                25530.2,
-                25547.5,
-                25558.5,
-                25576.2,
-                25583.1,
-                25612.5,
-                25620.3,
-                25634.7,
-                25640.9,
-                25646.3,
-                25661.8,
-                25664.9,
-                25670.4,
-                25676.6,
-                25679.0,
-                25681.3,
-                25685.5,
-                25687.9,
-                25688.6,
-                25692.9,
-                25694.2,
-                25696.1,
-                25699.5,
-                25704.4,
-                25714.5,
-                25729.5,
-                25741.5,
-                25747.3,
-                25752.2,
-                25759.0,
-                25762.8,
-                25765.3,
-                25766.2,
-                25766.5,
-                25767.2,
-                25768.4,
-                25769.3,
-                25769.6,
-                25770.0,
-                25773.1,
-                25776.2,
-                25781.8,
-                25796.3,
-                25801.9,
-                25813.8,
-                25820.3,
-                25827.0,
-                25834.0,
-                25841.2,
-                25848.8,
-                25864.6,
-                25880.4,
-                25903.7,
-                25933.9,
-                25974.5,
-                25985.8,
-                25993.7,
-                25996.5,
-                26004.6,
-                26028.2,
-                26034.0,
-                26040.0,
-                26052.1,
-                26063.4,
-                26068.5,
-                26078.4,
-                26092.4,
-                26104.9,
-                26109.9,
-                26118.8,
-                26128.8,
-                26137.3,
-                26143.1,
-                26145.8,
-                26154.3,
-                26162.5,
-                26170.2,
-                26182.2,
-                26191.1,
-                26202.4,
-                26206.7,
-                26215.1,
-                26225.9,
-                26230.2,
-                26238.9,
-                26245.6,
-                26252.1,
-                26260.8,
-                26267.1,
-                26270.0,
-                26287.7,
-                26296.8,
-                26301.2,
-                26316.8,
-                26321.7,
-                26327.0,
-                26332.1,
-                26337.7,
-                26342.7,
-                26348.3,
-                26359.3,
-                26364.6,
-                26381.6,
-                26397.8,
-                26408.4,
-                26414.1,
-                26419.3,
-                26429.3,
-                26434.7,
-                26440.1,
-                26450.7,
-                26460.4,
-                26473.5,
-                26495.7,
-                26506.7,
-                26511.9,
-                26522.1,
-                26527.3,
-                26537.8,
-                26542.8,
-                26547.8,
-                26558.2,
-                26567.9,
-                26572.1,
-                26579.7,
-                26582.9,
-                26590.6,
-                26597.3,
-                26609.0,
-                26620.6,
-                26623.3,
-                26626.3,
-                26638.4,
-                26657.3,
-                26663.3,
-                26664.7,
-                26667.1,
-                26671.9,
-                26681.9,
-                26690.1,
-                26694.5,
-                26696.3,
-                26704.3,
-                26706.9,
-                26710.8,
-                26714.8,
-                26718.4,
-                26734.4,
-                26737.6,
-                26748.1,
-                26758.7,
-                26761.9,
-                26772.0,
-                26774.3,
-                26777.0,
-                26789.3,
-                26792.7,
-                26795.2,
-                26797.4,
-                26799.6,
-                26801.5,
-                26804.3,
-                26804.8,
-                26806.2,
-                26807.0,
-                26808.2,
-                26812.4,
-                26813.4,
-                26817.3,
-                26818.3,
-                26819.0,
-                26822.2,
-                26825.2,
-                26832.9,
-                26833.9,
-                26834.0,
-                26835.4,
-                26839.5,
-                26842.4,
-                26845.4,
-                26846.4,
-            ],
-            "series_type": "distance",
-            "original_size": 3225,
-            "resolution": "high",
-        },
-        "heartrate": {
-            "data": [
-                94,
-                91,
-                84,
-                84,
-                81,
-                79,
-                78,
-                77,
-                74,
-                80,
-                79,
-                84,
-                87,
-                91,
-                88,
-                85,
-                82,
-                85,
-                83,
-                83,
-                84,
-                84,
-                82,
-                82,
-                83,
-                83,
-                83,
-                84,
-                82,
-                87,
-                89,
-                91,
-                90,
-                90,
-                92,
-                93,
-                93,
-                91,
-                92,
-                90,
-                86,
-                85,
-                86,
-                87,
-                84,
-                85,
-                84,
-                85,
-                84,
-                82,
-                85,
-                86,
-                89,
-                93,
-                96,
-                99,
-                100,
-                103,
-                105,
-                103,
-                102,
-                101,
-                102,
-                103,
-                103,
-                103,
-                103,
-                100,
-                100,
-                100,
-                98,
-                98,
-                99,
-                97,
-                96,
-                97,
-                97,
-                96,
-                96,
-                94,
-                92,
-                91,
-                92,
-                92,
-                92,
-                92,
-                92,
-                94,
-                92,
-                92,
-                93,
-                99,
-                99,
-                103,
-                104,
-                105,
-                106,
-                101,
-                101,
-                95,
-                98,
-                99,
-                97,
-                95,
-                96,
-                96,
-                100,
-                100,
-                101,
-                102,
-                102,
-                101,
-                101,
-                102,
-                102,
-                99,
-                99,
-                96,
-                95,
-                95,
-                96,
-                96,
-                95,
-                95,
-                94,
-                94,
-                94,
-                94,
-                94,
-                95,
-                98,
-                102,
-                101,
-                101,
-                99,
-                100,
-                99,
-                99,
-                98,
-                98,
-                96,
-                95,
-                93,
-                97,
-                93,
-                94,
-                93,
-                91,
-                91,
-                92,
-                94,
-                96,
-                98,
-                95,
-                97,
-                96,
-                96,
-                99,
-                102,
-                106,
-                109,
-                109,
-                109,
-                108,
-                107,
-                107,
-                107,
-                109,
-                111,
-                111,
-                111,
-                111,
-                111,
-                110,
-                110,
-                109,
-                109,
-                107,
-                107,
-                107,
-                105,
-                104,
-                105,
-                104,
-                102,
-                102,
-                102,
-                103,
-                108,
-                110,
-                115,
-                115,
-                119,
-                120,
-                124,
-                126,
-                127,
-                127,
-                127,
-                126,
-                124,
-                123,
-                123,
-                123,
-                123,
-                120,
-                121,
-                120,
-                120,
-                120,
-                119,
-                120,
-                120,
-                121,
-                125,
-                128,
-                131,
-                132,
-                134,
-                133,
-                132,
-                130,
-                129,
-                128,
-                128,
-                128,
-                129,
-                129,
-                126,
-                125,
-                125,
-                124,
-                124,
-                123,
-                122,
-                122,
-                123,
-                121,
-                121,
-                118,
-                118,
-                115,
-                114,
-                113,
-                112,
-                112,
-                111,
-                112,
-                113,
-                113,
-                113,
-                112,
-                112,
-                114,
-                117,
-                117,
-                117,
-                118,
-                118,
-                118,
-                118,
-                118,
-                119,
-                118,
-                117,
-                117,
-                117,
-                118,
-                117,
-                120,
-                123,
-                126,
-                128,
-                134,
-                137,
-                141,
-                145,
-                149,
-                150,
-                150,
-                152,
-                152,
-                150,
-                150,
-                151,
-                150,
-                151,
-                148,
-                146,
-                145,
-                147,
-                146,
-                145,
-                145,
-                145,
-                147,
-                147,
-                147,
-                148,
-                148,
-                148,
-                148,
-                149,
-                149,
-                149,
-                150,
-                150,
-                150,
-                150,
-                151,
-                151,
-                151,
-                151,
-                152,
-                152,
-                152,
-                152,
-                152,
-                152,
-                151,
-                151,
-                151,
-                151,
-                151,
-                151,
-                151,
-                149,
-                147,
-                145,
-                144,
-                141,
-                141,
-                138,
-                137,
-                136,
-                136,
-                136,
-                137,
-                136,
-                136,
-                136,
-                134,
-                134,
-                133,
-                132,
-                133,
-                132,
-                132,
-                131,
-                131,
-                128,
-                127,
-                125,
-                125,
-                124,
-                124,
-                125,
-                127,
-                127,
-                128,
-                130,
-                131,
-                132,
-                135,
-                137,
-                140,
-                141,
-                142,
-                144,
-                145,
-                145,
-                147,
-                148,
-                149,
-                150,
-                150,
-                151,
-                151,
-                150,
-                151,
-                151,
-                151,
-                152,
-                152,
-                152,
-                152,
-                151,
-                151,
-                151,
-                150,
-                150,
-                148,
-                146,
-                145,
-                142,
-                142,
-                139,
-                138,
-                137,
-                134,
-                133,
-                133,
-                130,
-                126,
-                124,
-                120,
-                119,
-                117,
-                116,
-                113,
-                110,
-                110,
-                113,
-                115,
-                118,
-                120,
-                115,
-                110,
-                106,
-                109,
-                110,
-                115,
-                114,
-                111,
-                104,
-                94,
-                89,
-                84,
-                80,
-                83,
-                83,
-                84,
-                86,
-                85,
-                83,
-                85,
-                86,
-                87,
-                89,
-                88,
-                89,
-                89,
-                88,
-                87,
-                86,
-                85,
-                85,
-                84,
-                83,
-                83,
-                81,
-                83,
-                84,
-                83,
-                83,
-                87,
-                90,
-                92,
-                94,
-                94,
-                95,
-                95,
-                95,
-                95,
-                94,
-                94,
-                93,
-                93,
-                93,
-                93,
-                94,
-                93,
-                91,
-                92,
-                92,
-                93,
-                92,
-                89,
-                92,
-                92,
-                92,
-                89,
-                86,
-                86,
-                84,
-                85,
-                88,
-                91,
-                94,
-                92,
-                94,
-                95,
-                98,
-                101,
-                103,
-                103,
-                101,
-                100,
-                99,
-                101,
-                102,
-                101,
-                101,
-                102,
-                104,
-                101,
-                102,
-                102,
-                103,
-                107,
-                109,
-                114,
-                117,
-                117,
-                117,
-                118,
-                120,
-                120,
-                120,
-                121,
-                122,
-                122,
-                120,
-                116,
-                114,
-                113,
-                113,
-                114,
-                115,
-                118,
-                124,
-                125,
-                128,
-                129,
-                130,
-                131,
-                131,
-                130,
-                130,
-                129,
-                126,
-                126,
-                126,
-                127,
-                128,
-                129,
-                127,
-                127,
-                127,
-                127,
-                129,
-                129,
-                131,
-                132,
-                133,
-                135,
-                135,
-                137,
-                138,
-                139,
-                139,
-                138,
-                137,
-                137,
-                136,
-                136,
-                136,
-                137,
-                138,
-                139,
-                139,
-                140,
-                141,
-                142,
-                142,
-                143,
-                144,
-                144,
-                144,
-                145,
-                145,
-                147,
-                147,
-                146,
-                144,
-                141,
-                140,
-                136,
-                133,
-                129,
-                126,
-                124,
-                121,
-                118,
-                118,
-                118,
-                118,
-                120,
-                120,
-                119,
-                117,
-                114,
-                113,
-                110,
-                110,
-                112,
-                112,
-                114,
-                111,
-                109,
-                107,
-                110,
-                111,
-                114,
-                115,
-                115,
-                112,
-                114,
-                111,
-                112,
-                113,
-                112,
-                114,
-                112,
-                110,
-                113,
-                110,
-                113,
-                116,
-                118,
-                116,
-                119,
-                116,
-                116,
-                113,
-                113,
-                112,
-                114,
-                111,
-                110,
-                110,
-                110,
-                111,
-                111,
-                111,
-                112,
-                115,
-                115,
-                115,
-                114,
-                113,
-                115,
-                112,
-                111,
-                110,
-                109,
-                110,
-                110,
-                112,
-                109,
-                110,
-                109,
-                111,
-                115,
-                119,
-                121,
-                122,
-                123,
-                123,
-                123,
-                123,
-                123,
-                127,
-                128,
-                128,
-                128,
-                128,
-                129,
-                126,
-                125,
-                125,
-                123,
-                122,
-                125,
-                123,
-                122,
-                121,
-                121,
-                121,
-                121,
-                121,
-                120,
-                119,
-                119,
-                118,
-                119,
-                119,
-                121,
-                118,
-                118,
-                118,
-                117,
-                116,
-                117,
-                116,
-                117,
-                117,
-                116,
-                115,
-                116,
-                116,
-                116,
-                115,
-                115,
-                114,
-                118,
-                122,
-                127,
-                130,
-                136,
-                141,
-                144,
-                147,
-                151,
-                154,
-                155,
-                156,
-                156,
-                156,
-                156,
-                156,
-                154,
-                152,
-                150,
-                149,
-                147,
-                145,
-                144,
-                144,
-                144,
-                145,
-                145,
-                146,
-                146,
-                146,
-                147,
-                148,
-                148,
-                148,
-                150,
-                150,
-                153,
-                153,
-                152,
-                152,
-                150,
-                149,
-                149,
-                149,
-                148,
-                148,
-                148,
-                148,
-                150,
-                150,
-                150,
-                152,
-                153,
-                153,
-                154,
-                154,
-                155,
-                155,
-                154,
-                154,
-                154,
-                154,
-                154,
-                155,
-                155,
-                154,
-                154,
-                153,
-                151,
-                151,
-                151,
-                151,
-                152,
-                152,
-                152,
-                153,
-                153,
-                153,
-                154,
-                154,
-                155,
-                156,
-                156,
-                157,
-                158,
-                159,
-                159,
-                160,
-                161,
-                161,
-                161,
-                161,
-                162,
-                162,
-                163,
-                162,
-                161,
-                159,
-                158,
-                157,
-                156,
-                155,
-                155,
-                153,
-                152,
-                152,
-                152,
-                151,
-                151,
-                151,
-                151,
-                151,
-                150,
-                150,
-                150,
-                150,
-                151,
-                151,
-                152,
-                152,
-                151,
-                150,
-                149,
-                149,
-                148,
-                148,
-                147,
-                147,
-                146,
-                145,
-                145,
-                144,
-                143,
-                141,
-                138,
-                137,
-                135,
-                134,
-                134,
-                135,
-                137,
-                137,
-                138,
-                138,
-                135,
-                135,
-                136,
-                138,
-                138,
-                138,
-                139,
-                140,
-                139,
-                137,
-                137,
-                136,
-                135,
-                133,
-                130,
-                127,
-                126,
-                124,
-                123,
-                122,
-                121,
-                119,
-                119,
-                117,
-                117,
-                116,
-                116,
-                118,
-                120,
-                121,
-                124,
-                124,
-                124,
-                125,
-                126,
-                128,
-                129,
-                130,
-                132,
-                133,
-                134,
-                135,
-                137,
-                138,
-                139,
-                140,
-                140,
-                141,
-                143,
-                143,
-                145,
-                146,
-                147,
-                149,
-                150,
-                151,
-                152,
-                153,
-                155,
-                155,
-                156,
-                156,
-                157,
-                158,
-                158,
-                158,
-                158,
-                158,
-                158,
-                158,
-                158,
-                159,
-                159,
-                159,
-                158,
-                158,
-                157,
-                156,
-                156,
-                155,
-                155,
-                155,
-                156,
-                156,
-                156,
-                156,
-                156,
-                156,
-                156,
-                156,
-                157,
-                158,
-                158,
-                158,
-                159,
-                159,
-                159,
-                158,
-                159,
-                159,
-                158,
-                158,
-                158,
-                159,
-                158,
-                157,
-                157,
-                157,
-                156,
-                156,
-                155,
-                155,
-                156,
-                156,
-                156,
-                158,
-                158,
-                158,
-                159,
-                159,
-                159,
-                159,
-                159,
-                159,
-                159,
-                158,
-                157,
-                157,
-                157,
-                155,
-                154,
-                153,
-                153,
-                151,
-                151,
-                148,
-                148,
-                148,
-                149,
-                150,
-                150,
-                152,
-                153,
-                154,
-                154,
-                155,
-                155,
-                155,
-                155,
-                155,
-                155,
-                156,
-                155,
-                152,
-                152,
-                150,
-                148,
-                147,
-                145,
-                146,
-                147,
-                147,
-                148,
-                149,
-                151,
-                151,
-                153,
-                153,
-                154,
-                155,
-                155,
-                156,
-                158,
-                158,
-                159,
-                160,
-                160,
-                160,
-                161,
-                161,
-                162,
-                163,
-                163,
-                164,
-                164,
-                164,
-                165,
-                165,
-                165,
-                165,
-                165,
-                165,
-                164,
-                163,
-                162,
-                160,
-                160,
-                160,
-                159,
-                159,
-                158,
-                158,
-                158,
-                158,
-                158,
-                158,
-                159,
-                159,
-                159,
-                159,
-                159,
-                159,
-                158,
-                157,
-                156,
-                155,
-                154,
-                152,
-                151,
-                148,
-                148,
-                147,
-                146,
-                147,
-                148,
-                149,
-                149,
-                150,
-                150,
-                150,
-                150,
-                151,
-                152,
-                152,
-                152,
-                153,
-                153,
-                153,
-                154,
-                154,
-                155,
-                156,
-                157,
-                157,
-                157,
-                158,
-                158,
-                158,
-                158,
-                159,
-                159,
-                159,
-                160,
-                161,
-                161,
-                161,
-                160,
-                160,
-                160,
-                160,
-                160,
-                161,
-                162,
-                163,
-                163,
-                164,
-                165,
-                165,
-                165,
-                165,
-                164,
-                164,
-                163,
-                162,
-                161,
-                158,
-                157,
-                157,
-                158,
-                157,
-                160,
-                157,
-                158,
-                158,
-                158,
-                157,
-                157,
-                158,
-                158,
-                157,
-                156,
-                158,
-                155,
-                157,
-                157,
-                153,
-                146,
-                142,
-                136,
-                133,
-                127,
-                122,
-                117,
-                113,
-                112,
-                115,
-                118,
-                119,
-                121,
-                123,
-                126,
-                129,
-                128,
-                131,
-                130,
-                132,
-                133,
-                134,
-                134,
-                131,
-                125,
-                120,
-                117,
-                110,
-                105,
-                100,
-                94,
-                94,
-                93,
-                96,
-                93,
-                92,
-                94,
-                94,
-                98,
-                97,
-                99,
-                98,
-                103,
-                100,
-                103,
-                103,
-                105,
-                106,
-                107,
-                105,
-                104,
-                105,
-                105,
-                105,
-                106,
-                107,
-                108,
-                110,
-                110,
-                108,
-                109,
-                111,
-                113,
-                113,
-                115,
-                113,
-                113,
-                115,
-                114,
-                113,
-                114,
-                114,
-                115,
-                115,
-                115,
-                115,
-                113,
-                112,
-                112,
-                111,
-                113,
-                118,
-                116,
-                116,
-                116,
-                116,
-                116,
-                119,
-                119,
-                121,
-                122,
-                121,
-                121,
-                121,
-                122,
-                123,
-                123,
-                121,
-                125,
-                124,
-                124,
-                123,
-                122,
-                123,
-                122,
-                127,
-                131,
-                135,
-                135,
-                135,
-                136,
-                135,
-                136,
-                134,
-                138,
-                136,
-                137,
-                138,
-                137,
-                136,
-                138,
-                138,
-                138,
-                139,
-                136,
-                138,
-                137,
-                137,
-                138,
-                138,
-                139,
-                138,
-                141,
-                139,
-                139,
-                138,
-                138,
-                137,
-                137,
-                138,
-                138,
-                138,
-                138,
-                137,
-                137,
-                138,
-                137,
-                137,
-                136,
-                136,
-                138,
-                137,
-                136,
-                137,
-                137,
-                136,
-                136,
-                135,
-                137,
-                137,
-                139,
-                140,
-                142,
-                140,
-                143,
-                143,
-                144,
-                145,
-                145,
-                144,
-                145,
-                144,
-                143,
-                143,
-                143,
-                143,
-                136,
-                138,
-                140,
-                142,
-                138,
-                137,
-                136,
-                141,
-                145,
-                149,
-                151,
-                151,
-                152,
-                151,
-                149,
-                151,
-                151,
-                150,
-                150,
-                149,
-                150,
-                150,
-                149,
-                150,
-                149,
-                150,
-                150,
-                150,
-                150,
-                147,
-                148,
-                146,
-                144,
-                146,
-                145,
-                146,
-                145,
-                146,
-                147,
-                146,
-                146,
-                146,
-                146,
-                145,
-                145,
-                145,
-                144,
-                145,
-                143,
-                144,
-                144,
-                144,
-                144,
-                142,
-                142,
-                143,
-                143,
-                142,
-                142,
-                142,
-                143,
-                141,
-                141,
-                140,
-                140,
-                139,
-                139,
-                141,
-                138,
-                139,
-                140,
-                141,
-                141,
-                141,
-                141,
-                141,
-                141,
-                140,
-                140,
-                140,
-                141,
-                142,
-                142,
-                141,
-                141,
-                142,
-                143,
-                143,
-                143,
-                142,
-                142,
-                142,
-                142,
-                142,
-                141,
-                141,
-                140,
-                141,
-                141,
-                141,
-                142,
-                141,
-                139,
-                140,
-                140,
-                142,
-                141,
-                142,
-                138,
-                135,
-                133,
-                131,
-                129,
-                128,
-                128,
-                128,
-                127,
-                127,
-                128,
-                127,
-                127,
-                128,
-                128,
-                128,
-                126,
-                129,
-                128,
-                128,
-                128,
-                127,
-                133,
-                136,
-                135,
-                134,
-                134,
-                133,
-                133,
-                136,
-                135,
-                136,
-                134,
-                137,
-                136,
-                136,
-                137,
-                136,
-                132,
-                126,
-                121,
-                115,
-                110,
-                106,
-                100,
-                102,
-                105,
-                100,
-                96,
-                91,
-                92,
-                89,
-                91,
-                92,
-                95,
-                95,
-                98,
-                100,
-                95,
-                87,
-                86,
-                89,
-                89,
-                91,
-                91,
-                94,
-                94,
-                93,
-                95,
-                95,
-                96,
-                98,
-                96,
-                95,
-                96,
-                99,
-                97,
-                97,
-                98,
-                100,
-                99,
-                101,
-                100,
-                101,
-                102,
-                101,
-                101,
-                100,
-                101,
-                105,
-                109,
-                112,
-                114,
-                117,
-                122,
-                127,
-                128,
-                128,
-                129,
-                129,
-                129,
-                131,
-                132,
-                133,
-                134,
-                135,
-                137,
-                140,
-                139,
-                139,
-                140,
-                140,
-                140,
-                140,
-                139,
-                139,
-                140,
-                138,
-                138,
-                138,
-                138,
-                139,
-                139,
-                138,
-                138,
-                135,
-                130,
-                129,
-                129,
-                129,
-                130,
-                131,
-                131,
-                131,
-                131,
-                131,
-                131,
-                130,
-                129,
-                128,
-                128,
-                128,
-                125,
-                122,
-                120,
-                119,
-                118,
-                118,
-                118,
-                118,
-                118,
-                118,
-                117,
-                116,
-                118,
-                119,
-                119,
-                118,
-                117,
-                117,
-                118,
-                118,
-                119,
-                118,
-                119,
-                119,
-                121,
-                122,
-                121,
-                122,
-                121,
-                122,
-                121,
-                122,
-                122,
-                121,
-                120,
-                120,
-                119,
-                122,
-                123,
-                128,
-                129,
-                130,
-                131,
-                132,
-                133,
-                132,
-                131,
-                130,
-                131,
-                131,
-                130,
-                131,
-                132,
-                134,
-                133,
-                133,
-                132,
-                132,
-                133,
-                132,
-                133,
-                133,
-                134,
-                134,
-                134,
-                133,
-                133,
-                133,
-                132,
-                130,
-                130,
-                130,
-                129,
-                128,
-                128,
-                127,
-                126,
-                125,
-                125,
-                125,
-                124,
-                124,
-                124,
-                125,
-                126,
-                125,
-                125,
-                122,
-                121,
-                119,
-                118,
-                117,
-                117,
-                117,
-                117,
-                118,
-                117,
-                117,
-                117,
-                116,
-                116,
-                117,
-                117,
-                118,
-                118,
-                119,
-                119,
-                118,
-                118,
-                117,
-                122,
-                122,
-                125,
-                126,
-                127,
-                126,
-                127,
-                126,
-                126,
-                126,
-                127,
-                124,
-                124,
-                124,
-                123,
-                126,
-                128,
-                128,
-                127,
-                124,
-                123,
-                122,
-                123,
-                124,
-                126,
-                127,
-                128,
-                128,
-                129,
-                130,
-                133,
-                135,
-                136,
-                138,
-                141,
-                142,
-                145,
-                147,
-                148,
-                149,
-                150,
-                151,
-                151,
-                151,
-                152,
-                153,
-                153,
-                153,
-                154,
-                155,
-                155,
-                157,
-                157,
-                158,
-                158,
-                159,
-                159,
-                158,
-                158,
-                157,
-                156,
-                155,
-                155,
-                155,
-                155,
-                155,
-                156,
-                155,
-                156,
-                156,
-                156,
-                156,
-                157,
-                157,
-                157,
-                157,
-                157,
-                157,
-                157,
-                158,
-                157,
-                158,
-                157,
-                157,
-                156,
-                155,
-                154,
-                154,
-                153,
-                153,
-                153,
-                154,
-                155,
-                156,
-                156,
-                158,
-                158,
-                159,
-                160,
-                160,
-                161,
-                161,
-                161,
-                161,
-                161,
-                161,
-                161,
-                161,
-                162,
-                162,
-                162,
-                162,
-                162,
-                162,
-                162,
-                162,
-                162,
-                162,
-                163,
-                163,
-                163,
-                163,
-                163,
-                162,
-                162,
-                162,
-                163,
-                163,
-                163,
-                162,
-                162,
-                162,
-                160,
-                160,
-                160,
-                160,
-                160,
-                160,
-                160,
-                159,
-                159,
-                159,
-                159,
-                159,
-                158,
-                157,
-                157,
-                157,
-                157,
-                157,
-                157,
-                157,
-                157,
-                158,
-                158,
-                159,
-                160,
-                160,
-                161,
-                161,
-                161,
-                161,
-                162,
-                162,
-                162,
-                162,
-                162,
-                162,
-                162,
-                163,
-                163,
-                164,
-                164,
-                164,
-                164,
-                164,
-                164,
-                163,
-                163,
-                163,
-                163,
-                163,
-                164,
-                164,
-                164,
-                164,
-                164,
-                164,
-                163,
-                163,
-                163,
-                161,
-                160,
-                160,
-                160,
-                160,
-                161,
-                161,
-                160,
-                160,
-                160,
-                160,
-                160,
-                159,
-                159,
-                159,
-                158,
-                159,
-                159,
-                159,
-                160,
-                160,
-                161,
-                161,
-                161,
-                161,
-                161,
-                161,
-                160,
-                160,
-                160,
-                160,
-                160,
-                160,
-                159,
-                158,
-                157,
-                157,
-                157,
-                156,
-                156,
-                156,
-                156,
-                156,
-                156,
-                157,
-                157,
-                157,
-                158,
-                158,
-                159,
-                159,
-                161,
-                161,
-                162,
-                163,
-                164,
-                164,
-                165,
-                165,
-                166,
-                166,
-                166,
-                167,
-                167,
-                167,
-                167,
-                167,
-                167,
-                167,
-                166,
-                166,
-                166,
-                166,
-                167,
-                167,
-                165,
-                165,
-                165,
-                165,
-                165,
-                164,
-                164,
-                163,
-                163,
-                162,
-                161,
-                160,
-                160,
-                161,
-                160,
-                159,
-                159,
-                160,
-                160,
-                159,
-                158,
-                158,
-                160,
-                159,
-                158,
-                158,
-                158,
-                157,
-                156,
-                156,
-                156,
-                156,
-                155,
-                155,
-                153,
-                150,
-                149,
-                147,
-                144,
-                143,
-                145,
-                146,
-                146,
-                142,
-                138,
-                131,
-                128,
-                126,
-                124,
-                124,
-                123,
-                126,
-                128,
-                123,
-                121,
-                118,
-                116,
-                113,
-                112,
-                112,
-                111,
-                111,
-                111,
-                110,
-                110,
-                109,
-                109,
-                110,
-                111,
-                110,
-                110,
-                109,
-                112,
-                112,
-                111,
-                113,
-                112,
-                112,
-                113,
-                112,
-                113,
-                112,
-                114,
-                114,
-                113,
-                115,
-                114,
-                115,
-                117,
-                117,
-                119,
-                120,
-                123,
-                126,
-                126,
-                125,
-                127,
-                127,
-                128,
-                128,
-                128,
-                129,
-                132,
-                136,
-                141,
-                144,
-                145,
-                145,
-                145,
-                146,
-                146,
-                148,
-                147,
-                147,
-                146,
-                147,
-                144,
-                144,
-                146,
-                147,
-                148,
-                147,
-                147,
-                147,
-                147,
-                146,
-                146,
-                147,
-                147,
-                146,
-                145,
-                146,
-                148,
-                152,
-                154,
-                157,
-                160,
-                158,
-                158,
-                158,
-                156,
-                157,
-                156,
-                157,
-                157,
-                157,
-                158,
-                159,
-                158,
-                159,
-                158,
-                160,
-                160,
-                159,
-                160,
-                159,
-                161,
-                160,
-                159,
-                160,
-                160,
-                160,
-                160,
-                160,
-                160,
-                160,
-                159,
-                158,
-                155,
-                154,
-                150,
-                148,
-                144,
-                142,
-                142,
-                144,
-                143,
-                142,
-                141,
-                140,
-                140,
-                140,
-                141,
-                139,
-                140,
-                143,
-                144,
-                143,
-                143,
-                143,
-                143,
-                138,
-                138,
-                135,
-                132,
-                132,
-                131,
-                132,
-                133,
-                133,
-                134,
-                134,
-                134,
-                135,
-                136,
-                136,
-                136,
-                138,
-                139,
-                141,
-                142,
-                142,
-                146,
-                147,
-                148,
-                148,
-                150,
-                150,
-                150,
-                150,
-                151,
-                152,
-                152,
-                152,
-                152,
-                153,
-                154,
-                154,
-                155,
-                155,
-                155,
-                155,
-                156,
-                157,
-                157,
-                157,
-                156,
-                156,
-                155,
-                155,
-                155,
-                155,
-                155,
-                155,
-                154,
-                154,
-                153,
-                153,
-                152,
-                150,
-                149,
-                148,
-                145,
-                145,
-                144,
-                144,
-                143,
-                143,
-                144,
-                145,
-                145,
-                145,
-                146,
-                147,
-                147,
-                149,
-                149,
-                150,
-                150,
-                151,
-                150,
-                150,
-                149,
-                149,
-                149,
-                148,
-                147,
-                146,
-                146,
-                146,
-                147,
-                147,
-                146,
-                145,
-                145,
-                143,
-                140,
-                139,
-                139,
-                138,
-                134,
-                131,
-                128,
-                130,
-                130,
-                130,
-                127,
-                127,
-                128,
-                127,
-                128,
-                131,
-                133,
-                136,
-                134,
-                131,
-                131,
-                128,
-                122,
-                116,
-                112,
-                107,
-                101,
-                95,
-                92,
-                86,
-                88,
-                90,
-                88,
-                87,
-                86,
-                85,
-                85,
-                85,
-                84,
-                87,
-                90,
-                90,
-                93,
-                90,
-                91,
-                88,
-                91,
-                87,
-                89,
-                89,
-                92,
-                92,
-                89,
-                92,
-                92,
-                90,
-                89,
-                89,
-                90,
-                89,
-                88,
-                88,
-                89,
-                88,
-                89,
-                88,
-                85,
-                88,
-                88,
-                88,
-                90,
-                89,
-                88,
-                85,
-                90,
-                87,
-                88,
-                88,
-                90,
-                94,
-                96,
-                99,
-                100,
-                102,
-                107,
-                108,
-                109,
-                109,
-                109,
-                110,
-                110,
-                110,
-                110,
-                109,
-                109,
-                108,
-                109,
-                108,
-                106,
-                107,
-                108,
-                107,
-                109,
-                106,
-                106,
-                105,
-                107,
-                103,
-                104,
-                104,
-                105,
-                104,
-                100,
-                100,
-                99,
-                99,
-                101,
-                100,
-                99,
-                98,
-                97,
-                98,
-                97,
-                98,
-                98,
-                98,
-                96,
-                98,
-                98,
-                97,
-                97,
-                96,
-                96,
-                96,
-                99,
-                95,
-                95,
-                95,
-                96,
-                92,
-                93,
-                94,
-                97,
-                94,
-                94,
-                91,
-                94,
-                94,
-                95,
-                93,
-                94,
-                93,
-                94,
-                93,
-                92,
-                92,
-                90,
-                93,
-                94,
-                92,
-                91,
-                92,
-                92,
-                93,
-                93,
-                92,
-                91,
-                92,
-                91,
-                92,
-                92,
-                89,
-                89,
-                89,
-                89,
-                91,
-                91,
-                88,
-                88,
-                87,
-                89,
-                90,
-                90,
-                89,
-                90,
-                88,
-                89,
-                89,
-                90,
-                88,
-                89,
-                88,
-                88,
-                88,
-                89,
-                91,
-                91,
-                92,
-                93,
-                97,
-                97,
-                97,
-                98,
-                97,
-                98,
-                97,
-                96,
-                96,
-                97,
-                98,
-                100,
-                95,
-                95,
-                94,
-                97,
-                97,
-                97,
-                97,
-                98,
-                97,
-                97,
-                98,
-                98,
-                99,
-                99,
-                99,
-                103,
-                100,
-                100,
-                101,
-                101,
-                102,
-                100,
-                100,
-                101,
-                101,
-                101,
-                101,
-                102,
-                103,
-                109,
-                113,
-                115,
-                116,
-                119,
-                120,
-                120,
-                119,
-                119,
-                119,
-                119,
-                118,
-                116,
-                114,
-                114,
-                113,
-                113,
-                113,
-                113,
-                113,
-                113,
-                112,
-                109,
-                109,
-                109,
-                110,
-                110,
-                108,
-                109,
-                107,
-                107,
-                106,
-                106,
-                105,
-                107,
-                104,
-                102,
-                103,
-                102,
-                109,
-                114,
-                120,
-                125,
-                127,
-                128,
-                129,
-                127,
-                124,
-                123,
-                124,
-                124,
-                123,
-                120,
-                120,
-                121,
-                118,
-                122,
-                118,
-                118,
-                116,
-                117,
-                117,
-                120,
-                119,
-                119,
-                123,
-                127,
-                129,
-                136,
-                139,
-                141,
-                142,
-                144,
-                146,
-                146,
-                146,
-                146,
-                146,
-                145,
-                144,
-                144,
-                142,
-                142,
-                142,
-                142,
-                144,
-                144,
-                144,
-                145,
-                146,
-                146,
-                146,
-                146,
-                146,
-                147,
-                147,
-                146,
-                146,
-                145,
-                144,
-                142,
-                143,
-                145,
-                145,
-                144,
-                143,
-                143,
-                143,
-                143,
-                143,
-                142,
-                140,
-                140,
-                140,
-                140,
-                139,
-                139,
-                138,
-                138,
-                137,
-                137,
-                137,
-                138,
-                139,
-                140,
-                142,
-                142,
-                142,
-                142,
-                142,
-                143,
-                143,
-                143,
-                144,
-                144,
-                144,
-                144,
-                145,
-                145,
-                146,
-                147,
-                148,
-                149,
-                149,
-                150,
-                150,
-                150,
-                150,
-                150,
-                150,
-                150,
-                149,
-                150,
-                150,
-                150,
-                151,
-                151,
-                152,
-                152,
-                153,
-                153,
-                153,
-                153,
-                153,
-                152,
-                152,
-                153,
-                154,
-                153,
-                153,
-                153,
-                149,
-                148,
-                148,
-                148,
-                147,
-                145,
-                146,
-                146,
-                146,
-                145,
-                146,
-                147,
-                146,
-                144,
-                143,
-                145,
-                142,
-                143,
-                143,
-                143,
-                143,
-                143,
-                142,
-                142,
-                142,
-                142,
-                145,
-                148,
-                149,
-                149,
-                151,
-                151,
-                149,
-                150,
-                149,
-                149,
-                151,
-                148,
-                144,
-                141,
-                135,
-                132,
-                131,
-                133,
-                132,
-                132,
-                131,
-                132,
-                131,
-                132,
-                131,
-                130,
-                129,
-                132,
-                134,
-                130,
-                133,
-                136,
-                136,
-                136,
-                137,
-                137,
-                136,
-                137,
-                138,
-                138,
-                138,
-                136,
-                136,
-                133,
-                135,
-                135,
-                134,
-                133,
-                134,
-                133,
-                134,
-                132,
-                132,
-                132,
-                132,
-                132,
-                130,
-                128,
-                129,
-                129,
-                130,
-                130,
-                131,
-                132,
-                132,
-                130,
-                133,
-                133,
-                132,
-                131,
-                132,
-                135,
-                135,
-                135,
-                135,
-                134,
-                133,
-                134,
-                133,
-                134,
-                134,
-                135,
-                137,
-                137,
-                137,
-                136,
-                133,
-                128,
-                123,
-                120,
-                117,
-                114,
-                113,
-                113,
-                111,
-                114,
-                115,
-                113,
-                113,
-                112,
-                113,
-                114,
-                114,
-                114,
-                113,
-                112,
-                113,
-                112,
-                112,
-                113,
-                114,
-                113,
-                112,
-                111,
-                112,
-                113,
-                112,
-                113,
-                111,
-                111,
-                114,
-                116,
-                119,
-                121,
-                122,
-                122,
-                125,
-                124,
-                124,
-                122,
-                124,
-                122,
-                123,
-                122,
-                123,
-                123,
-                124,
-                122,
-                122,
-                122,
-                120,
-                120,
-                121,
-                121,
-                123,
-                124,
-                126,
-                126,
-                128,
-                129,
-                128,
-                124,
-                122,
-                120,
-                118,
-                117,
-                117,
-                118,
-                119,
-                116,
-                117,
-                117,
-                116,
-                119,
-                119,
-                119,
-                119,
-                121,
-                122,
-                124,
-                123,
-                121,
-                123,
-                123,
-                124,
-                128,
-                129,
-                130,
-                130,
-                130,
-                129,
-                130,
-                127,
-                127,
-                128,
-                132,
-                130,
-                131,
-                132,
-                130,
-                131,
-                130,
-                129,
-                130,
-                129,
-                134,
-                133,
-                131,
-                131,
-                131,
-                129,
-                124,
-                124,
-                122,
-                122,
-                120,
-                117,
-                114,
-                113,
-                112,
-                112,
-                115,
-                116,
-                113,
-                113,
-                113,
-                116,
-                119,
-                119,
-                119,
-                121,
-                122,
-                122,
-                123,
-                125,
-                125,
-                125,
-                124,
-                125,
-                128,
-                127,
-                129,
-                128,
-                127,
-                130,
-                131,
-                130,
-                131,
-                132,
-                129,
-                128,
-                126,
-                126,
-                127,
-                126,
-                132,
-                133,
-                134,
-                134,
-                134,
-                135,
-                134,
-                132,
-                132,
-                131,
-                131,
-                130,
-                130,
-                128,
-                131,
-                130,
-                133,
-                133,
-                137,
-                135,
-                134,
-                135,
-                135,
-                136,
-                136,
-                135,
-                135,
-                135,
-                134,
-                133,
-                132,
-                133,
-                132,
-                129,
-                129,
-                129,
-                127,
-                128,
-                129,
-                130,
-                131,
-                132,
-                132,
-                131,
-                130,
-                128,
-                129,
-                129,
-                128,
-                128,
-                129,
-                130,
-                130,
-                129,
-                128,
-                128,
-                127,
-                127,
-                126,
-                126,
-                129,
-                128,
-                130,
-                131,
-                131,
-                128,
-                128,
-                128,
-                130,
-                128,
-                127,
-                126,
-                126,
-                126,
-                126,
-                127,
-                127,
-                125,
-                126,
-                125,
-                124,
-                124,
-                123,
-                124,
-                123,
-                122,
-                121,
-                120,
-                119,
-                119,
-                119,
-                119,
-                118,
-                119,
-                119,
-                118,
-                118,
-                118,
-                117,
-                117,
-                118,
-                118,
-                116,
-                117,
-                117,
-                118,
-                119,
-                121,
-                122,
-                123,
-                123,
-                123,
-                123,
-                122,
-                121,
-                118,
-                118,
-                118,
-                117,
-                117,
-                119,
-                121,
-                124,
-                126,
-                129,
-                129,
-                131,
-                130,
-                130,
-                130,
-                130,
-                134,
-                133,
-                134,
-                134,
-                134,
-                133,
-                132,
-                134,
-                136,
-                133,
-                132,
-                132,
-                130,
-                131,
-                128,
-                127,
-                128,
-                132,
-                135,
-                131,
-                133,
-                132,
-                129,
-                132,
-                129,
-                133,
-                134,
-                129,
-                131,
-                131,
-                131,
-                130,
-                130,
-                124,
-                120,
-                117,
-                120,
-                116,
-                113,
-                111,
-                108,
-                107,
-                107,
-                108,
-                108,
-                108,
-                108,
-                111,
-                111,
-                114,
-                118,
-                119,
-                119,
-                120,
-                120,
-                122,
-                123,
-                123,
-                125,
-                127,
-                128,
-                129,
-                132,
-                134,
-                136,
-                139,
-                140,
-                141,
-                141,
-                142,
-                143,
-                143,
-                143,
-                142,
-                141,
-                140,
-                140,
-                140,
-                141,
-                140,
-                139,
-                138,
-                137,
-                136,
-                136,
-                136,
-                136,
-                135,
-                135,
-                135,
-                135,
-                136,
-                136,
-                136,
-                137,
-                137,
-                140,
-                136,
-                137,
-                138,
-                138,
-                140,
-                140,
-                140,
-                140,
-                140,
-                140,
-                140,
-                140,
-                140,
-                138,
-                138,
-                139,
-                139,
-                138,
-                138,
-                138,
-                138,
-                135,
-                132,
-                132,
-                129,
-                127,
-                126,
-                126,
-                126,
-                126,
-                123,
-                121,
-                120,
-                118,
-                118,
-                118,
-                117,
-                119,
-                121,
-                120,
-                117,
-                118,
-                119,
-                120,
-                120,
-                120,
-                123,
-                122,
-                120,
-                119,
-                117,
-                116,
-                116,
-                113,
-                114,
-                116,
-                115,
-                116,
-                115,
-                112,
-                109,
-                107,
-                103,
-                101,
-                102,
-                99,
-                103,
-                101,
-                102,
-                105,
-                107,
-                107,
-            ],
-            "series_type": "distance",
-            "original_size": 3225,
-            "resolution": "high",
-        },
-        "time": {
-            "data": [
-                0,
-                1,
-                2,
-                3,
-                4,
-                5,
-                6,
-                8,
-                18,
-                26,
-                27,
-                28,
-                31,
-                42,
-                44,
-                53,
-                71,
-                75,
-                81,
-                83,
-                89,
-                97,
-                99,
-                100,
-                101,
-                102,
-                103,
-                105,
-                106,
-                108,
-                109,
-                114,
-                118,
-                119,
-                122,
-                126,
-                128,
-                129,
-                130,
-                134,
-                135,
-                141,
-                143,
-                146,
-                150,
-                151,
-                152,
-                155,
-                160,
-                162,
-                163,
-                167,
-                168,
-                170,
-                172,
-                174,
-                177,
-                178,
-                179,
-                180,
-                181,
-                183,
-                184,
-                185,
-                187,
-                188,
-                189,
-                191,
-                192,
-                193,
-                195,
-                196,
-                198,
-                200,
-                201,
-                202,
-                204,
-                208,
-                209,
-                212,
-                213,
-                215,
-                216,
-                218,
-                220,
-                221,
-                224,
-                225,
-                226,
-                228,
-                229,
-                231,
-                232,
-                233,
-                234,
-                236,
-                238,
-                240,
-                241,
-                242,
-                243,
-                244,
-                246,
-                249,
-                253,
-                254,
-                255,
-                256,
-                258,
-                259,
-                260,
-                261,
-                262,
-                264,
-                265,
-                270,
-                271,
-                273,
-                277,
-                279,
-                281,
-                285,
-                290,
-                291,
-                293,
-                294,
-                297,
-                298,
-                302,
-                303,
-                305,
-                307,
-                308,
-                311,
-                314,
-                315,
-                320,
-                321,
-                324,
-                327,
-                328,
-                330,
-                331,
-                333,
-                335,
-                340,
-                341,
-                342,
-                346,
-                351,
-                352,
-                353,
-                354,
-                355,
-                356,
-                361,
-                362,
-                364,
-                365,
-                367,
-                372,
-                373,
-                377,
-                378,
-                379,
-                380,
-                381,
-                383,
-                385,
-                386,
-                387,
-                389,
-                391,
-                392,
-                395,
-                396,
-                397,
-                399,
-                401,
-                402,
-                404,
-                405,
-                406,
-                409,
-                413,
-                414,
-                415,
-                416,
-                420,
-                421,
-                426,
-                427,
-                432,
-                434,
-                436,
-                437,
-                439,
-                444,
-                445,
-                446,
-                448,
-                449,
-                451,
-                454,
-                455,
-                460,
-                462,
-                466,
-                467,
-                470,
-                474,
-                477,
-                478,
-                479,
-                482,
-                484,
-                486,
-                487,
-                491,
-                498,
-                502,
-                508,
-                513,
-                517,
-                519,
-                521,
-                522,
-                523,
-                526,
-                527,
-                528,
-                532,
-                533,
-                534,
-                538,
-                540,
-                545,
-                549,
-                550,
-                555,
-                556,
-                560,
-                561,
-                563,
-                566,
-                567,
-                571,
-                576,
-                581,
-                585,
-                591,
-                592,
-                593,
-                595,
-                598,
-                599,
-                600,
-                601,
-                602,
-                603,
-                604,
-                605,
-                607,
-                610,
-                611,
-                613,
-                616,
-                617,
-                618,
-                620,
-                621,
-                622,
-                623,
-                624,
-                625,
-                626,
-                627,
-                629,
-                630,
-                631,
-                636,
-                641,
-                647,
-                648,
-                651,
-                656,
-                657,
-                658,
-                660,
-                663,
-                666,
-                668,
-                670,
-                673,
-                674,
-                677,
-                679,
-                680,
-                681,
-                683,
-                685,
-                686,
-                687,
-                688,
-                689,
-                691,
-                692,
-                694,
-                696,
-                698,
-                699,
-                701,
-                702,
-                703,
-                706,
-                707,
-                708,
-                710,
-                711,
-                712,
-                715,
-                717,
-                718,
-                722,
-                723,
-                728,
-                734,
-                736,
-                740,
-                742,
-                745,
-                746,
-                750,
-                752,
-                754,
-                756,
-                758,
-                761,
-                763,
-                766,
-                768,
-                772,
-                773,
-                775,
-                777,
-                778,
-                782,
-                783,
-                785,
-                788,
-                793,
-                794,
-                797,
-                799,
-                802,
-                803,
-                806,
-                809,
-                810,
-                812,
-                816,
-                817,
-                818,
-                820,
-                822,
-                824,
-                825,
-                827,
-                830,
-                832,
-                833,
-                836,
-                840,
-                841,
-                845,
-                847,
-                848,
-                853,
-                855,
-                857,
-                862,
-                863,
-                866,
-                868,
-                869,
-                871,
-                873,
-                875,
-                876,
-                878,
-                883,
-                889,
-                895,
-                897,
-                901,
-                902,
-                907,
-                909,
-                917,
-                921,
-                923,
-                924,
-                927,
-                928,
-                929,
-                931,
-                932,
-                940,
-                942,
-                945,
-                949,
-                950,
-                954,
-                958,
-                964,
-                967,
-                969,
-                970,
-                974,
-                975,
-                976,
-                983,
-                985,
-                986,
-                987,
-                988,
-                989,
-                990,
-                991,
-                993,
-                994,
-                996,
-                998,
-                999,
-                1003,
-                1008,
-                1009,
-                1012,
-                1015,
-                1017,
-                1020,
-                1023,
-                1024,
-                1028,
-                1029,
-                1031,
-                1033,
-                1038,
-                1040,
-                1042,
-                1046,
-                1047,
-                1048,
-                1050,
-                1052,
-                1053,
-                1055,
-                1056,
-                1058,
-                1059,
-                1060,
-                1062,
-                1063,
-                1066,
-                1067,
-                1068,
-                1071,
-                1072,
-                1073,
-                1075,
-                1080,
-                1081,
-                1085,
-                1088,
-                1096,
-                1104,
-                1111,
-                1113,
-                1114,
-                1115,
-                1119,
-                1121,
-                1125,
-                1126,
-                1132,
-                1134,
-                1137,
-                1139,
-                1144,
-                1145,
-                1146,
-                1153,
-                1154,
-                1155,
-                1158,
-                1159,
-                1164,
-                1168,
-                1172,
-                1174,
-                1175,
-                1178,
-                1183,
-                1184,
-                1186,
-                1187,
-                1188,
-                1189,
-                1192,
-                1193,
-                1196,
-                1198,
-                1200,
-                1201,
-                1202,
-                1204,
-                1209,
-                1212,
-                1214,
-                1218,
-                1219,
-                1221,
-                1224,
-                1227,
-                1229,
-                1232,
-                1233,
-                1235,
-                1238,
-                1239,
-                1240,
-                1241,
-                1242,
-                1243,
-                1245,
-                1249,
-                1250,
-                1256,
-                1257,
-                1260,
-                1264,
-                1265,
-                1266,
-                1268,
-                1271,
-                1272,
-                1276,
-                1277,
-                1278,
-                1280,
-                1282,
-                1283,
-                1285,
-                1287,
-                1288,
-                1290,
-                1291,
-                1294,
-                1295,
-                1303,
-                1304,
-                1305,
-                1309,
-                1313,
-                1316,
-                1318,
-                1320,
-                1322,
-                1325,
-                1327,
-                1329,
-                1331,
-                1333,
-                1335,
-                1336,
-                1339,
-                1342,
-                1343,
-                1345,
-                1347,
-                1348,
-                1352,
-                1353,
-                1361,
-                1369,
-                1375,
-                1376,
-                1379,
-                1382,
-                1385,
-                1387,
-                1388,
-                1391,
-                1394,
-                1396,
-                1399,
-                1406,
-                1412,
-                1413,
-                1415,
-                1417,
-                1420,
-                1422,
-                1429,
-                1431,
-                1439,
-                1448,
-                1456,
-                1457,
-                1458,
-                1464,
-                1473,
-                1474,
-                1477,
-                1486,
-                1494,
-                1498,
-                1503,
-                1507,
-                1512,
-                1519,
-                1520,
-                1526,
-                1529,
-                1537,
-                1540,
-                1543,
-                1547,
-                1549,
-                1552,
-                1559,
-                1565,
-                1568,
-                1578,
-                1581,
-                1587,
-                1592,
-                1599,
-                1602,
-                1604,
-                1605,
-                1607,
-                1610,
-                1611,
-                1612,
-                1613,
-                1615,
-                1617,
-                1618,
-                1619,
-                1620,
-                1621,
-                1623,
-                1624,
-                1625,
-                1627,
-                1628,
-                1630,
-                1631,
-                1632,
-                1633,
-                1635,
-                1636,
-                1637,
-                1638,
-                1639,
-                1640,
-                1641,
-                1642,
-                1643,
-                1644,
-                1645,
-                1648,
-                1650,
-                1653,
-                1654,
-                1656,
-                1659,
-                1662,
-                1666,
-                1671,
-                1672,
-                1675,
-                1678,
-                1679,
-                1680,
-                1684,
-                1687,
-                1689,
-                1690,
-                1692,
-                1693,
-                1694,
-                1695,
-                1697,
-                1699,
-                1701,
-                1702,
-                1704,
-                1705,
-                1706,
-                1707,
-                1709,
-                1710,
-                1711,
-                1712,
-                1714,
-                1717,
-                1718,
-                1720,
-                1723,
-                1726,
-                1728,
-                1729,
-                1731,
-                1732,
-                1733,
-                1734,
-                1735,
-                1736,
-                1737,
-                1738,
-                1739,
-                1741,
-                1744,
-                1746,
-                1749,
-                1750,
-                1751,
-                1753,
-                1756,
-                1759,
-                1763,
-                1765,
-                1767,
-                1769,
-                1773,
-                1776,
-                1778,
-                1779,
-                1781,
-                1782,
-                1783,
-                1784,
-                1785,
-                1787,
-                1788,
-                1789,
-                1792,
-                1794,
-                1795,
-                1797,
-                1798,
-                1803,
-                1804,
-                1806,
-                1808,
-                1809,
-                1810,
-                1812,
-                1814,
-                1815,
-                1817,
-                1820,
-                1821,
-                1823,
-                1827,
-                1829,
-                1831,
-                1835,
-                1836,
-                1841,
-                1843,
-                1846,
-                1850,
-                1851,
-                1854,
-                1856,
-                1860,
-                1862,
-                1866,
-                1869,
-                1870,
-                1875,
-                1878,
-                1881,
-                1883,
-                1885,
-                1887,
-                1889,
-                1891,
-                1894,
-                1895,
-                1896,
-                1898,
-                1899,
-                1901,
-                1902,
-                1905,
-                1907,
-                1909,
-                1910,
-                1912,
-                1915,
-                1916,
-                1917,
-                1919,
-                1921,
-                1923,
-                1927,
-                1930,
-                1933,
-                1938,
-                1939,
-                1943,
-                1946,
-                1948,
-                1951,
-                1957,
-                1958,
-                1960,
-                1963,
-                1964,
-                1967,
-                1971,
-                1972,
-                1975,
-                1978,
-                1980,
-                1985,
-                1987,
-                1989,
-                1991,
-                1992,
-                1994,
-                1997,
-                2001,
-                2003,
-                2006,
-                2008,
-                2009,
-                2010,
-                2011,
-                2013,
-                2015,
-                2016,
-                2018,
-                2019,
-                2020,
-                2022,
-                2023,
-                2025,
-                2027,
-                2029,
-                2032,
-                2037,
-                2038,
-                2042,
-                2047,
-                2051,
-                2053,
-                2057,
-                2059,
-                2061,
-                2062,
-                2064,
-                2066,
-                2069,
-                2073,
-                2074,
-                2077,
-                2079,
-                2086,
-                2088,
-                2090,
-                2091,
-                2093,
-                2094,
-                2095,
-                2097,
-                2099,
-                2100,
-                2103,
-                2104,
-                2106,
-                2107,
-                2109,
-                2111,
-                2112,
-                2115,
-                2116,
-                2117,
-                2118,
-                2120,
-                2124,
-                2125,
-                2127,
-                2129,
-                2130,
-                2131,
-                2133,
-                2135,
-                2136,
-                2139,
-                2140,
-                2141,
-                2142,
-                2144,
-                2145,
-                2147,
-                2149,
-                2150,
-                2152,
-                2154,
-                2155,
-                2156,
-                2159,
-                2162,
-                2163,
-                2165,
-                2166,
-                2170,
-                2172,
-                2173,
-                2175,
-                2178,
-                2179,
-                2183,
-                2188,
-                2191,
-                2193,
-                2196,
-                2197,
-                2200,
-                2203,
-                2204,
-                2207,
-                2209,
-                2212,
-                2213,
-                2215,
-                2217,
-                2219,
-                2222,
-                2223,
-                2224,
-                2225,
-                2227,
-                2230,
-                2233,
-                2235,
-                2236,
-                2240,
-                2242,
-                2246,
-                2248,
-                2251,
-                2255,
-                2256,
-                2260,
-                2261,
-                2262,
-                2266,
-                2267,
-                2271,
-                2272,
-                2273,
-                2275,
-                2277,
-                2280,
-                2282,
-                2283,
-                2284,
-                2286,
-                2290,
-                2291,
-                2293,
-                2295,
-                2299,
-                2300,
-                2303,
-                2305,
-                2306,
-                2307,
-                2309,
-                2314,
-                2320,
-                2326,
-                2331,
-                2336,
-                2337,
-                2338,
-                2340,
-                2341,
-                2344,
-                2345,
-                2346,
-                2349,
-                2350,
-                2351,
-                2355,
-                2360,
-                2363,
-                2365,
-                2367,
-                2371,
-                2373,
-                2376,
-                2378,
-                2379,
-                2381,
-                2387,
-                2391,
-                2392,
-                2394,
-                2396,
-                2397,
-                2401,
-                2404,
-                2406,
-                2407,
-                2408,
-                2410,
-                2412,
-                2413,
-                2415,
-                2416,
-                2418,
-                2420,
-                2421,
-                2422,
-                2425,
-                2426,
-                2427,
-                2430,
-                2432,
-                2433,
-                2435,
-                2437,
-                2440,
-                2444,
-                2445,
-                2448,
-                2451,
-                2453,
-                2456,
-                2458,
-                2460,
-                2462,
-                2463,
-                2465,
-                2468,
-                2473,
-                2478,
-                2483,
-                2484,
-                2485,
-                2488,
-                2489,
-                2491,
-                2492,
-                2493,
-                2494,
-                2495,
-                2497,
-                2500,
-                2502,
-                2505,
-                2507,
-                2510,
-                2512,
-                2517,
-                2520,
-                2523,
-                2526,
-                2528,
-                2532,
-                2533,
-                2537,
-                2538,
-                2541,
-                2543,
-                2545,
-                2547,
-                2548,
-                2551,
-                2553,
-                2554,
-                2559,
-                2560,
-                2561,
-                2563,
-                2564,
-                2565,
-                2567,
-                2568,
-                2569,
-                2570,
-                2572,
-                2574,
-                2578,
-                2580,
-                2581,
-                2582,
-                2583,
-                2584,
-                2585,
-                2589,
-                2592,
-                2593,
-                2594,
-                2597,
-                2600,
-                2602,
-                2603,
-                2605,
-                2608,
-                2609,
-                2610,
-                2613,
-                2615,
-                2617,
-                2619,
-                2620,
-                2621,
-                2624,
-                2625,
-                2626,
-                2629,
-                2633,
-                2634,
-                2639,
-                2642,
-                2643,
-                2648,
-                2652,
-                2653,
-                2654,
-                2661,
-                2664,
-                2669,
-                2670,
-                2679,
-                2687,
-                2692,
-                2694,
-                2700,
-                2702,
-                2710,
-                2718,
-                2726,
-                2729,
-                2731,
-                2736,
-                2740,
-                2741,
-                2742,
-                2743,
-                2744,
-                2745,
-                2746,
-                2747,
-                2748,
-                2754,
-                2761,
-                2764,
-                2770,
-                2777,
-                2783,
-                2786,
-                2791,
-                2800,
-                2805,
-                2807,
-                2817,
-                2825,
-                2826,
-                2836,
-                2842,
-                2843,
-                2844,
-                2845,
-                2846,
-                2847,
-                2848,
-                2849,
-                2850,
-                2851,
-                2857,
-                2862,
-                2865,
-                2869,
-                2872,
-                2879,
-                2880,
-                2886,
-                2891,
-                2892,
-                2893,
-                2896,
-                2897,
-                2899,
-                2900,
-                2901,
-                2902,
-                2903,
-                2904,
-                2905,
-                2906,
-                2907,
-                2909,
-                2911,
-                2913,
-                2917,
-                2918,
-                2921,
-                2922,
-                2924,
-                2925,
-                2926,
-                2927,
-                2928,
-                2929,
-                2930,
-                2931,
-                2932,
-                2933,
-                2935,
-                2937,
-                2939,
-                2940,
-                2943,
-                2945,
-                2947,
-                2948,
-                2952,
-                2954,
-                2955,
-                2956,
-                2957,
-                2958,
-                2959,
-                2960,
-                2962,
-                2964,
-                2966,
-                2968,
-                2970,
-                2971,
-                2973,
-                2975,
-                2976,
-                2977,
-                2979,
-                2980,
-                2981,
-                2982,
-                2983,
-                2985,
-                2986,
-                2987,
-                2988,
-                2989,
-                2990,
-                2991,
-                2992,
-                2993,
-                2994,
-                2995,
-                2996,
-                2998,
-                2999,
-                3001,
-                3002,
-                3003,
-                3004,
-                3006,
-                3007,
-                3008,
-                3009,
-                3011,
-                3013,
-                3014,
-                3015,
-                3016,
-                3017,
-                3018,
-                3019,
-                3020,
-                3021,
-                3022,
-                3023,
-                3024,
-                3027,
-                3031,
-                3032,
-                3033,
-                3035,
-                3036,
-                3037,
-                3039,
-                3040,
-                3041,
-                3043,
-                3044,
-                3045,
-                3046,
-                3047,
-                3048,
-                3049,
-                3050,
-                3051,
-                3053,
-                3054,
-                3056,
-                3058,
-                3061,
-                3062,
-                3064,
-                3066,
-                3068,
-                3070,
-                3072,
-                3073,
-                3077,
-                3082,
-                3085,
-                3087,
-                3090,
-                3092,
-                3093,
-                3094,
-                3095,
-                3096,
-                3097,
-                3100,
-                3102,
-                3104,
-                3107,
-                3108,
-                3109,
-                3114,
-                3115,
-                3118,
-                3122,
-                3124,
-                3125,
-                3126,
-                3128,
-                3129,
-                3130,
-                3131,
-                3132,
-                3133,
-                3134,
-                3135,
-                3136,
-                3137,
-                3138,
-                3140,
-                3141,
-                3142,
-                3143,
-                3145,
-                3146,
-                3147,
-                3148,
-                3149,
-                3150,
-                3152,
-                3153,
-                3155,
-                3156,
-                3157,
-                3158,
-                3159,
-                3161,
-                3163,
-                3164,
-                3166,
-                3168,
-                3170,
-                3172,
-                3173,
-                3176,
-                3177,
-                3178,
-                3180,
-                3181,
-                3182,
-                3183,
-                3186,
-                3187,
-                3190,
-                3195,
-                3197,
-                3198,
-                3199,
-                3202,
-                3206,
-                3207,
-                3208,
-                3210,
-                3211,
-                3214,
-                3217,
-                3218,
-                3219,
-                3221,
-                3222,
-                3226,
-                3228,
-                3229,
-                3230,
-                3231,
-                3232,
-                3233,
-                3235,
-                3236,
-                3237,
-                3238,
-                3239,
-                3240,
-                3241,
-                3242,
-                3243,
-                3244,
-                3245,
-                3246,
-                3248,
-                3250,
-                3251,
-                3252,
-                3253,
-                3255,
-                3256,
-                3257,
-                3258,
-                3260,
-                3261,
-                3262,
-                3263,
-                3264,
-                3265,
-                3266,
-                3269,
-                3270,
-                3272,
-                3274,
-                3275,
-                3276,
-                3277,
-                3278,
-                3280,
-                3283,
-                3285,
-                3287,
-                3288,
-                3295,
-                3303,
-                3312,
-                3317,
-                3320,
-                3328,
-                3331,
-                3334,
-                3344,
-                3353,
-                3359,
-                3360,
-                3362,
-                3370,
-                3379,
-                3380,
-                3386,
-                3388,
-                3396,
-                3398,
-                3399,
-                3400,
-                3401,
-                3402,
-                3403,
-                3404,
-                3405,
-                3407,
-                3411,
-                3412,
-                3413,
-                3414,
-                3416,
-                3421,
-                3429,
-                3434,
-                3438,
-                3442,
-                3447,
-                3453,
-                3454,
-                3457,
-                3463,
-                3464,
-                3466,
-                3468,
-                3472,
-                3474,
-                3476,
-                3477,
-                3478,
-                3480,
-                3482,
-                3483,
-                3484,
-                3486,
-                3487,
-                3490,
-                3493,
-                3494,
-                3495,
-                3496,
-                3497,
-                3499,
-                3501,
-                3502,
-                3503,
-                3504,
-                3505,
-                3506,
-                3507,
-                3508,
-                3509,
-                3510,
-                3511,
-                3512,
-                3514,
-                3515,
-                3516,
-                3517,
-                3519,
-                3520,
-                3522,
-                3524,
-                3525,
-                3526,
-                3527,
-                3529,
-                3531,
-                3533,
-                3536,
-                3537,
-                3540,
-                3543,
-                3545,
-                3546,
-                3547,
-                3549,
-                3551,
-                3552,
-                3553,
-                3554,
-                3555,
-                3556,
-                3557,
-                3558,
-                3559,
-                3560,
-                3561,
-                3562,
-                3563,
-                3565,
-                3566,
-                3567,
-                3568,
-                3569,
-                3570,
-                3572,
-                3573,
-                3574,
-                3575,
-                3576,
-                3577,
-                3579,
-                3581,
-                3582,
-                3584,
-                3585,
-                3586,
-                3587,
-                3588,
-                3589,
-                3590,
-                3592,
-                3593,
-                3595,
-                3596,
-                3598,
-                3599,
-                3600,
-                3601,
-                3602,
-                3603,
-                3605,
-                3606,
-                3608,
-                3610,
-                3612,
-                3613,
-                3614,
-                3616,
-                3617,
-                3618,
-                3619,
-                3620,
-                3621,
-                3623,
-                3625,
-                3626,
-                3628,
-                3630,
-                3631,
-                3632,
-                3633,
-                3634,
-                3635,
-                3636,
-                3638,
-                3639,
-                3640,
-                3641,
-                3642,
-                3643,
-                3644,
-                3645,
-                3646,
-                3650,
-                3651,
-                3652,
-                3653,
-                3654,
-                3655,
-                3656,
-                3657,
-                3658,
-                3659,
-                3660,
-                3661,
-                3662,
-                3663,
-                3665,
-                3668,
-                3670,
-                3672,
-                3673,
-                3674,
-                3675,
-                3676,
-                3677,
-                3679,
-                3680,
-                3681,
-                3682,
-                3683,
-                3684,
-                3685,
-                3686,
-                3689,
-                3692,
-                3693,
-                3694,
-                3695,
-                3697,
-                3699,
-                3700,
-                3701,
-                3702,
-                3703,
-                3704,
-                3705,
-                3706,
-                3708,
-                3709,
-                3712,
-                3713,
-                3715,
-                3716,
-                3717,
-                3718,
-                3719,
-                3720,
-                3721,
-                3722,
-                3724,
-                3725,
-                3726,
-                3727,
-                3728,
-                3729,
-                3730,
-                3734,
-                3735,
-                3736,
-                3737,
-                3741,
-                3742,
-                3747,
-                3749,
-                3754,
-                3756,
-                3757,
-                3762,
-                3765,
-                3767,
-                3771,
-                3773,
-                3776,
-                3778,
-                3779,
-                3782,
-                3784,
-                3785,
-                3788,
-                3790,
-                3791,
-                3792,
-                3794,
-                3798,
-                3803,
-                3807,
-                3810,
-                3812,
-                3815,
-                3817,
-                3819,
-                3822,
-                3823,
-                3825,
-                3829,
-                3830,
-                3832,
-                3836,
-                3840,
-                3842,
-                3848,
-                3849,
-                3852,
-                3854,
-                3855,
-                3857,
-                3862,
-                3864,
-                3867,
-                3870,
-                3871,
-                3872,
-                3875,
-                3878,
-                3879,
-                3883,
-                3886,
-                3892,
-                3893,
-                3894,
-                3896,
-                3899,
-                3900,
-                3902,
-                3903,
-                3906,
-                3908,
-                3910,
-                3913,
-                3915,
-                3916,
-                3919,
-                3921,
-                3922,
-                3926,
-                3927,
-                3930,
-                3932,
-                3934,
-                3935,
-                3936,
-                3938,
-                3940,
-                3942,
-                3946,
-                3947,
-                3949,
-                3952,
-                3953,
-                3955,
-                3958,
-                3959,
-                3961,
-                3963,
-                3965,
-                3967,
-                3969,
-                3970,
-                3971,
-                3973,
-                3976,
-                3979,
-                3981,
-                3982,
-                3985,
-                3987,
-                3988,
-                3990,
-                3993,
-                3995,
-                3998,
-                4000,
-                4002,
-                4004,
-                4005,
-                4008,
-                4010,
-                4011,
-                4014,
-                4016,
-                4017,
-                4022,
-                4023,
-                4026,
-                4027,
-                4029,
-                4031,
-                4033,
-                4035,
-                4040,
-                4041,
-                4046,
-                4047,
-                4049,
-                4053,
-                4056,
-                4057,
-                4060,
-                4061,
-                4062,
-                4064,
-                4065,
-                4067,
-                4071,
-                4072,
-                4075,
-                4077,
-                4078,
-                4080,
-                4082,
-                4084,
-                4086,
-                4087,
-                4088,
-                4089,
-                4092,
-                4093,
-                4095,
-                4097,
-                4100,
-                4102,
-                4103,
-                4105,
-                4108,
-                4109,
-                4111,
-                4114,
-                4115,
-                4117,
-                4119,
-                4120,
-                4121,
-                4123,
-                4128,
-                4129,
-                4130,
-                4134,
-                4136,
-                4138,
-                4139,
-                4143,
-                4146,
-                4148,
-                4149,
-                4152,
-                4155,
-                4158,
-                4161,
-                4164,
-                4165,
-                4168,
-                4170,
-                4171,
-                4172,
-                4176,
-                4179,
-                4180,
-                4181,
-                4184,
-                4185,
-                4186,
-                4189,
-                4190,
-                4194,
-                4197,
-                4199,
-                4200,
-                4202,
-                4206,
-                4210,
-                4211,
-                4216,
-                4218,
-                4221,
-                4222,
-                4223,
-                4225,
-                4226,
-                4228,
-                4230,
-                4233,
-                4235,
-                4236,
-                4238,
-                4240,
-                4242,
-                4245,
-                4246,
-                4248,
-                4249,
-                4250,
-                4252,
-                4253,
-                4254,
-                4256,
-                4257,
-                4258,
-                4259,
-                4260,
-                4262,
-                4263,
-                4264,
-                4265,
-                4266,
-                4268,
-                4270,
-                4271,
-                4272,
-                4275,
-                4278,
-                4281,
-                4282,
-                4285,
-                4287,
-                4288,
-                4292,
-                4295,
-                4296,
-                4297,
-                4299,
-                4303,
-                4304,
-                4308,
-                4309,
-                4311,
-                4313,
-                4316,
-                4320,
-                4322,
-                4325,
-                4328,
-                4329,
-                4334,
-                4335,
-                4337,
-                4340,
-                4341,
-                4344,
-                4347,
-                4349,
-                4351,
-                4352,
-                4356,
-                4357,
-                4359,
-                4362,
-                4363,
-                4367,
-                4368,
-                4373,
-                4378,
-                4379,
-                4383,
-                4386,
-                4388,
-                4394,
-                4396,
-                4404,
-                4408,
-                4409,
-                4410,
-                4411,
-                4413,
-                4422,
-                4423,
-                4431,
-                4433,
-                4435,
-                4437,
-                4438,
-                4439,
-                4440,
-                4442,
-                4443,
-                4444,
-                4446,
-                4447,
-                4449,
-                4450,
-                4451,
-                4452,
-                4453,
-                4457,
-                4458,
-                4460,
-                4462,
-                4464,
-                4467,
-                4469,
-                4471,
-                4473,
-                4474,
-                4475,
-                4477,
-                4478,
-                4479,
-                4481,
-                4485,
-                4487,
-                4488,
-                4490,
-                4491,
-                4492,
-                4494,
-                4496,
-                4499,
-                4500,
-                4501,
-                4502,
-                4503,
-                4507,
-                4508,
-                4510,
-                4511,
-                4514,
-                4516,
-                4518,
-                4519,
-                4520,
-                4522,
-                4524,
-                4525,
-                4527,
-                4529,
-                4530,
-                4531,
-                4533,
-                4534,
-                4535,
-                4537,
-                4538,
-                4540,
-                4542,
-                4545,
-                4546,
-                4547,
-                4548,
-                4549,
-                4550,
-                4551,
-                4552,
-                4554,
-                4555,
-                4556,
-                4557,
-                4559,
-                4560,
-                4561,
-                4562,
-                4563,
-                4564,
-                4565,
-                4567,
-                4568,
-                4569,
-                4573,
-                4574,
-                4576,
-                4578,
-                4580,
-                4582,
-                4583,
-                4584,
-                4585,
-                4586,
-                4587,
-                4588,
-                4591,
-                4592,
-                4593,
-                4594,
-                4595,
-                4596,
-                4597,
-                4598,
-                4599,
-                4601,
-                4602,
-                4603,
-                4604,
-                4605,
-                4606,
-                4607,
-                4608,
-                4609,
-                4610,
-                4611,
-                4613,
-                4615,
-                4616,
-                4619,
-                4620,
-                4624,
-                4628,
-                4629,
-                4631,
-                4633,
-                4637,
-                4641,
-                4646,
-                4652,
-                4656,
-                4661,
-                4662,
-                4665,
-                4667,
-                4669,
-                4670,
-                4671,
-                4673,
-                4674,
-                4675,
-                4681,
-                4684,
-                4685,
-                4687,
-                4689,
-                4692,
-                4695,
-                4697,
-                4698,
-                4699,
-                4701,
-                4702,
-                4706,
-                4708,
-                4709,
-                4712,
-                4714,
-                4716,
-                4717,
-                4721,
-                4723,
-                4724,
-                4725,
-                4727,
-                4732,
-                4733,
-                4736,
-                4738,
-                4741,
-                4745,
-                4748,
-                4749,
-                4752,
-                4754,
-                4755,
-                4757,
-                4760,
-                4762,
-                4763,
-                4767,
-                4770,
-                4774,
-                4776,
-                4779,
-                4781,
-                4783,
-                4785,
-                4789,
-                4791,
-                4797,
-                4799,
-                4806,
-                4812,
-                4814,
-                4817,
-                4821,
-                4822,
-                4823,
-                4825,
-                4827,
-                4828,
-                4832,
-                4833,
-                4834,
-                4835,
-                4839,
-                4841,
-                4842,
-                4846,
-                4847,
-                4849,
-                4852,
-                4855,
-                4857,
-                4858,
-                4862,
-                4865,
-                4866,
-                4869,
-                4871,
-                4873,
-                4876,
-                4878,
-                4881,
-                4882,
-                4884,
-                4886,
-                4887,
-                4891,
-                4897,
-                4898,
-                4905,
-                4913,
-                4916,
-                4917,
-                4919,
-                4924,
-                4934,
-                4944,
-                4952,
-                4953,
-                4955,
-                4957,
-                4959,
-                4965,
-                4966,
-                4972,
-                4974,
-                4982,
-                4984,
-                4989,
-                4990,
-                4991,
-                4992,
-                4993,
-                4994,
-                4995,
-                4996,
-                4998,
-                4999,
-                5009,
-                5019,
-                5024,
-                5027,
-                5039,
-                5050,
-                5060,
-                5069,
-                5074,
-                5077,
-                5078,
-                5080,
-                5083,
-                5086,
-                5092,
-                5093,
-                5095,
-                5098,
-                5102,
-                5107,
-                5109,
-                5114,
-                5117,
-                5119,
-                5125,
-                5133,
-                5141,
-                5150,
-                5151,
-                5154,
-                5156,
-                5157,
-                5158,
-                5159,
-                5160,
-                5161,
-                5162,
-                5163,
-                5164,
-                5165,
-                5167,
-                5169,
-                5170,
-                5171,
-                5172,
-                5175,
-                5176,
-                5177,
-                5178,
-                5179,
-                5181,
-                5182,
-                5183,
-                5184,
-                5185,
-                5186,
-                5187,
-                5188,
-                5189,
-                5190,
-                5191,
-                5192,
-                5193,
-                5194,
-                5196,
-                5197,
-                5198,
-                5200,
-                5201,
-                5202,
-                5203,
-                5204,
-                5205,
-                5207,
-                5208,
-                5209,
-                5211,
-                5212,
-                5214,
-                5217,
-                5218,
-                5219,
-                5220,
-                5221,
-                5223,
-                5224,
-                5225,
-                5226,
-                5227,
-                5229,
-                5231,
-                5233,
-                5234,
-                5235,
-                5237,
-                5238,
-                5239,
-                5240,
-                5241,
-                5242,
-                5243,
-                5244,
-                5247,
-                5248,
-                5249,
-                5250,
-                5251,
-                5252,
-                5253,
-                5254,
-                5255,
-                5256,
-                5257,
-                5258,
-                5259,
-                5260,
-                5261,
-                5262,
-                5266,
-                5268,
-                5270,
-                5273,
-                5274,
-                5276,
-                5277,
-                5278,
-                5281,
-                5282,
-                5283,
-                5284,
-                5285,
-                5286,
-                5287,
-                5288,
-                5289,
-                5290,
-                5291,
-                5292,
-                5293,
-                5295,
-                5297,
-                5298,
-                5299,
-                5300,
-                5305,
-                5306,
-                5307,
-                5310,
-                5312,
-                5313,
-                5314,
-                5316,
-                5317,
-                5319,
-                5322,
-                5324,
-                5327,
-                5330,
-                5331,
-                5333,
-                5334,
-                5336,
-                5337,
-                5338,
-                5339,
-                5340,
-                5341,
-                5342,
-                5343,
-                5344,
-                5345,
-                5347,
-                5348,
-                5349,
-                5350,
-                5351,
-                5352,
-                5353,
-                5354,
-                5355,
-                5356,
-                5357,
-                5359,
-                5360,
-                5361,
-                5363,
-                5365,
-                5366,
-                5367,
-                5368,
-                5369,
-                5370,
-                5371,
-                5372,
-                5373,
-                5374,
-                5375,
-                5377,
-                5379,
-                5381,
-                5382,
-                5383,
-                5384,
-                5386,
-                5387,
-                5388,
-                5389,
-                5390,
-                5391,
-                5392,
-                5394,
-                5396,
-                5398,
-                5400,
-                5401,
-                5403,
-                5405,
-                5407,
-                5409,
-                5410,
-                5412,
-                5415,
-                5417,
-                5418,
-                5419,
-                5421,
-                5423,
-                5424,
-                5425,
-                5427,
-                5431,
-                5434,
-                5435,
-                5436,
-                5439,
-                5443,
-                5444,
-                5445,
-                5446,
-                5448,
-                5449,
-                5452,
-                5456,
-                5460,
-                5461,
-                5465,
-                5466,
-                5469,
-                5471,
-                5472,
-                5473,
-                5474,
-                5475,
-                5476,
-                5479,
-                5481,
-                5486,
-                5487,
-                5489,
-                5492,
-                5493,
-                5496,
-                5500,
-                5503,
-                5505,
-                5506,
-                5509,
-                5510,
-                5514,
-                5515,
-                5517,
-                5520,
-                5522,
-                5525,
-                5529,
-                5533,
-                5534,
-                5535,
-                5536,
-                5537,
-                5539,
-                5541,
-                5543,
-                5544,
-                5546,
-                5548,
-                5553,
-                5556,
-                5558,
-                5563,
-                5567,
-                5568,
-                5573,
-                5574,
-                5579,
-                5580,
-                5582,
-                5586,
-                5588,
-                5590,
-                5592,
-                5593,
-                5597,
-                5599,
-                5603,
-                5607,
-                5608,
-                5612,
-                5614,
-                5617,
-                5619,
-                5623,
-                5625,
-                5627,
-                5629,
-                5632,
-                5635,
-                5637,
-                5639,
-                5643,
-                5648,
-                5650,
-                5652,
-                5655,
-                5657,
-                5660,
-                5664,
-                5666,
-                5667,
-                5668,
-                5671,
-                5672,
-                5674,
-                5677,
-                5680,
-                5685,
-                5687,
-                5688,
-                5692,
-                5697,
-                5698,
-                5701,
-                5703,
-                5705,
-                5708,
-                5711,
-                5712,
-                5714,
-                5716,
-                5718,
-                5722,
-                5723,
-                5725,
-                5729,
-                5732,
-                5734,
-                5738,
-                5741,
-                5744,
-                5746,
-                5748,
-                5749,
-                5750,
-                5752,
-                5754,
-                5756,
-                5758,
-                5762,
-                5766,
-                5769,
-                5770,
-                5772,
-                5776,
-                5778,
-                5781,
-                5784,
-                5789,
-                5790,
-                5791,
-                5792,
-                5793,
-                5794,
-                5795,
-                5796,
-                5797,
-                5799,
-                5800,
-                5801,
-                5802,
-                5804,
-                5805,
-                5806,
-                5807,
-                5808,
-                5809,
-                5811,
-                5812,
-                5813,
-                5814,
-                5815,
-                5816,
-                5818,
-                5819,
-                5821,
-                5824,
-                5825,
-                5828,
-                5829,
-                5830,
-                5831,
-                5833,
-                5834,
-                5835,
-                5836,
-                5838,
-                5839,
-                5843,
-                5844,
-                5845,
-                5846,
-                5848,
-                5849,
-                5853,
-                5857,
-                5860,
-                5861,
-                5866,
-                5870,
-                5871,
-                5872,
-                5873,
-                5874,
-                5875,
-                5878,
-                5879,
-                5880,
-                5881,
-                5883,
-                5886,
-                5887,
-                5889,
-                5890,
-                5893,
-                5894,
-                5895,
-                5898,
-                5899,
-                5903,
-                5905,
-                5908,
-                5909,
-                5910,
-                5912,
-                5917,
-                5921,
-                5922,
-                5925,
-                5926,
-                5928,
-                5929,
-                5930,
-                5932,
-                5933,
-                5937,
-                5939,
-                5940,
-                5941,
-                5945,
-                5949,
-                5953,
-                5954,
-                5957,
-                5959,
-                5962,
-                5964,
-                5966,
-                5967,
-                5971,
-                5972,
-                5973,
-                5977,
-                5980,
-                5981,
-                5982,
-                5983,
-                5984,
-                5986,
-                5987,
-                5990,
-                5991,
-                5992,
-                5994,
-                5995,
-                5996,
-                5998,
-                5999,
-                6000,
-                6002,
-                6003,
-                6006,
-                6007,
-                6008,
-                6010,
-                6011,
-                6012,
-                6014,
-                6015,
-                6016,
-                6017,
-                6019,
-                6020,
-                6022,
-                6024,
-                6026,
-                6028,
-                6029,
-                6030,
-                6032,
-                6033,
-                6037,
-                6038,
-                6040,
-                6042,
-                6044,
-                6045,
-                6046,
-                6049,
-                6050,
-                6053,
-                6054,
-                6055,
-                6057,
-                6061,
-                6062,
-                6065,
-                6067,
-                6068,
-                6069,
-                6070,
-                6071,
-                6072,
-                6073,
-                6074,
-                6077,
-                6078,
-                6079,
-                6080,
-                6081,
-                6083,
-                6084,
-                6087,
-                6088,
-                6090,
-                6092,
-                6094,
-                6095,
-                6096,
-                6097,
-                6098,
-                6099,
-                6100,
-                6102,
-                6103,
-                6104,
-                6105,
-                6108,
-                6112,
-                6113,
-                6114,
-                6116,
-                6117,
-                6118,
-                6120,
-                6122,
-                6124,
-                6126,
-                6129,
-                6130,
-                6131,
-                6134,
-                6135,
-                6138,
-                6139,
-                6141,
-                6143,
-                6146,
-                6149,
-                6150,
-                6152,
-                6153,
-                6154,
-                6157,
-                6158,
-                6160,
-                6162,
-                6163,
-                6164,
-                6165,
-                6166,
-                6167,
-                6169,
-                6171,
-                6172,
-                6174,
-                6176,
-                6177,
-                6178,
-                6179,
-                6180,
-                6181,
-                6182,
-                6183,
-                6184,
-                6185,
-                6186,
-                6189,
-                6191,
-                6194,
-                6196,
-                6200,
-                6201,
-                6203,
-                6204,
-                6206,
-                6208,
-                6209,
-                6210,
-                6211,
-                6212,
-                6213,
-                6214,
-                6215,
-                6217,
-                6218,
-                6222,
-                6226,
-                6229,
-                6230,
-                6231,
-                6233,
-                6234,
-                6235,
-                6236,
-                6237,
-                6238,
-                6239,
-                6240,
-                6242,
-                6243,
-                6244,
-                6246,
-                6248,
-                6250,
-                6253,
-                6254,
-                6256,
-                6258,
-                6259,
-                6260,
-                6262,
-                6265,
-                6266,
-                6267,
-                6269,
-                6270,
-                6272,
-                6274,
-                6275,
-                6277,
-                6280,
-                6283,
-                6284,
-                6287,
-                6289,
-                6292,
-                6294,
-                6296,
-                6302,
-                6307,
-                6310,
-                6312,
-                6314,
-                6316,
-                6317,
-                6322,
-                6326,
-                6328,
-                6330,
-                6332,
-                6333,
-                6334,
-                6338,
-                6340,
-                6342,
-                6344,
-                6346,
-                6347,
-                6349,
-                6350,
-                6354,
-                6356,
-                6357,
-                6358,
-                6359,
-                6362,
-                6363,
-                6365,
-                6366,
-                6370,
-                6374,
-                6375,
-                6378,
-                6380,
-                6381,
-                6382,
-                6383,
-                6387,
-                6389,
-                6391,
-                6394,
-                6398,
-                6402,
-                6407,
-                6408,
-                6409,
-                6410,
-                6411,
-                6412,
-                6414,
-                6415,
-                6417,
-                6418,
-                6419,
-                6423,
-                6424,
-                6425,
-                6426,
-                6427,
-                6428,
-                6431,
-                6432,
-                6433,
-                6434,
-                6436,
-                6441,
-                6445,
-                6446,
-                6447,
-                6449,
-                6450,
-                6451,
-                6453,
-                6454,
-                6455,
-                6456,
-                6457,
-                6458,
-                6459,
-                6461,
-                6462,
-                6464,
-                6468,
-                6469,
-                6471,
-                6472,
-                6473,
-                6476,
-                6477,
-                6479,
-                6481,
-                6483,
-                6486,
-                6488,
-                6491,
-                6492,
-                6496,
-                6497,
-                6499,
-                6500,
-                6501,
-                6505,
-                6506,
-                6508,
-                6510,
-                6511,
-                6512,
-                6514,
-                6516,
-                6517,
-                6520,
-                6521,
-                6527,
-                6530,
-                6532,
-                6535,
-                6539,
-                6543,
-                6545,
-                6547,
-                6550,
-                6552,
-                6554,
-                6555,
-                6557,
-                6564,
-                6567,
-                6569,
-                6570,
-                6571,
-                6579,
-                6582,
-                6584,
-                6587,
-                6588,
-                6590,
-                6591,
-                6592,
-                6593,
-                6594,
-                6595,
-                6597,
-                6599,
-                6602,
-                6606,
-                6612,
-                6614,
-                6616,
-                6617,
-                6619,
-                6624,
-                6625,
-                6626,
-                6628,
-                6630,
-                6631,
-                6633,
-                6636,
-                6639,
-                6640,
-                6642,
-                6645,
-                6648,
-                6650,
-                6651,
-                6653,
-                6655,
-                6657,
-                6660,
-                6662,
-                6664,
-                6665,
-                6667,
-                6670,
-                6671,
-                6674,
-                6676,
-                6678,
-                6681,
-                6683,
-                6684,
-                6688,
-                6690,
-                6691,
-                6694,
-                6695,
-                6696,
-                6697,
-                6698,
-                6699,
-                6700,
-                6702,
-                6703,
-                6706,
-                6709,
-                6711,
-                6712,
-                6713,
-                6715,
-                6716,
-                6717,
-                6719,
-                6721,
-                6724,
-                6728,
-                6730,
-                6731,
-                6733,
-                6734,
-                6736,
-                6737,
-                6738,
-                6740,
-                6742,
-                6743,
-                6745,
-                6746,
-                6748,
-                6750,
-                6753,
-                6757,
-                6758,
-                6759,
-                6762,
-                6767,
-                6771,
-                6772,
-                6773,
-                6775,
-                6779,
-                6782,
-                6784,
-                6785,
-                6789,
-                6790,
-                6793,
-                6795,
-                6796,
-                6801,
-                6802,
-                6805,
-                6808,
-                6809,
-                6812,
-                6813,
-                6814,
-                6820,
-                6822,
-                6824,
-                6829,
-                6836,
-                6843,
-                6852,
-                6855,
-                6858,
-                6859,
-                6860,
-                6865,
-                6870,
-                6873,
-                6874,
-                6877,
-                6881,
-                6883,
-                6892,
-                6899,
-                6902,
-                6909,
-                6917,
-                6919,
-                6922,
-                6923,
-            ],
-            "series_type": "distance",
-            "original_size": 3225,
-            "resolution": "high",
-        },
-    }
+    test_data = json.loads(ACTIVITY_STREAM_PATH.read_text())
     activity_stream = StravaActivityStream(**test_data)
 
     # Act
@@ -9710,3 +23,94 @@ def test_get_max_heartrate_time_mark():
 
     # Assert
     assert result == timedelta(seconds=4265)
+
+
+def test_stream_data_is_array():
+    # Arrange
+    # Act
+    activity_stream = StravaActivityStream(
+        heartrate={"data": [120, 150.5, 150.5]}, time={"data": [0, 1, 3]}
+    )
+    # Assert
+    assert activity_stream.heartrate.data == array("d", [120, 150.5, 150.5])
+    assert activity_stream.get_max_heartrate() == (1, 150.5)
+    assert activity_stream.get_max_heartrate_time_mark() == timedelta(seconds=1)
+    assert json.loads(activity_stream.json()) == {
+        "heartrate": {"data": [120.0, 150.5, 150.5]},
+        "time": {"data": [0.0, 1.0, 3.0]},
+    }
+
+
+def test_stream_data_rejects_non_numbers():
+    # Arrange
+    # Act
+    # Assert
+    with pytest.raises(ValidationError):
+        StravaActivityStream(heartrate={"data": ["high"]}, time={"data": [0]})
+
+
+def test_get_max_heartrate_empty():
+    # Arrange
+    activity_stream = StravaActivityStream(heartrate={"data": []}, time={"data": []})
+    # Act
+    # Assert
+    assert activity_stream.get_max_heartrate() is None
+    assert activity_stream.get_max_heartrate_time_mark() is None
+
+
+def test_get_peak_heartrate_window():
+    # Arrange
+    activity_stream = StravaActivityStream(
+        heartrate={"data": [100, 190, 100, 150, 150, 150, 100]},
+        time={"data": [0, 10, 11, 20, 30, 40, 50]},
+    )
+    # Act
+    result = activity_stream.get_peak_heartrate_window(timedelta(seconds=30))
+    # Assert
+    assert result is not None
+    assert result.start == timedelta(seconds=20)
+    assert result.end == timedelta(seconds=50)
+    assert result.average_heartrate == 150
+    assert result.time_mark == timedelta(seconds=35)
+
+
+def test_get_peak_heartrate_window_irregular_sampling():
+    # Arrange
+    # 190 is held for 1 second, 120 for the 9 seconds after it
+    activity_stream = StravaActivityStream(
+        heartrate={"data": [100, 190, 120, 110]},
+        time={"data": [0, 5, 6, 15]},
+    )
+    # Act
+    result = activity_stream.get_peak_heartrate_window(timedelta(seconds=10))
+    # Assert
+    assert result is not None
+    assert result.start == timedelta(seconds=5)
+    assert result.end == timedelta(seconds=15)
+    assert result.average_heartrate == pytest.approx((190 + 120 * 9) / 10)
+
+
+def test_get_peak_heartrate_window_shorter_activity():
+    # Arrange
+    activity_stream = StravaActivityStream(
+        heartrate={"data": [100, 190]}, time={"data": [0, 10]}
+    )
+    # Act
+    result = activity_stream.get_peak_heartrate_window(timedelta(seconds=30))
+    # Assert
+    assert result is None
+
+
+def test_get_peak_heartrate_window_starting_on_sample():
+    # Arrange
+    # the peak window starts on the first sample and ends between samples
+    activity_stream = StravaActivityStream(
+        heartrate={"data": [200, 100, 100]}, time={"data": [0, 10, 40]}
+    )
+    # Act
+    result = activity_stream.get_peak_heartrate_window(timedelta(seconds=30))
+    # Assert
+    assert result is not None
+    assert result.start == timedelta(seconds=0)
+    assert result.end == timedelta(seconds=30)
+    assert result.average_heartrate == pytest.approx((200 * 10 + 100 * 20) / 30)
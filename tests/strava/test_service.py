@@ -1,10 +1,12 @@
-from datetime import datetime
+import asyncio
+from datetime import datetime, timedelta
 
 import pytest
 
+from app import settings
 from app.spotify.schemas import SpotifyTrack
-from app.strava.schemas import StravaActivity
-from app.strava.service import StravaService
+from app.strava.schemas import StravaActivity, StravaActivityStream
+from app.strava.service import AsyncStravaService
 
 
 @pytest.mark.parametrize(
@@ -12,8 +14,8 @@ from app.strava.service import StravaService
 )
 def test_update_activity_with_track(description, mocker):
     # Arrange
-    api = mocker.MagicMock()
-    service = StravaService(api=api)
+    api = mocker.AsyncMock()
+    service = AsyncStravaService(api=api)
     activity = StravaActivity(
         id=1,
         description=description,
@@ -26,21 +28,42 @@ def test_update_activity_with_track(description, mocker):
         href="https://open.spotify.com/track/123",
     )
     # Act
-    service.update_activity_with_track(activity=activity, track=track)
+    asyncio.run(service.update_activity_with_track(activity=activity, track=track))
     # Assert
     if description is None or description == "":
-        api.update_activity.assert_called_once_with(
+        api.update_activity.assert_awaited_once_with(
             id=1,
             data={
                 "description": "Theme Song: Test Track - https://open.spotify.com/track/123"
             },
         )
     elif "Theme Song:" in description:
-        api.update_activity.assert_not_called()
+        api.update_activity.assert_not_awaited()
     else:
-        api.update_activity.assert_called_once_with(
+        api.update_activity.assert_awaited_once_with(
             id=1,
             data={
                 "description": "Test Description \nTheme Song: Test Track - https://open.spotify.com/track/123"
             },
         )
+
+
+@pytest.mark.parametrize(
+    "window_seconds, expected",
+    [
+        (0, timedelta(seconds=10)),
+        (20, timedelta(seconds=40)),
+        (100, timedelta(seconds=10)),
+    ],
+)
+def test_get_peak_time_mark(window_seconds, expected, mocker):
+    # Arrange
+    mocker.patch.object(settings.ENV_VARS, "STRAVA_PEAK_WINDOW_SECONDS", window_seconds)
+    activity_stream = StravaActivityStream(
+        heartrate={"data": [100, 190, 100, 160, 160, 160]},
+        time={"data": [0, 10, 11, 30, 40, 50]},
+    )
+    # Act
+    result = AsyncStravaService.get_peak_time_mark(activity_stream)
+    # Assert
+    assert result == expected
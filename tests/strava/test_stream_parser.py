@@ -0,0 +1,111 @@
+import json
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+from app.strava.schemas import StravaActivityStream, StravaStreamKeys
+from app.strava.stream_parser import (
+    MaxHeartrateTracker,
+    StravaStreamParser,
+    StreamOrderError,
+)
+
+ACTIVITY_STREAM = json.loads(
+    (Path(__file__).parent.parent / "test_data" / "activity_stream.json").read_text()
+)
+STREAM_KEYS = [StravaStreamKeys.TIME, StravaStreamKeys.HEARTRATE]
+
+
+def parse(body: bytes, chunk_size: int) -> list[tuple[str, float]]:
+    parser = StravaStreamParser(STREAM_KEYS)
+    batches = []
+    for start in range(0, len(body), chunk_size):
+        end = start + chunk_size
+        batches.extend(parser.feed(body[start:end]))
+    batches.extend(parser.close())
+    return [(key, value) for key, values in batches for value in values]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_parse_in_chunks(chunk_size):
+    # Arrange
+    body = b'{"heartrate": {"data": [120, 150.5], "series_type": "time"}, "time": {"data": [0, 1e1]}}'
+    # Act
+    samples = parse(body, chunk_size)
+    # Assert
+    assert samples == [
+        ("heartrate", 120.0),
+        ("heartrate", 150.5),
+        ("time", 0.0),
+        ("time", 10.0),
+    ]
+
+
+def test_parse_skips_other_values():
+    # Arrange
+    body = json.dumps(
+        {
+            "distance": {"data": [1, 2, 3]},
+            "time": {
+                "name": 'a "data" [string], {}',
+                "nested": {"data": [9]},
+                "data": [],
+                "original_size": 0,
+                "flag": None,
+            },
+            "heartrate": {"resolution": "high", "data": [100]},
+        },
+        indent=2,
+    ).encode()
+    # Act
+    samples = parse(body, 3)
+    # Assert
+    assert samples == [("heartrate", 100.0)]
+
+
+def test_parse_truncated_body():
+    # Arrange
+    parser = StravaStreamParser(STREAM_KEYS)
+    parser.feed(b'{"time": {"data": [1, 2')
+    # Act
+    # Assert
+    with pytest.raises(ValueError):
+        parser.close()
+
+
+@pytest.mark.parametrize(
+    "keys", [("distance", "heartrate", "time"), ("heartrate", "distance", "time")]
+)
+def test_max_heartrate_matches_buffered(keys):
+    # Arrange
+    body = json.dumps({key: ACTIVITY_STREAM[key] for key in keys}).encode()
+    parser = StravaStreamParser(STREAM_KEYS)
+    tracker = MaxHeartrateTracker()
+    # Act
+    for start in range(0, len(body), 1024):
+        end = start + 1024
+        for key, values in parser.feed(body[start:end]):
+            tracker.add(key, values)
+    for key, values in parser.close():
+        tracker.add(key, values)
+    # Assert
+    expected = StravaActivityStream(**ACTIVITY_STREAM).get_max_heartrate_time_mark()
+    assert tracker.get_max_heartrate_time_mark() == expected == timedelta(seconds=4265)
+
+
+def test_max_heartrate_without_samples():
+    # Arrange
+    tracker = MaxHeartrateTracker()
+    # Act
+    tracker.add("heartrate", [])
+    # Assert
+    assert tracker.get_max_heartrate_time_mark() is None
+
+
+def test_max_heartrate_time_first():
+    # Arrange
+    tracker = MaxHeartrateTracker()
+    # Act / Assert
+    with pytest.raises(StreamOrderError):
+        tracker.add("time", [0.0, 1.0])
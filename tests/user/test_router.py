@@ -0,0 +1,75 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+
+from app.auth.utils import get_current_user_id
+from app.main import app
+from app.strava.models import StravaUserInfo
+from app.user.models import User
+
+
+@pytest.fixture(name="authenticated")
+def fixture_authenticated():
+    app.dependency_overrides[get_current_user_id] = lambda: 1
+    yield
+    del app.dependency_overrides[get_current_user_id]
+
+
+@pytest.fixture(name="users")
+def fixture_users(local_session):
+    for id in range(1, 6):
+        local_session.add(User(id=id))
+        local_session.add(
+            StravaUserInfo(
+                id=id,
+                user_id=id,
+                access_token="abc",
+                refresh_token="abc",
+                expires_at=datetime(2023, 7, 9).isoformat(),
+            )
+        )
+    local_session.commit()
+
+
+def test_get_all_pages(test_client, authenticated, users):
+    # Act
+    pages = []
+    response = test_client.get("/users/?limit=2")
+    pages.append(response.json())
+    while pages[-1]["next_cursor"]:
+        response = test_client.get(f"/users/?limit=2&cursor={pages[-1]['next_cursor']}")
+        pages.append(response.json())
+    # Assert
+    assert [[user["id"] for user in page["items"]] for page in pages] == [
+        [1, 2],
+        [3, 4],
+        [5],
+    ]
+    assert pages[0]["items"][0]["strava_user_info"]["user_id"] == 1
+
+
+def test_get_all_loads_relations_in_one_query(
+    test_client, authenticated, users, local_session
+):
+    # Arrange
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(local_session.get_bind(), "before_cursor_execute", record)
+    # Act
+    response = test_client.get("/users/?limit=5")
+    event.remove(local_session.get_bind(), "before_cursor_execute", record)
+    # Assert
+    assert response.status_code == 200
+    assert len(response.json()["items"]) == 5
+    assert len(statements) == 2
+
+
+def test_get_all_invalid_cursor(test_client, authenticated):
+    # Act
+    response = test_client.get("/users/?cursor=not-a-cursor")
+    # Assert
+    assert response.status_code == 400
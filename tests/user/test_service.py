@@ -0,0 +1,57 @@
+from datetime import datetime
+
+from sqlalchemy import event
+
+from app.database.service import DatabaseService
+from app.spotify.models import SpotifyUserInfo
+from app.strava.models import StravaUserInfo
+from app.user.models import User
+from app.user.service import UserService
+
+
+def test_get_with_credentials(local_session):
+    # Arrange
+    expires_at = datetime(2023, 7, 9).isoformat()
+    local_session.add(User(id=1))
+    local_session.add(
+        StravaUserInfo(
+            id=1,
+            user_id=1,
+            access_token="strava",
+            refresh_token="strava",
+            expires_at=expires_at,
+        )
+    )
+    local_session.add(
+        SpotifyUserInfo(
+            id="abc",
+            user_id=1,
+            access_token="spotify",
+            refresh_token="spotify",
+            expires_at=expires_at,
+        )
+    )
+    local_session.commit()
+    local_session.expunge_all()
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(local_session.get_bind(), "before_cursor_execute", record)
+    # Act
+    user = UserService(DatabaseService(local_session)).get_with_credentials(1)
+    strava_access_token = user.strava_user_info.access_token
+    spotify_access_token = user.spotify_user_info.access_token
+    event.remove(local_session.get_bind(), "before_cursor_execute", record)
+    # Assert
+    assert strava_access_token == "strava"
+    assert spotify_access_token == "spotify"
+    assert len(statements) == 1
+
+
+def test_get_with_credentials_none(local_session):
+    # Act
+    user = UserService(DatabaseService(local_session)).get_with_credentials(1)
+    # Assert
+    assert user is None